@@ -1,18 +1,29 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-from app.services.clinical_trials import search_clinical_trials
+from app.core.retry import DeadlineExceededError
+from app.services.clinical_trials import (
+    ClinicalTrialsService,
+    StudyView,
+    get_clinical_trials_service,
+)
 
 router = APIRouter()
 
-@router.get("/studies")
-def get_studies(
+# The JSON body is either the parsed page or the upstream bytes, so it has no single model
+@router.get("/studies", response_model=None)
+async def get_studies(
     condition: str = Query(..., description="Condition to search for"),
     page_size: int = Query(10, description="Number of results per page", ge=1, le=100),
     is_recruiting: bool = Query(True, description="Filter to only recruiting studies"),
     page_token: str = Query(None, description="Token for pagination"),
-) -> Dict[str, Any]:
+    view: StudyView = Query(StudyView.FULL, description="Projection profile: card, matching or full"),
+    raw: bool = Query(False, description="Stream the upstream JSON without re-parsing it"),
+    service: ClinicalTrialsService = Depends(get_clinical_trials_service),
+) -> Union[Dict[str, Any], StreamingResponse]:
     """
     Search for clinical trials by condition.
     
@@ -21,6 +32,10 @@ def get_studies(
         page_size: Number of results per page (1-100)
         is_recruiting: Filter to only recruiting studies (RECRUITING, ENROLLING_BY_INVITATION)
         page_token: Token for pagination
+        view: Which study fields to return (card: listing columns, matching: eligibility
+            and locations, full: complete study records)
+        raw: If True, stream ClinicalTrials.gov's JSON body straight through instead of
+            building and re-serializing the PagedStudies model
         
     Returns:
         Dictionary containing the search results with structure:
@@ -30,21 +45,42 @@ def get_studies(
             "next_page_token": str or None,
             "metadata": {...}
         }
+        or, with raw, a StreamingResponse of the upstream body
         
     Raises:
-        HTTPException: If the API call fails
+        HTTPException: 504 if the search's deadline runs out, 500 if the API call fails
     """
     try:
-        # Use the clinical trials service
-        result = search_clinical_trials(
+        if raw:
+            upstream = await service.stream_clinical_trials(
+                condition=condition,
+                page_size=page_size,
+                is_recruiting=is_recruiting,
+                page_token=page_token,
+                view=view,
+            )
+            return StreamingResponse(
+                upstream.aiter_bytes(),
+                media_type="application/json",
+                background=BackgroundTask(upstream.aclose),
+            )
+        
+        # Use the app-scoped clinical trials service (shared connection pool)
+        result = await service.search_clinical_trials(
             condition=condition,
             page_size=page_size,
             is_recruiting=is_recruiting,
-            page_token=page_token
+            page_token=page_token,
+            view=view,
         )
         
         return result
             
+    except DeadlineExceededError as e:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Clinical trials API timed out: {str(e)}"
+        )
     except RuntimeError as e:
         raise HTTPException(
             status_code=500,
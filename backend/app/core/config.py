@@ -9,10 +9,97 @@ class Settings(BaseSettings):
     # API Keys
     gemini_key: Optional[str] = None
     
+    # Gemini client settings
+    gemini_max_concurrency: int = 16  # Concurrent Gemini calls per worker
+    gemini_pool_maxsize: int = 20  # Kept-alive connections to the Gemini API
+    gemini_retry_attempts: int = 3  # Attempts per call for empty answers, timeouts, 408/429/5xx
+    gemini_retry_backoff_base: float = 0.5  # Exponential backoff with full jitter between attempts
+    gemini_retry_backoff_max: float = 4.0
+    gemini_deadline: float = 50.0  # Seconds per call across attempts; below the frontend's 60 s timeout
+    gemini_context_cache: str = "gemini"  # Static prompt prefixes: "gemini" (provider cache), "local" (stub backends only) or "off"
+    gemini_context_cache_ttl: int = 3600
+    gemini_context_cache_min_tokens: int = 1024  # Gemini's minimum cacheable size; shorter prefixes go inline
+    gemini_base_url: Optional[str] = None  # API host override, e.g. the stub server of app.services.llm_stub
+    
+    # Model backend behind the Gemini service: "gemini", or "stub" to replay recorded responses offline
+    llm_backend: str = "gemini"
+    llm_record_path: Optional[str] = None  # JSONL file every response (text, latency, error) is appended to
+    llm_stub_recordings_path: Optional[str] = None  # Recordings the stub replays in order; a canned answer if unset
+    llm_stub_latency: str = "lognormal"  # "fixed", "lognormal" or "recorded"
+    llm_stub_latency_median: float = 1.5  # Seconds
+    llm_stub_latency_sigma: float = 0.5  # Shape of the lognormal distribution
+    llm_stub_empty_rate: float = 0.0  # Share of calls answered with an empty text
+    llm_stub_error_rate: float = 0.0  # Share of calls failing with llm_stub_error_status
+    llm_stub_error_status: int = 503
+    llm_stub_seed: Optional[int] = None
+    
+    # Transcript extraction cache, keyed by transcript content and prompt/schema version
+    extraction_cache_enabled: bool = True
+    extraction_cache_ttl: int = 7 * 24 * 3600  # Seconds an extraction is reused
+    extraction_cache_memory_mb: int = 16
+    extraction_cache_path: Optional[str] = None  # SQLite file of the on-disk tier; memory only if unset
+    extraction_cache_disk_mb: int = 256
+    
+    # Long transcripts are split into overlapping chunks extracted concurrently and merged
+    extraction_chunk_tokens: int = 6000  # Estimated tokens per chunk; shorter transcripts are sent whole
+    extraction_chunk_overlap_tokens: int = 300  # Speaker turns repeated at the start of the next chunk
+    
+    # Local dictionary-based extraction tried before Gemini; below the threshold Gemini is asked.
+    # Off until its confidence has been checked against real transcripts
+    extraction_fast_path_enabled: bool = False
+    extraction_fast_path_threshold: float = 0.8  # Confidence in [0, 1] a local extraction needs to be returned
+    
+    # Batch transcript extraction
+    extraction_batch_concurrency: int = 8  # Transcripts of one batch extracted at a time
+    extraction_batch_item_timeout: float = 120.0  # Seconds per transcript before it is reported as failed
+    extraction_batch_max_items: int = 10000
+    
+    # Seconds a request may take until its response starts, unless the X-Request-Timeout header
+    # says otherwise; its work is cancelled then, or when the client disconnects. None for no limit
+    request_deadline: Optional[float] = 60.0
+    
     # Application settings
     app_name: str = "StudyBridge API"
     debug: bool = False
     
+    # ClinicalTrials.gov client settings
+    clinical_trials_base_url: str = "https://clinicaltrials.gov/api/v2"
+    clinical_trials_pool_maxsize: int = 20  # Kept-alive connections to the upstream host
+    clinical_trials_pool_block: bool = False  # Wait for a free connection instead of opening extra ones
+    clinical_trials_connect_timeout: float = 5.0
+    clinical_trials_read_timeout: float = 30.0
+    clinical_trials_rate_limit: Optional[float] = None  # Requests per second; None disables the limiter
+    clinical_trials_rate_limit_burst: Optional[float] = None  # Defaults to one second worth of requests
+    clinical_trials_rate_limit_file: Optional[str] = None  # SQLite file sharing the limit across workers
+    clinical_trials_throttle_retries: int = 3  # Retries of 429/503 answers (Retry-After or backoff with jitter)
+    clinical_trials_retry_attempts: int = 2  # Attempts per search for timeouts, connection errors, 500/502/504
+    clinical_trials_retry_backoff_base: float = 0.2
+    clinical_trials_retry_backoff_max: float = 2.0
+    clinical_trials_deadline: float = 30.0  # Seconds per search across attempts
+    
+    # Hedged requests: a second identical request is sent when the first is slower than the
+    # given quantile of recent latencies (clamped to min/max; default until enough samples)
+    clinical_trials_hedge_enabled: bool = True
+    clinical_trials_hedge_quantile: float = 0.95
+    clinical_trials_hedge_default_delay: float = 1.0
+    clinical_trials_hedge_min_delay: float = 0.05
+    clinical_trials_hedge_max_delay: float = 5.0
+    
+    # Circuit breaker: fail fast (or serve cached pages) after consecutive upstream failures
+    clinical_trials_breaker_failure_threshold: int = 5
+    clinical_trials_breaker_reset_timeout: float = 30.0  # Seconds before a trial request is let through
+    
+    # ClinicalTrials.gov response cache
+    clinical_trials_cache_enabled: bool = True
+    clinical_trials_cache_ttl: dict[str, int] = {"card": 600, "matching": 1800, "full": 3600}  # Seconds fresh, per view
+    clinical_trials_cache_stale_while_revalidate: int = 3600  # Seconds a stale page is served while refreshed
+    clinical_trials_cache_memory_mb: int = 64
+    clinical_trials_cache_path: Optional[str] = None  # SQLite file of the on-disk tier; memory only if unset
+    clinical_trials_cache_disk_mb: int = 512
+    
+    # JSON codec for upstream responses and API output: "auto" (orjson if installed), "orjson" or "json"
+    json_codec: str = "auto"
+    
     # CORS settings
     allowed_hosts: list[str] = ["*"]  # In production, specify actual domains
     
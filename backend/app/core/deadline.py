@@ -0,0 +1,185 @@
+"""
+Per-request deadlines, and cancellation of a request's work when it passes or the client disconnects
+"""
+import asyncio
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds the client is willing to wait, e.g. its own read timeout
+DEADLINE_HEADER = "x-request-timeout"
+
+
+class Deadline:
+    """Event loop time (`loop.time()`) by which a request must have started its response.
+
+    Shared by every task the request spawns, so clearing it when a
+    streamed response starts lifts it for all of them.
+    """
+
+    __slots__ = ("at",)
+
+    def __init__(self, at: Optional[float]):
+        self.at = at
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    """Deadline of the request being served, None outside requests or without one"""
+    deadline = _current.get()
+    return None if deadline is None else deadline.at
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[None]:
+    """Run the enclosed code under a deadline `timeout` seconds from now, as a request would be"""
+    at = None if timeout is None else asyncio.get_running_loop().time() + timeout
+    token = _current.set(Deadline(at))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class RequestCancellations:
+    """Counters of requests whose work was cancelled, by reason"""
+
+    def __init__(self):
+        self.requests = 0
+        self.deadline_exceeded = 0
+        self.disconnected = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "deadline_exceeded": self.deadline_exceeded,
+            "disconnected": self.disconnected,
+        }
+
+
+class DeadlineMiddleware:
+    """Gives each HTTP request a deadline and cancels its work when it is no longer wanted.
+
+    The deadline is the X-Request-Timeout header (seconds) or
+    `default_timeout`. It bounds the time until the response starts:
+    a request still running then is cancelled and answered with 504. A
+    streamed response, once started, runs until it ends or the client
+    goes away (batch items have their own timeouts). Whenever the client
+    disconnects, the request's work is cancelled.
+
+    Services read the deadline with `current_deadline()`; retries do not
+    start attempts they could not finish in time.
+    """
+
+    def __init__(self, app: Any, default_timeout: Optional[float], counters: RequestCancellations):
+        self.app = app
+        self.default_timeout = default_timeout
+        self.counters = counters
+
+    def _timeout(self, scope: Dict[str, Any]) -> Optional[float]:
+        for name, value in scope.get("headers", []):
+            if name.decode("latin-1").lower() == DEADLINE_HEADER:
+                try:
+                    timeout = float(value)
+                except ValueError:
+                    break
+                if timeout > 0:
+                    return timeout
+        return self.default_timeout
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        timeout = self._timeout(scope)
+        deadline = Deadline(None if timeout is None else loop.time() + timeout)
+        self.counters.requests += 1
+
+        # Only the watcher reads from the server, so a disconnect is noticed
+        # whether or not the app is reading; the app gets the body from a queue
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+        response_started = False
+        response_complete = False
+
+        async def watch():
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+
+        async def app_receive():
+            return await messages.get()
+
+        async def app_send(message):
+            nonlocal response_started, response_complete
+            if message["type"] == "http.response.start":
+                response_started = True
+                deadline.at = None
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Servers report a disconnect once the response is complete
+                response_complete = True
+            await send(message)
+
+        token = _current.set(deadline)
+        try:
+            app_task = asyncio.ensure_future(self.app(scope, app_receive, app_send))
+        finally:
+            _current.reset(token)
+        watcher = asyncio.ensure_future(watch())
+        disconnect = asyncio.ensure_future(disconnected.wait())
+        try:
+            while not app_task.done():
+                if response_complete:
+                    # e.g. background tasks run after the response
+                    await asyncio.wait([app_task])
+                    break
+                remaining = None if deadline.at is None else max(deadline.at - loop.time(), 0)
+                await asyncio.wait([app_task, disconnect], timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if app_task.done() or response_complete:
+                    continue
+                if disconnected.is_set():
+                    self.counters.disconnected += 1
+                    logger.info(f"Client disconnected, cancelling {scope['method']} {scope['path']}")
+                    await self._cancel(app_task)
+                    return
+                if deadline.at is not None and loop.time() >= deadline.at:
+                    self.counters.deadline_exceeded += 1
+                    logger.warning(f"Deadline of {timeout:g} s exceeded, cancelling {scope['method']} {scope['path']}")
+                    await self._cancel(app_task)
+                    if not response_started:
+                        await self._send_timeout(send, timeout)
+                    return
+            app_task.result()
+        finally:
+            if not app_task.done():
+                app_task.cancel()
+            watcher.cancel()
+            disconnect.cancel()
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task) -> None:
+        task.cancel()
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _send_timeout(send: Any, timeout: float) -> None:
+        body = json.dumps({"detail": f"Request deadline of {timeout:g} seconds exceeded"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 504,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,67 @@
+"""
+Incremental parsing of a streamed JSON object, member by member
+"""
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalObjectParser:
+    """Parses a JSON object arriving in arbitrary text chunks and returns
+    each top-level member as soon as its value is complete.
+
+    Text before the opening brace (e.g. a ```json fence) is skipped, as is
+    anything after the closing one. Only the top level is tracked: a member
+    whose value is an array or object is returned once the whole value has
+    arrived.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = -1
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Add text; returns the (key, value) members completed by it"""
+        members: List[Tuple[str, Any]] = []
+        if self.done:
+            return members
+        self._buffer += chunk
+        buffer = self._buffer
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    if char != "{":
+                        raise ValueError("Expected a JSON object")
+                    self._member_start = pos + 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end_member(pos, members)
+                    self.done = True
+                    break
+            elif char == "," and self._depth == 1:
+                self._end_member(pos, members)
+                self._member_start = pos + 1
+        self._pos = len(buffer)
+        return members
+
+    def _end_member(self, end: int, members: List[Tuple[str, Any]]) -> None:
+        text = self._buffer[self._member_start:end]
+        if text.strip():
+            members.extend(json.loads("{" + text + "}").items())
@@ -0,0 +1,189 @@
+"""
+Tail-latency and failure handling for upstream calls: hedged requests and a circuit breaker
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class LatencyTracker:
+    """Recent call latencies, for choosing a hedge delay"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency below which a fraction q of recent calls completed, None without samples"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class Hedger:
+    """Sends a second identical call when the first one is slower than the
+    recent latency quantile, and takes whichever answers first.
+
+    Until `min_samples` latencies have been seen the delay is `default_delay`;
+    afterwards it is the `quantile` of recent latencies, clamped to
+    [min_delay, max_delay]. Only upstream round trips are sampled: answers
+    from a cache in front of upstream would drag the quantile down to
+    their own latency and get nearly every real request hedged.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        default_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+    ):
+        self.quantile = quantile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker()
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self) -> float:
+        """Seconds to wait for the first call before hedging"""
+        if len(self.latencies) < self.min_samples:
+            return self.default_delay
+        return min(self.max_delay, max(self.min_delay, self.latencies.quantile(self.quantile)))
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        discard: Optional[Callable[[Any], Awaitable[None]]] = None,
+        cached: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Await fn(), hedged with a second fn() if the first is slow.
+
+        A failure of the first call before the hedge is sent is raised as is;
+        once both are in flight the first success wins and an error is only
+        raised if both fail. `discard` releases a result that lost the race
+        (e.g. closes an unread response). `cached` tells whether a result was
+        served from a cache; its latency is then not recorded.
+        """
+        self.calls += 1
+        started = time.monotonic()
+        first = asyncio.ensure_future(fn())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if not done:
+                self.hedged += 1
+                tasks.add(asyncio.ensure_future(fn()))
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                winners = [t for t in done if not t.cancelled() and t.exception() is None]
+                if winners:
+                    winner = first if first in winners else winners[0]
+                    if winner is not first:
+                        self.hedge_wins += 1
+                    for task in winners:
+                        if task is not winner and discard is not None:
+                            await discard(task.result())
+                    if cached is None or not cached(winner.result()):
+                        self.latencies.record(time.monotonic() - started)
+                    return winner.result()
+                error = next(iter(done)).exception() or error
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+                if discard is not None:
+                    task.add_done_callback(lambda t: _discard_later(t, discard))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "delay": self.delay(),
+        }
+
+
+def _discard_later(task: asyncio.Task, discard: Callable[[Any], Awaitable[None]]) -> None:
+    # A cancelled call may still have completed; release its result
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(discard(task.result()))
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling upstream while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Fails fast after repeated upstream failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    `allow()` refuses calls for `reset_timeout` seconds. Then a single trial
+    call is let through (half-open): its success closes the circuit, its
+    failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.opened = 0
+        self.short_circuited = 0
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now"""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed (e.g. a client error)"""
+        self.trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened,
+            "short_circuited": self.short_circuited,
+        }
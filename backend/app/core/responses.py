@@ -0,0 +1,18 @@
+"""
+JSON response class backed by the configured openapi_client codec
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from openapi_client.codec import get_codec
+
+json_codec = get_codec(settings.json_codec)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when installed, stdlib json otherwise"""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps_bytes(content)
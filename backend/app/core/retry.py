@@ -0,0 +1,152 @@
+"""
+Retry policy for upstream calls: exponential backoff with jitter, error classification and a deadline
+"""
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from app.core.deadline import current_deadline
+from app.core.resilience import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses meaning "try again later" rather than "this request is wrong"
+RETRYABLE_STATUSES = frozenset([408, 429, 500, 502, 503, 504])
+
+
+class EmptyResponseError(RuntimeError):
+    """Raised for an upstream answer that is empty but may not be next time"""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's time budget runs out, across all of its attempts"""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Default classification: timeouts, connection errors and empty responses are worth retrying"""
+    return isinstance(
+        error,
+        (asyncio.TimeoutError, ConnectionError, httpx.TransportError, EmptyResponseError),
+    )
+
+
+class RetryPolicy:
+    """Retries failed calls with exponential backoff and full jitter, within a deadline.
+
+    An attempt failing with an error that `retryable` rejects is raised
+    immediately. Otherwise the call is retried up to `max_attempts` in total,
+    waiting a random delay in [0, min(backoff_max, backoff_base * 2**n)]
+    before retry n + 1. Every attempt is bounded by what is left of the
+    deadline, and no backoff is waited that would end past it.
+
+    :param timeout: seconds a call may take across all attempts when the
+        caller passes no deadline of its own; None for no limit.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        timeout: Optional[float] = None,
+        retryable: Callable[[BaseException], bool] = is_transient,
+        name: str = "upstream",
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.retryable = retryable
+        self.name = name
+        self.latencies = LatencyTracker()
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.successes = 0
+        self.fatal = 0
+        self.gave_up = 0
+        self.deadline_exceeded = 0
+        self.cancelled = 0
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before the given retry (1 for the first)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
+
+    async def call(self, fn: Callable[[], Awaitable[Any]], deadline: Optional[float] = None) -> Any:
+        """Await fn(), retrying as the policy allows.
+
+        :param deadline: event loop time (`loop.time()`) by which to give up;
+            the earliest of this, the request's deadline and `timeout` applies.
+        :raises DeadlineExceededError: if the deadline passes first.
+        """
+        loop = asyncio.get_running_loop()
+        deadlines = [d for d in (deadline, current_deadline()) if d is not None]
+        if self.timeout is not None:
+            deadlines.append(loop.time() + self.timeout)
+        deadline = min(deadlines, default=None)
+        self.calls += 1
+        try:
+            return await self._attempts(fn, deadline)
+        except asyncio.CancelledError:
+            # The request was abandoned (deadline passed, client disconnected)
+            self.cancelled += 1
+            raise
+
+    async def _attempts(self, fn: Callable[[], Awaitable[Any]], deadline: Optional[float]) -> Any:
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                self.deadline_exceeded += 1
+                raise DeadlineExceededError(f"{self.name} call exceeded its deadline after {attempt - 1} attempts")
+
+            self.attempts += 1
+            started = loop.time()
+            try:
+                result = await (fn() if remaining is None else asyncio.wait_for(fn(), remaining))
+            except Exception as e:
+                self.latencies.record(loop.time() - started)
+                # The event loop may fire the timeout a clock tick early
+                if deadline is not None and deadline - loop.time() < 0.001:
+                    self.deadline_exceeded += 1
+                    raise DeadlineExceededError(
+                        f"{self.name} call exceeded its deadline after {attempt} attempts"
+                    ) from e
+                if not self.retryable(e):
+                    self.fatal += 1
+                    raise
+                delay = self.backoff(attempt)
+                if attempt >= self.max_attempts or (deadline is not None and loop.time() + delay >= deadline):
+                    self.gave_up += 1
+                    logger.error(f"Giving up on {self.name} call after {attempt} attempts: {e}")
+                    raise
+                self.retries += 1
+                logger.warning(
+                    f"{self.name} call failed (attempt {attempt}/{self.max_attempts}), "
+                    f"retrying in {delay:.2f} seconds: {e}"
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.latencies.record(loop.time() - started)
+                self.successes += 1
+                return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Attempt, retry and outcome counters with per-attempt latency quantiles"""
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "successes": self.successes,
+            "fatal": self.fatal,
+            "gave_up": self.gave_up,
+            "deadline_exceeded": self.deadline_exceeded,
+            "cancelled": self.cancelled,
+            "attempt_latency_p50": self.latencies.quantile(0.5),
+            "attempt_latency_p95": self.latencies.quantile(0.95),
+        }
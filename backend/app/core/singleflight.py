@@ -0,0 +1,77 @@
+"""
+Single-flight coalescing of identical concurrent async calls
+"""
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from app.core.deadline import current_deadline
+from app.core.retry import DeadlineExceededError
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with the
+    same key await the in-flight call and share its result or exception.
+
+    The shared call runs in its own task, so a caller being cancelled (e.g.
+    a client disconnecting) does not cancel it for the other waiters. Once
+    every waiter is gone the call is cancelled, as nobody wants its result.
+
+    The shared call runs in a fresh context, so it does not inherit the
+    first caller's request deadline. Each waiter instead stops waiting at
+    its own deadline.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.issued = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn(), or the call already in flight for key"""
+        task = self._in_flight.get(key)
+        if task is None:
+            self.issued += 1
+            task = asyncio.get_running_loop().create_task(fn(), context=contextvars.Context())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.coalesced += 1
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            deadline = current_deadline()
+            if deadline is None:
+                return await asyncio.shield(task)
+            remaining = deadline - asyncio.get_running_loop().time()
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), max(remaining, 0))
+            except asyncio.TimeoutError:
+                if task.done() and not task.cancelled() and isinstance(task.exception(), asyncio.TimeoutError):
+                    raise
+                raise DeadlineExceededError("Request deadline passed while waiting for a shared call") from None
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                # Only a cancelled waiter leaves before the call is done
+                if not task.done():
+                    task.cancel()
+                    self.abandoned += 1
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Issued vs. coalesced call counters, and calls cancelled for want of waiters"""
+        return {
+            "issued": self.issued,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._in_flight),
+        }
@@ -1,24 +1,56 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.api.studies import router as studies_router
 from app.core.config import settings
+from app.core.deadline import DeadlineMiddleware, RequestCancellations
+from app.core.responses import FastJSONResponse, json_codec
 from app.models.extraction import (
+    TranscriptBatchRequest,
     TranscriptExtractionRequest,
     TranscriptExtractionResponse,
 )
-from app.services.extraction import TranscriptExtractionService
-from app.services.gemini import GeminiService
+from app.services.clinical_trials import ClinicalTrialsService
+from app.services.extraction import TranscriptExtractionService, get_extraction_service
+from app.services.gemini import GeminiService, get_gemini_service
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create app-scoped services on startup and release them on shutdown"""
+    app.state.clinical_trials_service = ClinicalTrialsService()
+    app.state.gemini_service = GeminiService()
+    app.state.extraction_service = TranscriptExtractionService.from_settings(app.state.gemini_service)
+    try:
+        yield
+    finally:
+        await app.state.clinical_trials_service.close()
+        await app.state.gemini_service.close()
+        app.state.extraction_service.close()
+
+
 app = FastAPI(
     title="StudyBridge API",
     description="API for matching patients with clinical trials",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Added first so that CORS wraps it and its 504s carry CORS headers
+request_cancellations = RequestCancellations()
+app.add_middleware(
+    DeadlineMiddleware,
+    default_timeout=settings.request_deadline,
+    counters=request_cancellations,
 )
 
 # Configure CORS
@@ -40,10 +72,12 @@ class PromptRequest(BaseModel):
     prompt: str
 
 @app.post("/completions")
-async def generate_text(request: PromptRequest):
+async def generate_text(
+    request: PromptRequest,
+    service: GeminiService = Depends(get_gemini_service),
+):
     """Generate text using Gemini API"""
     try:
-        service = GeminiService()
         # Convert prompt to messages format expected by generate_response
         messages = [{"content": request.prompt}]
         response = await service.generate_response(messages)
@@ -53,20 +87,98 @@ async def generate_text(request: PromptRequest):
 
 
 @app.post("/transcripts/extractions", response_model=TranscriptExtractionResponse)
-async def extract_medical_info(request: TranscriptExtractionRequest):
+async def extract_medical_info(
+    request: TranscriptExtractionRequest,
+    extraction_service: TranscriptExtractionService = Depends(get_extraction_service),
+):
     """Extract structured medical information from a transcript"""
     try:
-        extraction_service = TranscriptExtractionService()
-        extraction = await extraction_service.extract_from_transcript(request.transcript)
+        extraction, cached = await extraction_service.extract(request.transcript)
         
         return TranscriptExtractionResponse(
             extraction=extraction,
             success=True,
-            message="Extraction completed successfully"
+            message="Extraction completed successfully",
+            cached=cached,
         )
     except Exception as e:
         logger.error(f"Error in extract endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
+
+
+@app.post("/transcripts/extractions:stream")
+async def stream_medical_info(
+    request: TranscriptExtractionRequest,
+    extraction_service: TranscriptExtractionService = Depends(get_extraction_service),
+):
+    """
+    Extract structured medical information as Server-Sent Events
+    
+    A `field` event ({"field": name, "value": value}) is sent for each
+    MedicalExtraction field as soon as the model has written it, diagnosis
+    first, so trial search can start before the extraction is complete. The
+    stream ends with an `extraction` event carrying the validated
+    TranscriptExtractionResponse, or with an `error` event ({"detail": ...})
+    if the extraction fails after the response has started.
+    """
+    def event(name: str, data: Any) -> bytes:
+        return b"event: " + name.encode() + b"\ndata: " + json_codec.dumps_bytes(data) + b"\n\n"
+    
+    async def events():
+        fields = extraction_service.extract_stream(request.transcript)
+        try:
+            async for name, value in fields:
+                if name == "extraction":
+                    extraction, cached = value
+                    response = TranscriptExtractionResponse(extraction=extraction, cached=cached)
+                    yield event("extraction", response.model_dump())
+                else:
+                    yield event("field", {"field": name, "value": value})
+        except Exception as e:
+            # The status line is sent, so the failure has to travel in the stream
+            logger.error(f"Error in extraction stream: {e}")
+            yield event("error", {"detail": f"Extraction failed: {str(e)}"})
+        finally:
+            await fields.aclose()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/transcripts/extractions:batch")
+async def extract_medical_info_batch(
+    request: TranscriptBatchRequest,
+    extraction_service: TranscriptExtractionService = Depends(get_extraction_service),
+):
+    """
+    Extract structured medical information from many transcripts
+    
+    Results are streamed as NDJSON, one TranscriptBatchResult per line in
+    completion order; `index` refers to the transcript's position in the
+    request.
+    """
+    if len(request.transcripts) > settings.extraction_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.extraction_batch_max_items} transcripts per batch",
+        )
+    
+    async def lines():
+        results = extraction_service.extract_batch(
+            request.transcripts,
+            concurrency=settings.extraction_batch_concurrency,
+            timeout=settings.extraction_batch_item_timeout,
+        )
+        try:
+            async for result in results:
+                yield json_codec.dumps_bytes(result.model_dump()) + b"\n"
+        finally:
+            await results.aclose()
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
     
 app.include_router(studies_router)
     
@@ -75,3 +187,14 @@ async def health_check():
     return {
         "status": "healthy"
     }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime statistics of the app-scoped services"""
+    return {
+        "requests": request_cancellations.stats(),
+        "clinical_trials": app.state.clinical_trials_service.stats(),
+        "gemini": app.state.gemini_service.stats(),
+        "extraction": app.state.extraction_service.stats(),
+    }
@@ -31,4 +31,19 @@ class TranscriptExtractionResponse(BaseModel):
     """Response model for transcript extraction"""
     extraction: MedicalExtraction
     success: bool = True
-    message: str = "Extraction completed successfully"
\ No newline at end of file
+    message: str = "Extraction completed successfully"
+    cached: bool = Field(False, description="Whether the extraction was served from the cache")
+
+
+class TranscriptBatchRequest(BaseModel):
+    """Request model for batch transcript extraction"""
+    transcripts: List[str] = Field(..., min_length=1, description="Medical visit transcript texts")
+
+
+class TranscriptBatchResult(BaseModel):
+    """One NDJSON line of a batch extraction response"""
+    index: int = Field(..., description="Position of the transcript in the request")
+    extraction: Optional[MedicalExtraction] = None
+    success: bool = True
+    message: str = "Extraction completed successfully"
+    cached: bool = Field(False, description="Whether the extraction was served from the cache")
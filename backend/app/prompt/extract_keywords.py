@@ -17,4 +17,24 @@ Transcript:
 ```
 
 Return only the JSON object with no additional text or formatting.
-"""
\ No newline at end of file
+"""
+
+# asks again for the fields of an extraction that came back missing or invalid
+REPAIR_PROMPT = """
+You are a JSON extraction engine. A previous extraction from the medical visit transcription text below was missing or had invalid values for some fields. Extract only these fields, following the JSON schema specified below.
+- Do not make up values for any fields.
+- If diagnosis is requested and no diagnosis is mentioned, put "Unknown".
+- Extract only information that is explicitly mentioned in the transcript.
+
+Schema:
+```json
+{0}
+```
+
+Transcript:
+```text
+{1}
+```
+
+Return only the JSON object with no additional text or formatting.
+"""
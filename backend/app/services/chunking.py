@@ -0,0 +1,135 @@
+"""
+Splitting long transcripts into overlapping chunks and merging their extractions
+"""
+import math
+import re
+from collections import Counter
+from typing import List, Optional
+
+from app.models.extraction import MedicalExtraction
+
+# Gemini's tokenizer averages about four characters per token on English text
+CHARS_PER_TOKEN = 4
+
+# "Doctor: ...", "Patient 2: ...", "DR. SMITH: ..." at the start of a line
+_SPEAKER_TURN = re.compile(r"^(?=[ \t]*[A-Za-z][\w .'-]{0,40}:)", re.MULTILINE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate Gemini token count of a text"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_turns(transcript: str) -> List[str]:
+    """Speaker turns of a transcript, or its paragraphs when no speakers are marked"""
+    turns = [turn.strip() for turn in _SPEAKER_TURN.split(transcript)]
+    if len(turns) <= 1:
+        turns = [turn.strip() for turn in re.split(r"\n\s*\n", transcript)]
+    return [turn for turn in turns if turn]
+
+
+def _split_long_turn(turn: str, max_tokens: int) -> List[str]:
+    """Split a turn longer than max_tokens at sentence ends (or mid-sentence, as a last resort)"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    sentences: List[str] = []
+    for sentence in _SENTENCE_END.split(turn):
+        sentences.extend(sentence[i:i + max_chars] for i in range(0, len(sentence), max_chars))
+    pieces: List[str] = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_transcript(transcript: str, max_tokens: int, overlap_tokens: int) -> List[str]:
+    """
+    Split a transcript into chunks of at most about max_tokens, cut between speaker turns
+
+    Each chunk after the first starts with the last turns of the previous
+    one (up to overlap_tokens), so statements relying on the preceding
+    question keep their context.
+    """
+    turns: List[str] = []
+    for turn in split_turns(transcript):
+        turns.extend(_split_long_turn(turn, max_tokens) if estimate_tokens(turn) > max_tokens else [turn])
+
+    chunks: List[str] = []
+    current: List[str] = []
+    fresh = 0  # turns in current not carried over from the previous chunk
+    for turn in turns:
+        if fresh and estimate_tokens("\n\n".join(current + [turn])) > max_tokens:
+            chunks.append("\n\n".join(current))
+            overlap: List[str] = []
+            for previous in reversed(current):
+                candidate = [previous] + overlap
+                if (
+                    estimate_tokens("\n\n".join(candidate)) > overlap_tokens
+                    or estimate_tokens("\n\n".join(candidate + [turn])) > max_tokens
+                ):
+                    break
+                overlap = candidate
+            current, fresh = overlap, 0
+        current.append(turn)
+        fresh += 1
+    if fresh:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _key(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def _dedupe(values: List[str]) -> List[str]:
+    """Values in order of first appearance, compared case- and whitespace-insensitively"""
+    seen = set()
+    unique = []
+    for value in values:
+        key = _key(value)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(value.strip())
+    return unique
+
+
+def merge_extractions(extractions: List[MedicalExtraction]) -> MedicalExtraction:
+    """
+    Combine the extractions of a transcript's chunks, given in chunk order
+
+    The diagnosis named by most chunks wins (the earliest on a tie) and any
+    other diagnoses become conditions; list fields are concatenated and
+    deduplicated; age and gender come from the first chunk mentioning them.
+    The result only depends on the extractions and their order.
+    """
+    diagnoses = [e.diagnosis.strip() for e in extractions if e.diagnosis and e.diagnosis.strip() != "Unknown"]
+    counts = Counter(_key(d) for d in diagnoses)
+    diagnosis = "Unknown"
+    if diagnoses:
+        best = max(counts.values())
+        diagnosis = next(d for d in diagnoses if counts[_key(d)] == best)
+
+    def merged(field: str) -> List[str]:
+        return _dedupe([value for e in extractions for value in getattr(e, field)])
+
+    def first(field: str) -> Optional[str]:
+        return next((getattr(e, field) for e in extractions if getattr(e, field)), None)
+
+    conditions = _dedupe(diagnoses + merged("conditions"))
+    return MedicalExtraction(
+        diagnosis=diagnosis,
+        conditions=[c for c in conditions if _key(c) != _key(diagnosis)],
+        symptoms=merged("symptoms"),
+        medications=merged("medications"),
+        age=first("age"),
+        gender=first("gender"),
+        medical_history=merged("medical_history"),
+        interventions=merged("interventions"),
+        keywords=merged("keywords"),
+    )
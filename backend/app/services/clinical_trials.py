@@ -1,99 +1,480 @@
 """
 Service for interacting with ClinicalTrials.gov API
 """
+import asyncio
 import logging
-from typing import Any, Dict
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
-from openapi_client import ApiClient, Configuration
-from openapi_client.api.studies_api import StudiesApi
+import httpx
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.resilience import CircuitBreaker, CircuitOpenError, Hedger
+from app.core.retry import DeadlineExceededError, RetryPolicy, is_transient
+from app.core.singleflight import SingleFlight
+from openapi_client import Configuration
+from openapi_client.api.studies_api_async import AsyncStudiesApi
+from openapi_client.api_client_async import AsyncApiClient
+from openapi_client.cache import ResponseCache
+from openapi_client.codec import get_codec
+from openapi_client.exceptions import ApiException
 from openapi_client.models.paged_studies import PagedStudies
+from openapi_client.pagination import StudyType, aiter_studies
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+# Server errors worth another attempt; 429 and 503 are already retried by the
+# client's throttle (honouring Retry-After)
+RETRYABLE_STATUSES = frozenset([500, 502, 504])
+
+
+def is_retryable(error: BaseException) -> bool:
+    """ClinicalTrials.gov errors worth retrying"""
+    if isinstance(error, ApiException):
+        return error.status in RETRYABLE_STATUSES
+    return is_transient(error)
+
+
+def _from_response_cache(result: Any) -> bool:
+    """Whether a list_studies result was answered by the client's response cache, which marks them with X-Cache"""
+    headers = getattr(result, "headers", None)
+    return headers is not None and "x-cache" in headers
+
+
+class _UpstreamStudiesApi:
+    """The StudiesApi calls of a study iterator, sent through a service's _call_upstream"""
+
+    def __init__(self, service: "ClinicalTrialsService"):
+        self._service = service
+        self.api_client = service.api_client
+
+    async def list_studies_without_preload_content(self, **params: Any) -> httpx.Response:
+        return await self._service._call_upstream(
+            self._fetch_page,
+            params,
+            discard=lambda unused: unused.aclose(),
+        )
+
+    async def _fetch_page(self, **params: Any) -> httpx.Response:
+        response = await self._service.studies_api.list_studies_without_preload_content(**params)
+        if response.status_code in RETRYABLE_STATUSES:
+            # Raised so the attempt is retried like any other upstream failure
+            body = await response.aread()
+            await response.aclose()
+            raise ApiException(
+                status=response.status_code,
+                reason=response.reason_phrase,
+                body=body.decode("utf-8", "replace"),
+            )
+        return response
+
+
+class StudyView(str, Enum):
+    """Named projections of a study, mapped to ClinicalTrials.gov `fields` lists"""
+    CARD = "card"
+    MATCHING = "matching"
+    FULL = "full"
+
+
+# Fields requested from ClinicalTrials.gov for each view; None returns the whole study
+STUDY_VIEW_FIELDS: Dict[StudyView, Optional[List[str]]] = {
+    # What the results table renders
+    StudyView.CARD: [
+        "NCTId",
+        "BriefTitle",
+        "OverallStatus",
+        "LocationCity",
+        "LocationCountry",
+    ],
+    # What is needed to judge whether a patient fits a study
+    StudyView.MATCHING: [
+        "NCTId",
+        "BriefTitle",
+        "OfficialTitle",
+        "OverallStatus",
+        "BriefSummary",
+        "Condition",
+        "Keyword",
+        "Phase",
+        "StudyType",
+        "InterventionType",
+        "InterventionName",
+        "EligibilityModule",
+        "LocationFacility",
+        "LocationCity",
+        "LocationState",
+        "LocationCountry",
+        "CentralContactName",
+        "CentralContactPhone",
+        "CentralContactEMail",
+    ],
+    StudyView.FULL: None,
+}
+
+
 class ClinicalTrialsService:
     """Service for searching clinical trials using ClinicalTrials.gov API"""
     
-    def __init__(self, base_url: str = "https://clinicaltrials.gov/api/v2"):
+    def __init__(self, base_url: str | None = None):
         """Initialize the clinical trials service"""
-        self.base_url = base_url
+        self.base_url = base_url or settings.clinical_trials_base_url
         self._api_client = None
         self._studies_api = None
+        self._single_flight = SingleFlight()
+        self._hedger = Hedger(
+            quantile=settings.clinical_trials_hedge_quantile,
+            default_delay=settings.clinical_trials_hedge_default_delay,
+            min_delay=settings.clinical_trials_hedge_min_delay,
+            max_delay=settings.clinical_trials_hedge_max_delay,
+        )
+        self._breaker = CircuitBreaker(
+            failure_threshold=settings.clinical_trials_breaker_failure_threshold,
+            reset_timeout=settings.clinical_trials_breaker_reset_timeout,
+        )
+        self._retry = RetryPolicy(
+            max_attempts=settings.clinical_trials_retry_attempts,
+            backoff_base=settings.clinical_trials_retry_backoff_base,
+            backoff_max=settings.clinical_trials_retry_backoff_max,
+            timeout=settings.clinical_trials_deadline,
+            retryable=is_retryable,
+            name="ClinicalTrials.gov",
+        )
     
     @property
-    def api_client(self) -> ApiClient:
+    def api_client(self) -> AsyncApiClient:
         """Lazy initialization of API client"""
         if self._api_client is None:
             config = Configuration(host=self.base_url)
-            self._api_client = ApiClient(config)
+            config.connection_pool_maxsize = settings.clinical_trials_pool_maxsize
+            config.connection_pool_block = settings.clinical_trials_pool_block
+            config.timeout = (
+                settings.clinical_trials_connect_timeout,
+                settings.clinical_trials_read_timeout,
+            )
+            config.json_codec = get_codec(settings.json_codec)
+            config.rate_limit = settings.clinical_trials_rate_limit
+            config.rate_limit_burst = settings.clinical_trials_rate_limit_burst
+            config.rate_limit_file = settings.clinical_trials_rate_limit_file
+            config.throttle_retries = settings.clinical_trials_throttle_retries
+            config.response_cache = self._response_cache()
+            self._api_client = AsyncApiClient(config)
         return self._api_client
     
+    @staticmethod
+    def _response_cache() -> ResponseCache | None:
+        """Response cache for upstream pages, per the cache settings"""
+        if not settings.clinical_trials_cache_enabled:
+            return None
+        return ResponseCache(
+            max_age=min(settings.clinical_trials_cache_ttl.values(), default=0),
+            stale_while_revalidate=settings.clinical_trials_cache_stale_while_revalidate,
+            memory_bytes=settings.clinical_trials_cache_memory_mb * 1024 * 1024,
+            disk_path=settings.clinical_trials_cache_path,
+            disk_bytes=settings.clinical_trials_cache_disk_mb * 1024 * 1024,
+        )
+    
     @property
-    def studies_api(self) -> StudiesApi:
+    def studies_api(self) -> AsyncStudiesApi:
         """Lazy initialization of Studies API"""
         if self._studies_api is None:
-            self._studies_api = StudiesApi(self.api_client)
+            self._studies_api = AsyncStudiesApi(self.api_client)
         return self._studies_api
     
-    def search_clinical_trials(
-        self, condition: str, page_size: int, is_recruiting: bool = False, page_token: str | None = None
+    def _list_studies_params(
+        self,
+        condition: str,
+        page_size: int,
+        is_recruiting: bool,
+        page_token: str | None,
+        view: StudyView,
+    ) -> Dict[str, Any]:
+        """Build the list_studies arguments shared by all search variants"""
+        # Set up filters
+        filter_overall_status = []
+        if is_recruiting:
+            filter_overall_status = ["RECRUITING", "ENROLLING_BY_INVITATION"]
+            logger.info("Filtering to recruiting studies only")
+        
+        # Freshness required from the response cache depends on the view
+        ttl = settings.clinical_trials_cache_ttl.get(view.value, 0)
+        swr = settings.clinical_trials_cache_stale_while_revalidate
+        
+        return {
+            "query_cond": condition,
+            "page_size": page_size,
+            "page_token": page_token,
+            "filter_overall_status": filter_overall_status,
+            "fields": STUDY_VIEW_FIELDS[view],
+            "format": "json",
+            "_headers": {"Cache-Control": f"max-age={ttl}, stale-while-revalidate={swr}"},
+        }
+    
+    async def search_clinical_trials(
+        self,
+        condition: str,
+        page_size: int,
+        is_recruiting: bool = False,
+        page_token: str | None = None,
+        view: StudyView = StudyView.FULL,
     ) -> Dict[str, Any]:
         """
         Search clinical trials by condition
         
+        Concurrent calls with the same normalized parameters (condition compared
+        case- and whitespace-insensitively) share a single upstream request.
+        
         Args:
             condition: Medical condition to search for
             page_size: Number of results per page
             page_token: Token for pagination
             is_recruiting: If True, filter to only recruiting studies (RECRUITING, ENROLLING_BY_INVITATION)
+            view: Projection profile selecting which study fields are downloaded
             
         Returns:
             Dictionary containing search results
             
         Raises:
+            DeadlineExceededError: If the search or request deadline runs out
             RuntimeError: If API call fails
         """
+        key = (
+            " ".join(condition.split()).casefold(),
+            page_size,
+            is_recruiting,
+            page_token,
+            view,
+        )
+        result = await self._single_flight.do(
+            key,
+            lambda: self._search(condition, page_size, is_recruiting, page_token, view),
+        )
+        # Coalesced callers share the result; give each its own top-level dict
+        return dict(result)
+
+    async def _search(
+        self,
+        condition: str,
+        page_size: int,
+        is_recruiting: bool,
+        page_token: str | None,
+        view: StudyView,
+    ) -> Dict[str, Any]:
+        """Perform one upstream search (see search_clinical_trials)"""
         try:
             logger.info(f"Searching clinical trials for condition: {condition}")
             
-            # Set up filters
-            filter_overall_status = []
-            if is_recruiting:
-                filter_overall_status = ["RECRUITING", "ENROLLING_BY_INVITATION"]
-                logger.info("Filtering to recruiting studies only")
-            
             # Perform the search
-            response: PagedStudies = self.studies_api.list_studies(
-                query_cond=condition,
-                page_size=page_size,
-                page_token=page_token,
-                filter_overall_status=filter_overall_status,
-                format="json",
-            )
+            # With HTTP info, so response cache hits can be told apart by their X-Cache header
+            response: PagedStudies = (await self._call_upstream(
+                self.studies_api.list_studies_with_http_info,
+                self._list_studies_params(condition, page_size, is_recruiting, page_token, view),
+            )).data
             
             logger.info(f"Successfully retrieved {len(response.studies or [])} studies")
             
             # Convert the response to a dictionary
             return response.to_dict()
 
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             logger.error(f"Error calling ClinicalTrials.gov API: {e}")
             raise RuntimeError(f"Error calling ClinicalTrials.gov API: {e}") from e
 
+    async def _call_upstream(
+        self,
+        call: Callable[..., Awaitable[Any]],
+        params: Dict[str, Any],
+        discard: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
+        """
+        Call a StudiesApi operation through the circuit breaker, hedging slow requests
+        
+        While the circuit is open the call is answered from the response cache only,
+        stale pages included. Timeouts, connection errors and 500/502/504 answers are
+        retried per the retry policy, within the clinical_trials_deadline budget and
+        the deadline of the request being served.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open and the page is not cached
+            DeadlineExceededError: If the budget runs out
+        """
+        return await self._retry.call(lambda: self._call_once(call, params, discard))
+
+    async def _call_once(
+        self,
+        call: Callable[..., Awaitable[Any]],
+        params: Dict[str, Any],
+        discard: Callable[[Any], Awaitable[None]] | None,
+    ) -> Any:
+        """One attempt of _call_upstream"""
+        if not self._breaker.allow():
+            return await self._call_cached(call, params)
+        
+        try:
+            if settings.clinical_trials_hedge_enabled:
+                result = await self._hedger.call(lambda: call(**params), discard, cached=_from_response_cache)
+            else:
+                result = await call(**params)
+        except ApiException as e:
+            # Client errors say nothing about upstream health
+            if e.status and e.status < 500 and e.status != 429:
+                self._breaker.release()
+            else:
+                self._breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            # Abandoned by the caller, not a sign of upstream health
+            self._breaker.release()
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        
+        if isinstance(result, httpx.Response) and result.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return result
+
+    async def _call_cached(self, call: Callable[..., Awaitable[Any]], params: Dict[str, Any]) -> Any:
+        """Answer a call from the response cache while upstream is considered down"""
+        unavailable = CircuitOpenError("ClinicalTrials.gov is unavailable (circuit open) and the page is not cached")
+        if self.api_client.configuration.response_cache is None:
+            raise unavailable
+        params = dict(params, _headers={"Cache-Control": "only-if-cached, max-stale"})
+        try:
+            result = await call(**params)
+        except ApiException as e:
+            raise unavailable from e
+        if isinstance(result, httpx.Response) and result.status_code == 504:
+            await result.aclose()
+            raise unavailable
+        logger.info("Served cached ClinicalTrials.gov page while the circuit is open")
+        return result
+
+    async def stream_clinical_trials(
+        self,
+        condition: str,
+        page_size: int,
+        is_recruiting: bool = False,
+        page_token: str | None = None,
+        view: StudyView = StudyView.FULL,
+    ) -> httpx.Response:
+        """
+        Search clinical trials and return the unread upstream response
+        
+        The JSON body is not parsed into PagedStudies; callers stream it as-is
+        (its shape matches search_clinical_trials output) and must close the
+        response when done.
+        
+        Raises:
+            DeadlineExceededError: If the search or request deadline runs out
+            RuntimeError: If API call fails or upstream does not answer with JSON
+        """
+        try:
+            logger.info(f"Streaming clinical trials for condition: {condition}")
+            response = await self._call_upstream(
+                self.studies_api.list_studies_without_preload_content,
+                self._list_studies_params(condition, page_size, is_recruiting, page_token, view),
+                discard=lambda unused: unused.aclose(),
+            )
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            logger.error(f"Error calling ClinicalTrials.gov API: {e}")
+            raise RuntimeError(f"Error calling ClinicalTrials.gov API: {e}") from e
+        
+        # Light validation before committing to a streamed 200 response
+        content_type = response.headers.get("content-type", "")
+        if response.status_code != 200 or "json" not in content_type:
+            body = await response.aread()
+            await response.aclose()
+            logger.error(f"ClinicalTrials.gov API returned {response.status_code}: {body[:200]!r}")
+            raise RuntimeError(
+                f"Error calling ClinicalTrials.gov API: ({response.status_code}) {body.decode('utf-8', 'replace')}"
+            )
+        return response
+
+    async def iter_studies(
+        self,
+        condition: str,
+        page_size: int,
+        is_recruiting: bool = False,
+        view: StudyView = StudyView.FULL,
+        max_results: int | None = None,
+        max_pages: int | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[StudyType]:
+        """
+        Iterate over all studies matching a search, page after page
+        
+        The next page is requested while the current one is consumed and
+        only those two pages are held in memory. Each page is fetched like
+        any other upstream call: retried, hedged and through the circuit
+        breaker.
+        
+        Args:
+            condition: Medical condition to search for
+            page_size: Number of results per upstream request
+            is_recruiting: If True, filter to only recruiting studies
+            view: Projection profile selecting which study fields are downloaded
+            max_results: Stop after this many studies
+            max_pages: Stop after this many upstream pages
+            lazy: Yield LazyStudy views that validate fields on access
+            
+        Yields:
+            Study (or LazyStudy) objects
+            
+        Raises:
+            DeadlineExceededError: If the deadline of a page or the request runs out
+            RuntimeError: If an API call fails
+        """
+        params = self._list_studies_params(condition, page_size, is_recruiting, None, view)
+        del params["page_token"]
+        logger.info(f"Iterating clinical trials for condition: {condition}")
+        studies = aiter_studies(
+            _UpstreamStudiesApi(self), max_results=max_results, max_pages=max_pages, lazy=lazy, **params
+        )
+        try:
+            async for study in studies:
+                yield study
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            logger.error(f"Error calling ClinicalTrials.gov API: {e}")
+            raise RuntimeError(f"Error calling ClinicalTrials.gov API: {e}") from e
+        finally:
+            await studies.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection pool, throttling, cache, coalescing, hedging, retry and circuit breaker statistics for monitoring"""
+        rest_client = None if self._api_client is None else self._api_client.rest_client
+        cache = None if rest_client is None else rest_client.response_cache
+        return {
+            "pool": None if rest_client is None else rest_client.pool_stats(),
+            "throttle": None if rest_client is None else rest_client.throttle.stats(),
+            "cache": None if cache is None else cache.stats(),
+            "searches": self._single_flight.stats(),
+            "hedging": self._hedger.stats(),
+            "retry": self._retry.stats(),
+            "circuit": self._breaker.stats(),
+        }
+
+    async def close(self) -> None:
+        """Close pooled upstream connections"""
+        if self._api_client is not None:
+            await self._api_client.close()
+            if self._api_client.configuration.response_cache is not None:
+                self._api_client.configuration.response_cache.close()
+            self._api_client = None
+            self._studies_api = None
+
 
 # Dependency function to get configured clinical trials service
-def get_clinical_trials_service() -> ClinicalTrialsService:
-    """Dependency function to get configured ClinicalTrials service"""
-    return ClinicalTrialsService()
-
-# Backwards-compatible module-level function used by API layer
-def search_clinical_trials(
-    condition: str,
-    page_size: int,
-    page_token: str | None = None,
-    is_recruiting: bool = False,
-) -> Dict[str, Any]:
-    """Convenience wrapper to search clinical trials without managing the service instance."""
-    service = ClinicalTrialsService()
-    return service.search_clinical_trials(condition=condition, page_size=page_size, page_token=page_token, is_recruiting=is_recruiting)
+def get_clinical_trials_service(request: Request) -> ClinicalTrialsService:
+    """Dependency function to get the app-scoped ClinicalTrials service created at startup"""
+    return request.app.state.clinical_trials_service
@@ -1,24 +1,98 @@
 """
 Service for extracting medical information from transcripts using Gemini AI
 """
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple, Type
 
-from app.models.extraction import MedicalExtraction
-from app.prompt.extract_keywords import PROMPT
-from app.services.gemini import GeminiService
+from fastapi import Depends, Request
+from pydantic import BaseModel, ValidationError, create_model
+
+from app.core.config import settings
+from app.core.incremental_json import IncrementalObjectParser
+from app.core.singleflight import SingleFlight
+from app.models.extraction import MedicalExtraction, TranscriptBatchResult
+from app.prompt.extract_keywords import PROMPT, REPAIR_PROMPT
+from app.services.chunking import chunk_transcript, estimate_tokens, merge_extractions
+from app.services.extraction_cache import ExtractionCache, normalize_transcript
+from app.services.fast_path import FastPathExtractor
+from app.services.gemini import GeminiService, get_gemini_service
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _partial_model(fields: FrozenSet[str]) -> Type[BaseModel]:
+    """MedicalExtraction restricted to some of its fields, as a response schema for re-asking"""
+    return create_model(
+        "MedicalExtractionFields",
+        **{
+            name: (field.annotation, field)
+            for name, field in MedicalExtraction.model_fields.items()
+            if name in fields
+        },
+    )
+
+
 class TranscriptExtractionService:
     """Service for extracting structured medical data from transcripts"""
     
-    def __init__(self):
-        self.gemini_service = GeminiService()
+    def __init__(
+        self,
+        gemini_service: GeminiService,
+        cache: Optional[ExtractionCache] = None,
+        fast_path: Optional[FastPathExtractor] = None,
+        fast_path_threshold: float = 0.8,
+    ):
+        self.gemini_service = gemini_service
+        self.cache = cache
+        self.fast_path = fast_path
+        self.fast_path_threshold = fast_path_threshold
+        self._single_flight = SingleFlight()
+        # The instructions and schema before the transcript are the same for
+        # every request: rendered once, and sent as a cacheable prefix
+        self.prompt_prefix, self.prompt_suffix = self._split_prompt()
+        self.responses = 0
+        self.parse_failures = 0
+        self.invalid_responses = 0
+        self.repairs = 0
+        self.repaired_fields = 0
+        self.unrepaired_fields = 0
+        self.chunked_transcripts = 0
+        self.chunks = 0
+        self.fast_path_attempts = 0
+        self.fast_path_hits = 0
+        self.cancelled_extractions = 0
+        self.cancelled_batch_items = 0
+    
+    @classmethod
+    def from_settings(cls, gemini_service: GeminiService) -> "TranscriptExtractionService":
+        """Service with the extraction cache and fast path configured by the settings"""
+        cache = None
+        if settings.extraction_cache_enabled:
+            cache = ExtractionCache(
+                version=cls.prompt_version(),
+                ttl=settings.extraction_cache_ttl,
+                memory_bytes=settings.extraction_cache_memory_mb * 1024 * 1024,
+                disk_path=settings.extraction_cache_path,
+                disk_bytes=settings.extraction_cache_disk_mb * 1024 * 1024,
+            )
+        fast_path = FastPathExtractor() if settings.extraction_fast_path_enabled else None
+        return cls(gemini_service, cache, fast_path, settings.extraction_fast_path_threshold)
     
-    def _get_schema_example(self) -> Dict[str, Any]:
+    @classmethod
+    def prompt_version(cls) -> str:
+        """Short hash of the prompts and schemas, changing whenever one does"""
+        schema_json = json.dumps(cls._get_schema_example(), sort_keys=True)
+        model_schema_json = json.dumps(MedicalExtraction.model_json_schema(), sort_keys=True)
+        content = "\0".join([PROMPT, REPAIR_PROMPT, schema_json, model_schema_json])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    
+    @staticmethod
+    def _get_schema_example() -> Dict[str, Any]:
         """Get the JSON schema example for the prompt"""
         return {
             "diagnosis": "string - Primary diagnosis or 'Unknown' if not mentioned",
@@ -36,62 +110,388 @@ class TranscriptExtractionService:
         """
         Extract structured medical information from a transcript
         """
+        extraction, _ = await self.extract(transcript)
+        return extraction
+    
+    async def extract(self, transcript: str) -> Tuple[MedicalExtraction, bool]:
+        """
+        Extract structured medical information, from the cache if this
+        transcript was extracted before with the same prompt and schema,
+        else locally if the fast path is confident enough, else with Gemini
+        
+        Returns:
+            The extraction and whether it was served from the cache
+        """
         try:
-            # Prepare the prompt with schema and transcript
-            schema_json = json.dumps(self._get_schema_example(), indent=2)
-            formatted_prompt = PROMPT.format(schema_json, transcript)
-            
-            # Generate response using Gemini
-            messages = [{"content": formatted_prompt}]
-            response = await self.gemini_service.generate_response(messages)
-
-            # Clean the response: remove leading/trailing code block markers
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            if cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
-
-            # Parse JSON response
+            return await self._extract(transcript)
+        except asyncio.CancelledError:
+            # The request's deadline passed or its client disconnected
+            self.cancelled_extractions += 1
+            raise
+    
+    async def _extract(self, transcript: str) -> Tuple[MedicalExtraction, bool]:
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(transcript)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached, True
+        
+        extraction = self._fast_path_extraction(transcript)
+        if extraction is not None:
+            return extraction, False
+        if key is None:
+            return await self._extract_or_fallback(transcript), False
+        # Identical transcripts submitted together share one Gemini call
+        return await self._single_flight.do(key, lambda: self._extract_and_store(key, transcript)), False
+    
+    async def extract_batch(
+        self,
+        transcripts: List[str],
+        concurrency: int,
+        timeout: float,
+    ) -> AsyncIterator[TranscriptBatchResult]:
+        """
+        Extract many transcripts, yielding results in completion order
+        
+        Identical transcripts (after normalization) are extracted once and
+        reported under each of their indices. At most `concurrency`
+        extractions run at a time and each is given `timeout` seconds once
+        started; one failing does not stop the others.
+        """
+        indices_by_transcript: Dict[str, List[int]] = {}
+        first_seen: Dict[str, str] = {}
+        for index, transcript in enumerate(transcripts):
+            normalized = normalize_transcript(transcript)
+            indices_by_transcript.setdefault(normalized, []).append(index)
+            first_seen.setdefault(normalized, transcript)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(transcript: str, indices: List[int]) -> List[TranscriptBatchResult]:
+            async with semaphore:
+                try:
+                    extraction, cached = await asyncio.wait_for(self.extract(transcript), timeout)
+                except asyncio.TimeoutError:
+                    message = f"Extraction timed out after {timeout:g} seconds"
+                    return [TranscriptBatchResult(index=i, success=False, message=message) for i in indices]
+                except Exception as e:
+                    logger.error(f"Error in batch extraction: {e}")
+                    message = f"Extraction failed: {str(e)}"
+                    return [TranscriptBatchResult(index=i, success=False, message=message) for i in indices]
+            return [TranscriptBatchResult(index=i, extraction=extraction, cached=cached) for i in indices]
+        
+        tasks = [
+            asyncio.ensure_future(run(first_seen[normalized], indices))
+            for normalized, indices in indices_by_transcript.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            # The client went away or stopped reading: drop the rest
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    self.cancelled_batch_items += 1
+    
+    def _fast_path_extraction(self, transcript: str) -> Optional[MedicalExtraction]:
+        """Local extraction if it reaches the confidence threshold, None to escalate to Gemini"""
+        if self.fast_path is None:
+            return None
+        self.fast_path_attempts += 1
+        extraction, confidence = self.fast_path.extract(transcript)
+        if confidence < self.fast_path_threshold:
+            return None
+        self.fast_path_hits += 1
+        return extraction
+    
+    async def _extract_and_store(self, key: str, transcript: str) -> MedicalExtraction:
+        extraction = await self._generate_extraction(transcript)
+        if extraction is None:
+            return self._fallback_extraction()
+        await self.cache.put(key, extraction)
+        return extraction
+    
+    async def _extract_or_fallback(self, transcript: str) -> MedicalExtraction:
+        extraction = await self._generate_extraction(transcript)
+        return extraction if extraction is not None else self._fallback_extraction()
+    
+    @staticmethod
+    def _fallback_extraction() -> MedicalExtraction:
+        """Minimal extraction returned when Gemini fails; never cached"""
+        return MedicalExtraction(
+            diagnosis="Unknown",
+            conditions=[],
+            symptoms=[],
+            medications=[],
+            age=None,
+            gender=None,
+            medical_history=[],
+            interventions=[],
+            keywords=[]
+        )
+    
+    @classmethod
+    def _split_prompt(cls) -> Tuple[str, str]:
+        """The extraction prompt with the schema filled in, split around the transcript"""
+        schema_json = json.dumps(cls._get_schema_example(), indent=2)
+        marker = "\0transcript\0"
+        prefix, suffix = PROMPT.format(schema_json, marker).split(marker)
+        return prefix, suffix
+    
+    def _salvage(self, response: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Split a response into its valid fields and the fields to ask again for
+        
+        Fields with invalid values are dropped. If the response is not
+        complete JSON (e.g. cut off at the token limit) the members that did
+        arrive whole are kept and every other field is asked for again.
+        """
+        try:
+            data = json.loads(response)
+            complete = isinstance(data, dict)
+        except json.JSONDecodeError:
+            data, complete = None, False
+        if not complete:
+            self.parse_failures += 1
+            data = {}
+            parser = IncrementalObjectParser()
             try:
-                extracted_data = json.loads(cleaned_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Raw response: {response}")
-                # Fallback to minimal extraction
-                extracted_data = {
-                    "diagnosis": "Unknown",
-                    "conditions": [],
-                    "symptoms": [],
-                    "medications": [],
-                    "age": None,
-                    "gender": None,
-                    "medical_history": [],
-                    "interventions": [],
-                    "keywords": []
-                }
-
-            # Ensure diagnosis is present
-            if not extracted_data.get("diagnosis"):
-                extracted_data["diagnosis"] = "Unknown"
-
-            # Create and return MedicalExtraction object
-            return MedicalExtraction(**extracted_data)
-            
+                for char in response:
+                    data.update(parser.feed(char))
+            except ValueError:
+                pass
+            # e.g. a whole object wrapped in a code fence
+            complete = parser.done
+        
+        invalid = set()
+        try:
+            MedicalExtraction.model_validate(data)
+        except ValidationError as e:
+            invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+        for name in invalid:
+            data.pop(name, None)
+        if not complete:
+            invalid.update(name for name in MedicalExtraction.model_fields if name not in data)
+        if invalid:
+            self.invalid_responses += 1
+        return data, sorted(invalid)
+    
+    async def _repair(self, transcript: str, data: Dict[str, Any], invalid: List[str]) -> Dict[str, Any]:
+        """Ask Gemini again for the invalid fields only and merge the valid answers in"""
+        self.repairs += 1
+        model = _partial_model(frozenset(invalid))
+        schema_json = json.dumps({name: self._get_schema_example()[name] for name in invalid}, indent=2)
+        messages = [{"content": REPAIR_PROMPT.format(schema_json, transcript)}]
+        try:
+            response = await self.gemini_service.generate_response(messages, response_schema=model)
+            answers = json.loads(response)
+        except Exception as e:
+            logger.error(f"Error re-asking for extraction fields: {e}")
+            answers = {}
+        if not isinstance(answers, dict):
+            answers = {}
+        for name in invalid:
+            if name not in answers:
+                continue
+            try:
+                model.__pydantic_validator__.validate_assignment(model.model_construct(), name, answers[name])
+            except ValidationError:
+                continue
+            data[name] = answers[name]
+        repaired = sum(1 for name in invalid if name in data)
+        self.repaired_fields += repaired
+        self.unrepaired_fields += len(invalid) - repaired
+        return data
+    
+    async def _validate_response(self, response: str, transcript: str) -> Optional[MedicalExtraction]:
+        """
+        The MedicalExtraction in a structured Gemini response, re-asking once
+        for the fields that were missing or invalid; None if nothing usable
+        came back
+        """
+        self.responses += 1
+        data, invalid = self._salvage(response)
+        if invalid:
+            logger.warning(f"Re-asking for invalid extraction fields: {', '.join(invalid)}")
+            data = await self._repair(transcript, data, invalid)
+        if not data:
+            return None
+        
+        # Ensure diagnosis is present
+        if not data.get("diagnosis"):
+            data["diagnosis"] = "Unknown"
+        return MedicalExtraction.model_validate(data)
+    
+    async def _generate_extraction(self, transcript: str) -> Optional[MedicalExtraction]:
+        """
+        Ask Gemini for the extraction, None if it failed or returned nothing usable
+        
+        Transcripts longer than extraction_chunk_tokens are split into
+        overlapping chunks that are extracted concurrently and merged, so
+        latency follows the slowest chunk rather than the whole length.
+        """
+        chunks = self._chunks(transcript)
+        if len(chunks) == 1:
+            return await self._generate_chunk_extraction(transcript)
+        
+        self.chunked_transcripts += 1
+        self.chunks += len(chunks)
+        logger.info(f"Extracting long transcript in {len(chunks)} chunks")
+        extractions = await asyncio.gather(*(self._generate_chunk_extraction(chunk) for chunk in chunks))
+        extractions = [extraction for extraction in extractions if extraction is not None]
+        if not extractions:
+            return None
+        return merge_extractions(extractions)
+    
+    @staticmethod
+    def _chunks(transcript: str) -> List[str]:
+        if estimate_tokens(transcript) <= settings.extraction_chunk_tokens:
+            return [transcript]
+        return chunk_transcript(
+            transcript,
+            max_tokens=settings.extraction_chunk_tokens,
+            overlap_tokens=settings.extraction_chunk_overlap_tokens,
+        )
+    
+    async def _generate_chunk_extraction(self, transcript: str) -> Optional[MedicalExtraction]:
+        """Extraction of a transcript (or chunk) in one request, None if it failed"""
+        try:
+            # Generate JSON constrained to the MedicalExtraction schema
+            messages = [{"content": transcript + self.prompt_suffix}]
+            response = await self.gemini_service.generate_response(
+                messages, response_schema=MedicalExtraction, prefix=self.prompt_prefix
+            )
+            return await self._validate_response(response, transcript)
         except Exception as e:
             logger.error(f"Error extracting from transcript: {e}")
-            # Return minimal fallback extraction
-            return MedicalExtraction(
-                diagnosis="Unknown",
-                conditions=[],
-                symptoms=[],
-                medications=[],
-                age=None,
-                gender=None,
-                medical_history=[],
-                interventions=[],
-                keywords=[]
-            )
\ No newline at end of file
+            return None
+    
+    async def extract_stream(self, transcript: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Extract with Gemini's streaming API, yielding each MedicalExtraction
+        field as soon as its value is complete
+        
+        Yields ("diagnosis", value) first, then the other fields in the order
+        the model writes them, then ("extraction", (MedicalExtraction, cached))
+        with the validated result. Fields that arrive before the diagnosis
+        are held back until it does.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(transcript)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                for name, value in cached.model_dump().items():
+                    yield name, value
+                yield "extraction", (cached, True)
+                return
+        
+        extraction = self._fast_path_extraction(transcript)
+        if extraction is not None:
+            for name, value in extraction.model_dump().items():
+                yield name, value
+            yield "extraction", (extraction, False)
+            return
+        
+        if len(self._chunks(transcript)) > 1:
+            # Chunks finish in any order, so only the merged result is streamed
+            extraction = await self._generate_extraction(transcript)
+            if extraction is None:
+                extraction = self._fallback_extraction()
+            elif key is not None:
+                await self.cache.put(key, extraction)
+            for name, value in extraction.model_dump().items():
+                yield name, value
+            yield "extraction", (extraction, False)
+            return
+        
+        parser = IncrementalObjectParser()
+        emitted: Dict[str, Any] = {}
+        held: List[Tuple[str, Any]] = []
+        text: List[str] = []
+        try:
+            messages = [{"content": transcript + self.prompt_suffix}]
+            chunks = self.gemini_service.generate_response_stream(
+                messages, response_schema=MedicalExtraction, prefix=self.prompt_prefix
+            )
+            async for chunk in chunks:
+                text.append(chunk)
+                for name, value in parser.feed(chunk):
+                    if name not in MedicalExtraction.model_fields or name in emitted:
+                        continue
+                    if name == "diagnosis":
+                        value = value or "Unknown"
+                    elif "diagnosis" not in emitted:
+                        held.append((name, value))
+                        continue
+                    emitted[name] = value
+                    yield name, value
+                    for held_name, held_value in held:
+                        emitted[held_name] = held_value
+                        yield held_name, held_value
+                    held = []
+            extraction = await self._validate_response("".join(text), transcript)
+        except Exception as e:
+            logger.error(f"Error streaming extraction from transcript: {e}")
+            extraction = None
+        
+        if extraction is None:
+            extraction = self._fallback_extraction()
+        elif key is not None:
+            await self.cache.put(key, extraction)
+        # The diagnosis always precedes the result, even if it never streamed
+        if "diagnosis" not in emitted:
+            yield "diagnosis", extraction.diagnosis
+        yield "extraction", (extraction, False)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache, coalescing, fast path and response validation statistics for monitoring"""
+        responses = max(self.responses, 1)
+        return {
+            "cache": None if self.cache is None else self.cache.stats(),
+            "coalescing": self._single_flight.stats(),
+            "validation": {
+                "responses": self.responses,
+                "parse_failures": self.parse_failures,
+                "invalid_responses": self.invalid_responses,
+                "repairs": self.repairs,
+                "repaired_fields": self.repaired_fields,
+                "unrepaired_fields": self.unrepaired_fields,
+                "parse_failure_rate": self.parse_failures / responses,
+                "repair_rate": self.repairs / responses,
+            },
+            "chunking": {
+                "chunked_transcripts": self.chunked_transcripts,
+                "chunks": self.chunks,
+            },
+            "cancelled": {
+                "extractions": self.cancelled_extractions,
+                "batch_items": self.cancelled_batch_items,
+            },
+            "fast_path": {
+                "enabled": self.fast_path is not None,
+                "threshold": self.fast_path_threshold,
+                "attempts": self.fast_path_attempts,
+                "hits": self.fast_path_hits,
+                "escalations": self.fast_path_attempts - self.fast_path_hits,
+                "hit_rate": self.fast_path_hits / max(self.fast_path_attempts, 1),
+            },
+        }
+    
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+
+
+# Dependency function to get the shared extraction service
+def get_extraction_service(
+    request: Request,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+) -> TranscriptExtractionService:
+    """Dependency function to get the app-scoped extraction service created at startup
+    
+    Depends on get_gemini_service so a missing GEMINI_KEY is reported up front.
+    """
+    return request.app.state.extraction_service
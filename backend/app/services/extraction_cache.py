@@ -0,0 +1,113 @@
+"""
+Content-addressed cache of transcript extractions
+"""
+import asyncio
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Optional
+
+from openapi_client.cache import CacheEntry, DiskTier, MemoryTier
+
+from app.models.extraction import MedicalExtraction
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_transcript(transcript: str) -> str:
+    """Canonical form of a transcript: Unicode NFC with whitespace runs collapsed"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", transcript)).strip()
+
+
+class ExtractionCache:
+    """Extractions keyed by sha256 of the normalized transcript and a version.
+
+    The version identifies the prompt and schema the extraction was made
+    with, so changing either invalidates every entry without a flush. Uses
+    the client's response cache tiers: a byte-bounded in-memory LRU in front
+    of an optional SQLite file that survives restarts and is shared by the
+    workers of a host. The file is read and written in a worker thread, off
+    the event loop.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        ttl: float,
+        memory_bytes: int,
+        disk_path: Optional[str] = None,
+        disk_bytes: int = 0,
+    ):
+        self.version = version
+        self.ttl = ttl
+        self.memory = MemoryTier(memory_bytes)
+        self.disk = DiskTier(disk_path, disk_bytes) if disk_path else None
+        # One statement or transaction on the shared connection at a time
+        self._disk_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stores = 0
+
+    def key(self, transcript: str) -> str:
+        """Cache key of a transcript under the current version"""
+        content = f"{self.version}\0{normalize_transcript(transcript)}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    async def _disk_io(self, operation: Callable[..., Any], *args: Any) -> Any:
+        def locked() -> Any:
+            with self._disk_lock:
+                return operation(*args)
+
+        return await asyncio.to_thread(locked)
+
+    async def get(self, key: str) -> Optional[MedicalExtraction]:
+        """The cached extraction, None if absent or older than the TTL"""
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            entry = await self._disk_io(self.disk.get, key)
+            if entry is not None and entry.age() <= self.ttl:
+                self.memory.put(key, entry)
+                self.disk_hits += 1
+                return MedicalExtraction.model_validate_json(entry.body)
+        elif entry is not None and entry.age() <= self.ttl:
+            self.memory_hits += 1
+            return MedicalExtraction.model_validate_json(entry.body)
+
+        if entry is not None:
+            self.expired += 1
+            self.memory.discard(key)
+            if self.disk is not None:
+                await self._disk_io(self.disk.discard, key)
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, extraction: MedicalExtraction) -> None:
+        entry = CacheEntry(200, {}, extraction.model_dump_json().encode("utf-8"), time.time())
+        self.memory.put(key, entry)
+        if self.disk is not None:
+            await self._disk_io(self.disk.put, key, entry)
+        self.stores += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and size statistics for monitoring"""
+        return {
+            "version": self.version,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "stores": self.stores,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.bytes,
+            "memory_evictions": self.memory.evictions,
+            "disk_bytes": None if self.disk is None else self.disk.bytes,
+            "disk_evictions": None if self.disk is None else self.disk.evictions,
+        }
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
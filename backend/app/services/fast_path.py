@@ -0,0 +1,278 @@
+"""
+Deterministic local extractor that answers easy transcripts without calling Gemini
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.models.extraction import MedicalExtraction
+from app.services import vocabulary
+
+# Words, and sentence ends so that cues and negations do not reach into the next sentence
+_TOKEN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*|[.!?;:]")
+_SENTENCE_END = frozenset(".!?;:")
+_END = object()
+
+# Words in front of a condition that state it as the diagnosis. Only explicit
+# phrases: "it's", "you have" or "looks like" also open questions, small talk
+# and other people's conditions
+DIAGNOSIS_CUES = ["diagnosed with", "diagnosis is", "diagnosis of", "what we call", "consistent with"]
+# Words in front of a condition that place it in the patient's past
+HISTORY_CUES = [
+    "history of", "had", "was treated for", "previously", "in the past",
+    "was diagnosed with", "were diagnosed with",
+]
+# Words dating a condition in its sentence ("ten years ago", "since 2015"),
+# which also place it in the patient's past
+AGO = "ago"
+YEAR_PREPOSITIONS = {"since", "in"}
+_YEAR = re.compile(r"(?:19|20)\d\d")
+# Words in front of a term that negate it
+NEGATIONS = {"no", "not", "without", "denies", "deny", "negative", "rule", "ruled", "never", "isn't", "don't"}
+# Subjects whose conditions are not the patient's ("my dad had a stroke")
+RELATIVES = {
+    "dad", "father", "mom", "mother", "mum", "parent", "parents", "sister", "brother", "sibling",
+    "grandmother", "grandfather", "grandma", "grandpa", "aunt", "uncle", "cousin", "son", "daughter",
+    "wife", "husband", "family", "relative", "relatives",
+}
+# Words of a complaint; one the vocabulary did not match may be a condition it does not know
+COMPLAINTS = {
+    "pain", "pains", "painful", "hurt", "hurts", "hurting", "ache", "aches", "aching", "sore",
+    "soreness", "burning", "cramp", "cramps", "cramping", "bleeding", "lump", "lumps",
+}
+# Tokens searched in front of a match for cues and negations
+CUE_WINDOW = 5
+# Tokens searched in front of a match for a relative as the subject
+SUBJECT_WINDOW = 10
+
+_AGE = re.compile(
+    r"\b(\d{1,3})[- ](?:years?|yrs?)[- ]old\b"
+    r"|\b(?:age|aged)[: ]+(\d{1,3})\b"
+    r"|\bI(?:'m| am) (\d{1,3})\b(?!\s*(?:minutes|hours|days|weeks|months|percent|%|feet|foot|inches|pounds|lbs|kg))",
+    re.IGNORECASE,
+)
+_FEMALE = re.compile(r"\b(female|woman|lady|girl|mrs|ms|she|her)\b", re.IGNORECASE)
+_MALE = re.compile(r"\b(male|man|gentleman|boy|mr|he|his|him)\b", re.IGNORECASE)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower().replace("’", "'"))
+
+
+def _window(words: List[str], start: int, size: int) -> List[str]:
+    """Up to size tokens in front of start, within start's sentence"""
+    window = words[max(0, start - size):start]
+    for i in range(len(window) - 1, -1, -1):
+        if window[i] in _SENTENCE_END:
+            return window[i + 1:]
+    return window
+
+
+class Match(NamedTuple):
+    start: int  # token index
+    end: int
+    term: str  # canonical term
+
+
+class PhraseMatcher:
+    """Finds vocabulary phrases in tokenized text with a word trie (longest match wins)"""
+
+    def __init__(self, terms: Dict[str, Iterable[str]]):
+        self._trie: Dict = {}
+        for canonical, spellings in terms.items():
+            for spelling in [canonical, *spellings]:
+                node = self._trie
+                for word in tokenize(spelling):
+                    node = node.setdefault(word, {})
+                node[_END] = canonical
+
+    def find(self, words: List[str]) -> List[Match]:
+        matches = []
+        i = 0
+        while i < len(words):
+            node = self._trie
+            longest = None
+            for j in range(i, len(words)):
+                node = node.get(words[j])
+                if node is None:
+                    break
+                if _END in node:
+                    longest = Match(i, j + 1, node[_END])
+            if longest is not None:
+                matches.append(longest)
+                i = longest.end
+            else:
+                i += 1
+        return matches
+
+
+def _cue_distance(words: List[str], start: int, cues: List[List[str]]) -> Optional[int]:
+    """Tokens between the closest cue ending in front of start and start, None without one"""
+    window = _window(words, start, CUE_WINDOW)
+    closest = None
+    for cue in cues:
+        for i in range(len(window) - len(cue) + 1):
+            if window[i:i + len(cue)] == cue:
+                distance = len(window) - i - len(cue)
+                closest = distance if closest is None else min(closest, distance)
+    return closest
+
+
+def _negated(words: List[str], start: int) -> bool:
+    return any(word in NEGATIONS for word in _window(words, start, 3))
+
+
+def _in_question(words: List[str], end: int) -> bool:
+    """Whether the sentence a match ends in is a question"""
+    for word in words[end:]:
+        if word in _SENTENCE_END:
+            return word == "?"
+    return False
+
+
+def _sentence(words: List[str], start: int, end: int) -> List[str]:
+    """Tokens of the sentence containing words[start:end]"""
+    first = start
+    while first > 0 and words[first - 1] not in _SENTENCE_END:
+        first -= 1
+    last = end
+    while last < len(words) and words[last] not in _SENTENCE_END:
+        last += 1
+    return words[first:last]
+
+
+def _dated(words: List[str], match: Match) -> bool:
+    """Whether the match's sentence dates it ("ten years ago", "since 2015")"""
+    sentence = _sentence(words, match.start, match.end)
+    return AGO in sentence or any(
+        word in YEAR_PREPOSITIONS and _YEAR.fullmatch(following)
+        for word, following in zip(sentence, sentence[1:])
+    )
+
+
+def _about_relative(words: List[str], start: int) -> bool:
+    return any(word in RELATIVES for word in _window(words, start, SUBJECT_WINDOW))
+
+
+def _excluded(words: List[str], match: Match) -> bool:
+    """Negated, asked about, or someone else's"""
+    return _negated(words, match.start) or _in_question(words, match.end) or _about_relative(words, match.start)
+
+
+def _covered(position: int, matches: List[Match]) -> bool:
+    return any(m.start <= position < m.end for m in matches)
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(values))
+
+
+class FastPathExtractor:
+    """Dictionary-based extraction taking milliseconds instead of an LLM call.
+
+    Confidence reflects how clearly the transcript states the diagnosis:
+    one condition introduced by a diagnostic phrase ("diagnosed with",
+    "what we call") and no other current condition scores highest; a
+    stated diagnosis next to other conditions, several stated ones, or
+    conditions that are only mentioned score lower; no known condition
+    scores lowest. A complaint the vocabulary does not recognize ("my
+    heel has been hurting") caps the confidence at ambiguous, since it
+    may be the reason for the visit. Negated conditions, conditions in
+    questions and relatives' conditions are ignored; conditions diagnosed
+    in the past ("was diagnosed with", "ten years ago") are history.
+    """
+
+    CONFIDENCE_STATED = 0.9
+    CONFIDENCE_AMBIGUOUS = 0.6
+    CONFIDENCE_MENTIONED = 0.4
+    CONFIDENCE_NONE = 0.1
+
+    def __init__(self):
+        self.conditions = PhraseMatcher(vocabulary.CONDITIONS)
+        self.medications = PhraseMatcher(vocabulary.MEDICATIONS)
+        self.symptoms = PhraseMatcher(vocabulary.SYMPTOMS)
+        self.interventions = PhraseMatcher(vocabulary.INTERVENTIONS)
+        self._diagnosis_cues = [tokenize(cue) for cue in DIAGNOSIS_CUES]
+        self._history_cues = [tokenize(cue) for cue in HISTORY_CUES]
+
+    def _terms(self, matcher: PhraseMatcher, words: List[str]) -> List[str]:
+        return _unique(m.term for m in matcher.find(words) if not _negated(words, m.start))
+
+    def extract(self, transcript: str) -> Tuple[MedicalExtraction, float]:
+        """The extraction and its confidence in [0, 1]"""
+        words = tokenize(transcript)
+
+        stated: List[str] = []
+        history: List[str] = []
+        mentioned: Counter = Counter()
+        condition_matches = self.conditions.find(words)
+        for match in condition_matches:
+            if _excluded(words, match):
+                continue
+            # "you have a history of diabetes": the closest cue decides
+            past = _cue_distance(words, match.start, self._history_cues)
+            now = _cue_distance(words, match.start, self._diagnosis_cues)
+            if _dated(words, match) or (past is not None and (now is None or past <= now)):
+                history.append(match.term)
+            elif now is not None:
+                stated.append(match.term)
+            else:
+                mentioned[match.term] += 1
+
+        stated = _unique(stated)
+        others = [c for c in mentioned if c not in stated]
+        if len(stated) == 1 and not others:
+            diagnosis, confidence = stated[0], self.CONFIDENCE_STATED
+        elif stated:
+            diagnosis, confidence = stated[0], self.CONFIDENCE_AMBIGUOUS
+        elif mentioned:
+            diagnosis, confidence = mentioned.most_common(1)[0][0], self.CONFIDENCE_MENTIONED
+        else:
+            diagnosis, confidence = "Unknown", self.CONFIDENCE_NONE
+        if self._unmatched_complaint(words, condition_matches):
+            confidence = min(confidence, self.CONFIDENCE_AMBIGUOUS)
+
+        conditions = [c for c in _unique([*stated, *mentioned]) if c != diagnosis]
+        symptoms = self._terms(self.symptoms, words)
+        extraction = MedicalExtraction(
+            diagnosis=diagnosis,
+            conditions=conditions,
+            symptoms=symptoms,
+            medications=self._terms(self.medications, words),
+            age=self._age(transcript),
+            gender=self._gender(transcript),
+            medical_history=_unique(history),
+            interventions=self._terms(self.interventions, words),
+            keywords=_unique(t.lower() for t in [diagnosis, *conditions, *symptoms] if t != "Unknown"),
+        )
+        return extraction, confidence
+
+    def _unmatched_complaint(self, words: List[str], condition_matches: List[Match]) -> bool:
+        """Whether the patient complains of something no condition or symptom matched"""
+        matches = condition_matches + self.symptoms.find(words)
+        return any(
+            word in COMPLAINTS
+            and not _covered(i, matches)
+            and not _excluded(words, Match(i, i + 1, word))
+            for i, word in enumerate(words)
+        )
+
+    @staticmethod
+    def _age(transcript: str) -> Optional[str]:
+        for match in _AGE.finditer(transcript):
+            age = next(group for group in match.groups() if group)
+            if 0 < int(age) < 120:
+                return age
+        return None
+
+    @staticmethod
+    def _gender(transcript: str) -> Optional[str]:
+        # Pronouns in a visit transcript may refer to anyone, so only an
+        # unambiguous majority decides
+        female = len(_FEMALE.findall(transcript))
+        male = len(_MALE.findall(transcript))
+        if female >= 2 * male and female:
+            return "female"
+        if male >= 2 * female and male:
+            return "male"
+        return None
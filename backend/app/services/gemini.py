@@ -3,87 +3,365 @@ Service for interacting with Google Gemini API
 """
 import asyncio
 import logging
-import os
-from functools import wraps
-from typing import Any, Callable, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
 
+import httpx
+from fastapi import HTTPException, Request
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.retry import RETRYABLE_STATUSES, EmptyResponseError, RetryPolicy, is_transient
+from app.services.llm import LLMBackend, RecordingBackend
+from app.services.llm_stub import StubBackend
+from app.services.prompt_cache import ContextCache, LocalContextCache
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+MODEL = "gemini-2.5-flash"
 
-def retry_on_null_response(max_retries: int = 3, delay: float = 0.5):
-    """Decorator to retry async functions when they return null/empty responses"""
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            retry_count = 0
-            
-            while retry_count < max_retries:
-                try:
-                    result = await func(*args, **kwargs)
-                    
-                    # Check if result is null or empty
-                    if result and str(result).strip():
-                        if retry_count > 0:
-                            logger.info(f"Successfully generated response after {retry_count + 1} attempts")
-                        return result
-                    else:
-                        retry_count += 1
-                        logger.warning(f"Received null/empty response (attempt {retry_count}/{max_retries})")
-                        if retry_count < max_retries:
-                            logger.info(f"Retrying in {delay} seconds... (attempt {retry_count + 1}/{max_retries})")
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            logger.error("Maximum retries reached due to null/empty responses")
-                            raise Exception("Received null or empty response after maximum retries")
-                            
-                except Exception as e:
-                    retry_count += 1
-                    logger.warning(f"API error on attempt {retry_count}/{max_retries}: {str(e)}")
-                    if retry_count < max_retries:
-                        logger.info(f"Retrying in {delay} seconds... (attempt {retry_count + 1}/{max_retries})")
-                        await asyncio.sleep(delay)
-                        continue
-                    else:
-                        logger.error(f"Maximum retries reached due to API errors: {str(e)}")
-                        raise Exception(f"Failed to generate response after {max_retries} attempts: {str(e)}")
-            
-            # This should never be reached, but included for completeness
-            raise Exception("Unexpected error in retry loop")
-        return wrapper
-    return decorator
 
+def is_retryable(error: BaseException) -> bool:
+    """Gemini errors worth retrying: transient ones and rate limit/server statuses"""
+    if isinstance(error, errors.APIError):
+        return error.code in RETRYABLE_STATUSES
+    return is_transient(error)
 
-class GeminiService:
-    """Service for interacting with Google Gemini API"""
+
+def is_cached_content_missing(error: BaseException) -> bool:
+    """Whether Gemini rejected a request because its cached content no longer exists"""
+    if not isinstance(error, errors.ClientError):
+        return False
+    if error.code == 404:
+        return True
+    # Unknown names may also be reported as invalid arguments
+    message = (error.message or "").lower()
+    return error.code == 400 and any(term in message for term in ("cachedcontent", "cached_content", "cached content"))
+
+
+class _TracedTransport(httpx.AsyncHTTPTransport):
+    """Connection pool transport counting requests and new connections"""
+
+    def __init__(self, backend: "GeminiBackend", **kwargs):
+        super().__init__(**kwargs)
+        self._backend = backend
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._backend.http_requests += 1
+        request.extensions = {**request.extensions, "trace": self._trace}
+        return await super().handle_async_request(request)
+
+    async def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self._backend.connections_created += 1
+
+
+class GeminiBackend(LLMBackend):
+    """The Gemini API through the google-genai SDK
+    
+    The client and its HTTP connection pool are created on first use and
+    reused by every call. With gemini_base_url set, calls go to that host
+    instead, e.g. the stub server of app.services.llm_stub.
+    """
+    
+    name = "gemini"
+    model = MODEL
+    supports_context_cache = True
     
     def __init__(self):
-        if not settings.gemini_key:
-            raise ValueError("GEMINI_KEY environment variable is required")
+        self._client = None
+        self._http_client = None
+        self.clients_created = 0
+        self.http_requests = 0
+        self.connections_created = 0
+    
+    @property
+    def client(self) -> genai.Client:
+        """Lazy initialization of the Gemini client"""
+        if self._client is None:
+            if not settings.gemini_key:
+                raise ValueError("GEMINI_KEY environment variable is required")
+            maxsize = settings.gemini_pool_maxsize
+            self._http_client = httpx.AsyncClient(
+                transport=_TracedTransport(
+                    self,
+                    limits=httpx.Limits(max_connections=None, max_keepalive_connections=maxsize),
+                ),
+            )
+            self._client = genai.Client(
+                api_key=settings.gemini_key,
+                http_options=types.HttpOptions(
+                    base_url=settings.gemini_base_url,
+                    httpx_async_client=self._http_client,
+                ),
+            )
+            self.clients_created += 1
+        return self._client
+    
+    async def generate(self, contents: str, config: types.GenerateContentConfig) -> Any:
+        return await self.client.aio.models.generate_content(model=self.model, contents=contents, config=config)
+    
+    async def generate_stream(self, contents: str, config: types.GenerateContentConfig) -> AsyncIterator[Any]:
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model, contents=contents, config=config
+        )
+        async for chunk in stream:
+            yield chunk
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "clients_created": self.clients_created,
+            "http_requests": self.http_requests,
+            "connections_created": self.connections_created,
+            "connections_reused": max(self.http_requests - self.connections_created, 0),
+        }
+    
+    async def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            await self._http_client.aclose()
+            self._client = None
+            self._http_client = None
+
+
+def create_backend() -> LLMBackend:
+    """Backend per the llm_backend setting, recording its responses if llm_record_path is set"""
+    if settings.llm_backend == "gemini":
+        backend = GeminiBackend()
+    elif settings.llm_backend == "stub":
+        backend = StubBackend.from_settings()
+    else:
+        raise ValueError(f"Unknown llm_backend {settings.llm_backend!r}")
+    if settings.llm_record_path:
+        backend = RecordingBackend(backend, settings.llm_record_path)
+    return backend
+
+
+class GeminiService:
+    """Service for interacting with Google Gemini API
+    
+    Meant to be created once per app: the backend (by default the Gemini
+    client and its HTTP connection pool) is reused by every request.
+    Concurrency limits, retries, context caching and accounting apply
+    whichever backend answers.
+    """
+    
+    def __init__(self, backend: Optional[LLMBackend] = None):
+        self.backend = backend if backend is not None else create_backend()
+        # Bounds the Gemini calls in flight from this worker
+        self._semaphore = asyncio.Semaphore(settings.gemini_max_concurrency)
+        self._retry = RetryPolicy(
+            max_attempts=settings.gemini_retry_attempts,
+            backoff_base=settings.gemini_retry_backoff_base,
+            backoff_max=settings.gemini_retry_backoff_max,
+            timeout=settings.gemini_deadline,
+            retryable=is_retryable,
+            name="Gemini",
+        )
+        self.context_cache = self._context_cache()
+        self.calls = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.in_flight = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+    
+    def _context_cache(self) -> Optional[ContextCache]:
+        """Prompt prefix cache per the gemini_context_cache setting
         
-        # Set the API key for the Google client (it expects GEMINI_API_KEY)
-        os.environ["GEMINI_API_KEY"] = settings.gemini_key
-        self.client = genai.Client()
+        Backends without provider-side caching get the local stand-in. The
+        provider would reject its names, so "local" is refused for backends
+        with caching.
+        """
+        if settings.gemini_context_cache == "gemini" and self.backend.supports_context_cache:
+            return ContextCache(
+                client=lambda: self.client,
+                model=self.backend.model,
+                ttl=settings.gemini_context_cache_ttl,
+                min_tokens=settings.gemini_context_cache_min_tokens,
+            )
+        if settings.gemini_context_cache == "local" and self.backend.supports_context_cache:
+            raise ValueError(
+                f"gemini_context_cache 'local' cannot be used with the {self.backend.name} backend, "
+                "which would be sent names it does not know; use 'gemini' or 'off'"
+            )
+        if settings.gemini_context_cache in ("gemini", "local"):
+            return LocalContextCache(ttl=settings.gemini_context_cache_ttl)
+        if settings.gemini_context_cache == "off":
+            return None
+        raise ValueError(f"Unknown gemini_context_cache {settings.gemini_context_cache!r}")
+    
+    @property
+    def client(self) -> genai.Client:
+        """The Gemini client of a Gemini backend"""
+        return self.backend.client
+    
+    @staticmethod
+    def _config(
+        response_schema: Optional[Type[BaseModel]] = None,
+        cached_content: Optional[str] = None,
+    ) -> types.GenerateContentConfig:
+        """Generation config; with a response schema the model is constrained to JSON matching it"""
+        if response_schema is None:
+            return types.GenerateContentConfig(max_output_tokens=10000, cached_content=cached_content)
+        return types.GenerateContentConfig(
+            max_output_tokens=10000,
+            response_mime_type="application/json",
+            response_schema=response_schema,
+            cached_content=cached_content,
+        )
+    
+    async def _contents(self, content: str, prefix: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Prompt to send and cached content to reference: the prefix goes
+        through the context cache when it can, inline otherwise"""
+        if prefix is None:
+            return content, None
+        cached_content = None if self.context_cache is None else await self.context_cache.name_for(prefix)
+        if cached_content is None:
+            return prefix + content, None
+        return content, cached_content
+    
+    def _record_usage(self, usage: Any) -> None:
+        """Account prompt tokens, and those billed at the cached rate"""
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_token_count or 0
+        self.cached_prompt_tokens += usage.cached_content_token_count or 0
     
-    @retry_on_null_response(max_retries=3, delay=0.5)
-    async def generate_response(self, messages: List[Dict]) -> str:
+    async def generate_response(
+        self,
+        messages: List[Dict],
+        response_schema: Optional[Type[BaseModel]] = None,
+        prefix: Optional[str] = None,
+    ) -> str:
         """
         Generate response using Gemini API
+        
+        Uses the SDK's asyncio client so the event loop keeps serving other
+        requests while the model generates. With `response_schema` the
+        response is JSON constrained to that pydantic model's schema.
+        
+        `prefix` is a static start of the prompt, shared by many requests:
+        it is sent as cached content when the context cache has it.
+        
+        Empty responses, timeouts and rate limit/server errors are retried
+        per the retry policy, within the gemini_deadline budget and the
+        deadline of the request being served.
+        
+        Raises:
+            DeadlineExceededError: If the budget runs out
         """
         content = messages[-1].get("content", "") if messages else ""
+        return await self._retry.call(lambda: self._generate(content, response_schema, prefix))
+    
+    async def _generate(
+        self,
+        content: str,
+        response_schema: Optional[Type[BaseModel]],
+        prefix: Optional[str],
+    ) -> str:
+        """One generate call"""
+        contents, cached_content = await self._contents(content, prefix)
+        try:
+            response = await self._send(contents, response_schema, cached_content)
+        except errors.ClientError as e:
+            # Anything else, e.g. 429, is for the retry policy
+            if cached_content is None or not is_cached_content_missing(e):
+                raise
+            # The cached content expired or was deleted on the provider side
+            self.context_cache.invalidate(prefix)
+            response = await self._send(prefix + content, response_schema, None)
         
-        response = self.client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=content,
-            config=types.GenerateContentConfig(
-                max_output_tokens=10000,
-            ),
-        )
-        
+        self._record_usage(getattr(response, "usage_metadata", None))
+        if not response.text or not response.text.strip():
+            raise EmptyResponseError("Gemini returned an empty response")
         return response.text
+    
+    async def _send(
+        self,
+        contents: str,
+        response_schema: Optional[Type[BaseModel]],
+        cached_content: Optional[str],
+    ) -> Any:
+        async with self._semaphore:
+            self.calls += 1
+            self.in_flight += 1
+            try:
+                return await self.backend.generate(contents, self._config(response_schema, cached_content))
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.in_flight -= 1
+    
+    async def generate_response_stream(
+        self,
+        messages: List[Dict],
+        response_schema: Optional[Type[BaseModel]] = None,
+        prefix: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a response using the streaming API, yielding text as
+        it is produced (`prefix` as for generate_response)
+        
+        Not retried: text already yielded cannot be taken back.
+        """
+        content = messages[-1].get("content", "") if messages else ""
+        contents, cached_content = await self._contents(content, prefix)
+        
+        async with self._semaphore:
+            self.calls += 1
+            self.in_flight += 1
+            usage = None
+            try:
+                stream = self.backend.generate_stream(contents, self._config(response_schema, cached_content))
+                async for chunk in stream:
+                    # Usage is reported (cumulatively) with the last chunks
+                    usage = getattr(chunk, "usage_metadata", None) or usage
+                    if chunk.text:
+                        yield chunk.text
+                self._record_usage(usage)
+            except (asyncio.CancelledError, GeneratorExit):
+                # Cancelled, or the consumer stopped reading (client gone)
+                self.cancelled += 1
+                raise
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.in_flight -= 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Backend (e.g. client reuse and connection pool) and call statistics for monitoring"""
+        return {
+            **self.backend.stats(),
+            "calls": self.calls,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+            "retry": self._retry.stats(),
+            "prompt_tokens": self.prompt_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
+            "cached_prompt_tokens_per_call": self.cached_prompt_tokens / max(self.calls, 1),
+            "context_cache": None if self.context_cache is None else self.context_cache.stats(),
+        }
+    
+    async def close(self) -> None:
+        """Delete context caches, close the backend (Gemini client and its pooled connections)"""
+        if self.context_cache is not None:
+            await self.context_cache.close()
+        await self.backend.close()
+
+
+# Dependency function to get the shared Gemini service
+def get_gemini_service(request: Request) -> GeminiService:
+    """Dependency function to get the app-scoped Gemini service created at startup"""
+    if settings.llm_backend == "gemini" and not settings.gemini_key:
+        raise HTTPException(status_code=500, detail="GEMINI_KEY environment variable is required")
+    return request.app.state.gemini_service
@@ -0,0 +1,109 @@
+"""
+Interface of the text generation backends GeminiService sends its calls to
+"""
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+
+from google.genai import errors, types
+
+
+class LLMBackend(ABC):
+    """A model answering generate calls, streamed or not.
+
+    Responses have the shape of Gemini's GenerateContentResponse: a `text`
+    and, optionally, `usage_metadata`. Errors are raised as
+    `google.genai.errors.APIError` so retry classification does not depend
+    on the backend.
+    """
+
+    name = "llm"
+    model = "unknown"
+    # Whether the backend can create provider-side cached contents
+    supports_context_cache = False
+
+    @abstractmethod
+    async def generate(self, contents: str, config: types.GenerateContentConfig) -> Any:
+        """One response to the prompt"""
+
+    @abstractmethod
+    async def generate_stream(self, contents: str, config: types.GenerateContentConfig) -> AsyncIterator[Any]:
+        """The response to the prompt in chunks, as it is generated"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "model": self.model}
+
+    async def close(self) -> None:
+        pass
+
+
+class Recording(NamedTuple):
+    """A response as seen from the client: its text, or the error status it failed with, and latency"""
+
+    text: Optional[str]
+    latency: float
+    status: Optional[int] = None
+
+    def to_json(self) -> str:
+        return json.dumps(self._asdict())
+
+
+def load_recordings(path: str) -> List[Recording]:
+    """Recordings from a JSONL file as written by RecordingBackend"""
+    with open(path, encoding="utf-8") as f:
+        return [Recording(**json.loads(line)) for line in f if line.strip()]
+
+
+class RecordingBackend(LLMBackend):
+    """Wraps a backend, appending every response it gives to a JSONL file.
+
+    The file is what StubBackend replays, so the stub answers with real
+    responses and, for the "recorded" latency distribution, real latencies.
+    """
+
+    def __init__(self, backend: LLMBackend, path: str):
+        self.backend = backend
+        self.path = Path(path)
+        self.name = backend.name
+        self.model = backend.model
+        self.supports_context_cache = backend.supports_context_cache
+        self.recorded = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # e.g. GeminiBackend.client, for the context cache
+        return getattr(self.backend, name)
+
+    def _record(self, recording: Recording) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(recording.to_json() + "\n")
+        self.recorded += 1
+
+    async def generate(self, contents: str, config: types.GenerateContentConfig) -> Any:
+        started = time.monotonic()
+        try:
+            response = await self.backend.generate(contents, config)
+        except errors.APIError as e:
+            self._record(Recording(None, time.monotonic() - started, e.code))
+            raise
+        self._record(Recording(response.text or "", time.monotonic() - started))
+        return response
+
+    async def generate_stream(self, contents: str, config: types.GenerateContentConfig) -> AsyncIterator[Any]:
+        started = time.monotonic()
+        text: List[str] = []
+        try:
+            async for chunk in self.backend.generate_stream(contents, config):
+                text.append(chunk.text or "")
+                yield chunk
+        except errors.APIError as e:
+            self._record(Recording(None, time.monotonic() - started, e.code))
+            raise
+        self._record(Recording("".join(text), time.monotonic() - started))
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.backend.stats(), "recorded": self.recorded}
+
+    async def close(self) -> None:
+        await self.backend.close()
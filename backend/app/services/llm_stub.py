@@ -0,0 +1,282 @@
+"""
+Offline stand-in for the Gemini API replaying recorded responses, for load testing
+
+Use it in-process (LLM_BACKEND=stub) or as a server speaking Gemini's REST
+API, so the real client, connection pool and retries are exercised too:
+
+    python -m app.services.llm_stub --port 8090 --recordings recordings.jsonl --error-rate 0.05
+
+and run the backend with GEMINI_BASE_URL=http://localhost:8090 and any GEMINI_KEY.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from google.genai import errors, types
+
+from app.core.config import settings
+from app.services.chunking import estimate_tokens
+from app.services.llm import LLMBackend, Recording, load_recordings
+
+# Answered when no recordings are given
+DEFAULT_RECORDING = Recording(
+    text=json.dumps({
+        "diagnosis": "Plantar fasciitis",
+        "conditions": [],
+        "symptoms": ["heel pain", "morning foot pain"],
+        "medications": ["ibuprofen"],
+        "age": None,
+        "gender": None,
+        "medical_history": [],
+        "interventions": ["stretching", "custom orthotics", "night splint"],
+        "keywords": ["plantar fasciitis", "heel pain", "foot pain"],
+    }),
+    latency=1.5,
+)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "lognormal", "recorded")
+
+# Gemini's error status names, for the REST server
+_STATUS_NAMES = {
+    400: "INVALID_ARGUMENT",
+    408: "DEADLINE_EXCEEDED",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+    504: "DEADLINE_EXCEEDED",
+}
+
+
+class StubBackend(LLMBackend):
+    """Replays recorded responses in order, with simulated latency and failures.
+
+    :param latency: "fixed" (always `latency_median`), "lognormal" (median
+        `latency_median`, shape `latency_sigma`) or "recorded" (the latency of
+        the replayed recording).
+    :param empty_rate: share of calls answered with an empty text.
+    :param error_rate: share of calls failing with `error_status`; recorded
+        errors are replayed as well.
+    :param seed: makes latencies and failures reproducible.
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        recordings: Optional[List[Recording]] = None,
+        latency: str = "lognormal",
+        latency_median: float = 1.5,
+        latency_sigma: float = 0.5,
+        empty_rate: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        chunk_size: int = 64,
+        seed: Optional[int] = None,
+        model: str = "stub",
+    ):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {latency!r}, expected one of {LATENCY_DISTRIBUTIONS}")
+        self.recordings = recordings or [DEFAULT_RECORDING]
+        self._replay = itertools.cycle(self.recordings)
+        self.latency = latency
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.empty_rate = empty_rate
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.chunk_size = chunk_size
+        self.model = model
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.empty_responses = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls) -> "StubBackend":
+        """Stub configured by the llm_stub_* settings"""
+        path = settings.llm_stub_recordings_path
+        return cls(
+            recordings=load_recordings(path) if path else None,
+            latency=settings.llm_stub_latency,
+            latency_median=settings.llm_stub_latency_median,
+            latency_sigma=settings.llm_stub_latency_sigma,
+            empty_rate=settings.llm_stub_empty_rate,
+            error_rate=settings.llm_stub_error_rate,
+            error_status=settings.llm_stub_error_status,
+            seed=settings.llm_stub_seed,
+        )
+
+    def _delay(self, recording: Recording) -> float:
+        if self.latency == "recorded":
+            return recording.latency
+        if self.latency == "lognormal":
+            return self._random.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+        return self.latency_median
+
+    def _next(self) -> Recording:
+        """The recording to answer with, after the simulated failures"""
+        self.calls += 1
+        recording = next(self._replay)
+        roll = self._random.random()
+        if roll < self.error_rate:
+            recording = recording._replace(text=None, status=self.error_status)
+        elif roll < self.error_rate + self.empty_rate:
+            recording = recording._replace(text="", status=None)
+        if recording.status is not None:
+            self.errors += 1
+        elif not recording.text:
+            self.empty_responses += 1
+        return recording
+
+    def _error(self, status: int) -> errors.APIError:
+        body = {"error": {"code": status, "message": "Stub failure", "status": _STATUS_NAMES.get(status, "UNKNOWN")}}
+        return errors.ClientError(status, body) if status < 500 else errors.ServerError(status, body)
+
+    @staticmethod
+    def _response(text: str, contents: str) -> types.GenerateContentResponse:
+        prompt_tokens = estimate_tokens(contents)
+        text_tokens = estimate_tokens(text)
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(
+                content=types.Content(parts=[types.Part(text=text)], role="model"),
+                finish_reason="STOP",
+            )],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=text_tokens,
+                total_token_count=prompt_tokens + text_tokens,
+            ),
+        )
+
+    async def generate(self, contents: str, config: Optional[types.GenerateContentConfig] = None) -> Any:
+        recording = self._next()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay(recording))
+        finally:
+            self.in_flight -= 1
+        if recording.status is not None:
+            raise self._error(recording.status)
+        return self._response(recording.text, contents)
+
+    async def generate_stream(
+        self,
+        contents: str,
+        config: Optional[types.GenerateContentConfig] = None,
+    ) -> AsyncIterator[Any]:
+        recording = self._next()
+        text = recording.text or ""
+        pieces = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)] or [""]
+        delay = self._delay(recording) / len(pieces)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if recording.status is not None:
+                await asyncio.sleep(delay)
+                raise self._error(recording.status)
+            for piece in pieces:
+                await asyncio.sleep(delay)
+                yield self._response(piece, contents)
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "recordings": len(self.recordings),
+            "stub_calls": self.calls,
+            "stub_in_flight": self.in_flight,
+            "stub_max_in_flight": self.max_in_flight,
+            "stub_empty_responses": self.empty_responses,
+            "stub_errors": self.errors,
+        }
+
+
+def _prompt_text(body: Dict[str, Any]) -> str:
+    return "".join(
+        part.get("text", "")
+        for content in body.get("contents", [])
+        for part in content.get("parts", [])
+    )
+
+
+def create_stub_app(backend: StubBackend) -> FastAPI:
+    """App answering Gemini's generateContent and streamGenerateContent calls from the stub"""
+    app = FastAPI(title="Gemini stub")
+
+    def dump(response: types.GenerateContentResponse) -> Dict[str, Any]:
+        return response.model_dump(mode="json", exclude_none=True, by_alias=True)
+
+    @app.post("/{version}/models/{model_method}")
+    async def generate(version: str, model_method: str, request: Request):
+        method = model_method.rpartition(":")[2]
+        contents = _prompt_text(await request.json())
+        if method == "generateContent":
+            try:
+                response = await backend.generate(contents)
+            except errors.APIError as e:
+                return JSONResponse(e.details, status_code=e.code)
+            return dump(response)
+        if method == "streamGenerateContent":
+            chunks = backend.generate_stream(contents)
+            try:
+                # Fail before the stream starts, as Gemini does
+                first = await chunks.__anext__()
+            except errors.APIError as e:
+                return JSONResponse(e.details, status_code=e.code)
+
+            async def events():
+                yield b"data: " + json.dumps(dump(first)).encode() + b"\r\n\r\n"
+                async for chunk in chunks:
+                    yield b"data: " + json.dumps(dump(chunk)).encode() + b"\r\n\r\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+        return JSONResponse({"error": {"code": 404, "message": f"Unknown method {method}"}}, status_code=404)
+
+    @app.get("/stats")
+    async def stats():
+        return backend.stats()
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--recordings", help="JSONL file written with LLM_RECORD_PATH")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-median", type=float, default=1.5)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--empty-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    backend = StubBackend(
+        recordings=load_recordings(args.recordings) if args.recordings else None,
+        latency=args.latency,
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        empty_rate=args.empty_rate,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    uvicorn.run(create_stub_app(backend), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Provider-side caching of static prompt prefixes (Gemini context caching)
+"""
+import hashlib
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from google.genai import errors, types
+
+from app.core.retry import RETRYABLE_STATUSES
+from app.core.singleflight import SingleFlight
+from app.services.chunking import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ContextCache:
+    """Gemini cached contents for prompt prefixes sent with every request.
+
+    `name_for(prefix)` returns the name of a cached content holding the
+    prefix, creating it on first use; requests then send only the rest of
+    the prompt and pay the reduced cached-token rate for the prefix. Returns
+    None, and the caller sends the prefix inline, when the prefix is below
+    the provider's minimum size or the cache could not be created. A
+    prefix the provider refuses (a 4xx such as too small or unsupported)
+    is never tried again; after other failures (timeouts, 429, 5xx) it is
+    tried again once `RETRY_AFTER` seconds have passed.
+
+    :param client: returns the genai.Client to create caches with.
+    :param ttl: seconds a cached content lives; it is recreated shortly
+        before it expires.
+    :param min_tokens: smallest prefix Gemini accepts for caching.
+    """
+
+    # recreate caches this many seconds before they expire
+    REFRESH_MARGIN = 60
+    # seconds to send a prefix inline after its cache failed to be created
+    RETRY_AFTER = 60
+
+    def __init__(self, client: Callable[[], Any], model: str, ttl: int, min_tokens: int):
+        self._client = client
+        self.model = model
+        self.ttl = ttl
+        self.min_tokens = min_tokens
+        self._names: Dict[str, str] = {}
+        self._expires: Dict[str, float] = {}
+        self._uncacheable: set = set()
+        self._retry_at: Dict[str, float] = {}
+        self._single_flight = SingleFlight()
+        self.created = 0
+        self.hits = 0
+        self.too_small = 0
+        self.failures = 0
+
+    @staticmethod
+    def _key(prefix: str) -> str:
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+    async def name_for(self, prefix: str) -> Optional[str]:
+        """Cached content name for a prefix, None if it is to be sent inline"""
+        key = self._key(prefix)
+        if key in self._uncacheable or self._retry_at.get(key, 0) > time.monotonic():
+            return None
+        if key in self._names and self._expires[key] - time.monotonic() > self.REFRESH_MARGIN:
+            self.hits += 1
+            return self._names[key]
+        if estimate_tokens(prefix) < self.min_tokens:
+            self.too_small += 1
+            self._uncacheable.add(key)
+            return None
+        return await self._single_flight.do(key, lambda: self._create(key, prefix))
+
+    async def _create(self, key: str, prefix: str) -> Optional[str]:
+        try:
+            cached = await self._client().aio.caches.create(
+                model=self.model,
+                config=types.CreateCachedContentConfig(contents=[prefix], ttl=f"{self.ttl}s"),
+            )
+        except Exception as e:
+            self.failures += 1
+            if isinstance(e, errors.ClientError) and e.code not in RETRYABLE_STATUSES:
+                # Typically a prefix below the model's minimum; do not try again
+                logger.warning(f"Gemini refused to cache the prompt prefix, sending it inline: {e}")
+                self._uncacheable.add(key)
+            else:
+                logger.warning(
+                    f"Could not create Gemini context cache, sending prompt prefix inline for {self.RETRY_AFTER} s: {e}"
+                )
+                self._retry_at[key] = time.monotonic() + self.RETRY_AFTER
+            return None
+        self._retry_at.pop(key, None)
+        self.created += 1
+        self._names[key] = cached.name
+        self._expires[key] = time.monotonic() + self.ttl
+        return cached.name
+
+    def invalidate(self, prefix: str) -> None:
+        """Forget a cached content the provider no longer knows (e.g. deleted)"""
+        key = self._key(prefix)
+        self._names.pop(key, None)
+        self._expires.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "created": self.created,
+            "hits": self.hits,
+            "too_small": self.too_small,
+            "failures": self.failures,
+            "cached_prefixes": len(self._names),
+        }
+
+    async def close(self) -> None:
+        """Delete the cached contents instead of paying storage until they expire"""
+        for name in list(self._names.values()):
+            try:
+                await self._client().aio.caches.delete(name=name)
+            except Exception as e:
+                logger.warning(f"Could not delete Gemini context cache {name}: {e}")
+        self._names.clear()
+        self._expires.clear()
+
+
+class LocalContextCache(ContextCache):
+    """In-process stand-in for Gemini context caching, for tests and offline runs.
+
+    Hands out names without calling the provider (and without a minimum
+    size) and keeps the prefixes, so a stub model can resolve
+    `config.cached_content` back to the prompt prefix.
+    """
+
+    def __init__(self, ttl: int = 3600):
+        super().__init__(client=lambda: None, model="local", ttl=ttl, min_tokens=0)
+        self.prefixes: Dict[str, str] = {}
+
+    async def _create(self, key: str, prefix: str) -> Optional[str]:
+        name = f"cachedContents/local-{key[:16]}"
+        self.created += 1
+        self.prefixes[name] = prefix
+        self._names[key] = name
+        self._expires[key] = time.monotonic() + self.ttl
+        return name
+
+    async def close(self) -> None:
+        self._names.clear()
+        self._expires.clear()
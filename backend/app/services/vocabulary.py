@@ -0,0 +1,188 @@
+"""
+Medical vocabulary of the local fast-path extractor: canonical term -> other spellings
+"""
+from typing import Dict, List
+
+CONDITIONS: Dict[str, List[str]] = {
+    "Plantar fasciitis": ["plantar fasciitis", "plantar fasciopathy"],
+    "Achilles tendinitis": ["achilles tendinitis", "achilles tendonitis", "achilles tendinopathy"],
+    "Heel spur": ["heel spur", "heel spurs", "calcaneal spur"],
+    "Gout": ["gout", "gouty arthritis"],
+    "Osteoarthritis": ["osteoarthritis", "degenerative joint disease"],
+    "Rheumatoid arthritis": ["rheumatoid arthritis"],
+    "Psoriatic arthritis": ["psoriatic arthritis"],
+    "Osteoporosis": ["osteoporosis"],
+    "Fibromyalgia": ["fibromyalgia"],
+    "Carpal tunnel syndrome": ["carpal tunnel syndrome", "carpal tunnel"],
+    "Sciatica": ["sciatica"],
+    "Herniated disc": ["herniated disc", "herniated disk", "slipped disc", "disc herniation"],
+    "Low back pain": ["low back pain", "lower back pain", "lumbago"],
+    "Migraine": ["migraine", "migraines"],
+    "Tension headache": ["tension headache", "tension headaches"],
+    "Epilepsy": ["epilepsy", "seizure disorder"],
+    "Multiple sclerosis": ["multiple sclerosis"],
+    "Parkinson's disease": ["parkinson's disease", "parkinsons disease", "parkinson's", "parkinsons"],
+    "Alzheimer's disease": ["alzheimer's disease", "alzheimers disease", "alzheimer's", "alzheimers"],
+    "Stroke": ["stroke", "cerebrovascular accident"],
+    "Hypertension": ["hypertension", "high blood pressure"],
+    "Hyperlipidemia": ["hyperlipidemia", "high cholesterol", "dyslipidemia"],
+    "Coronary artery disease": ["coronary artery disease", "coronary heart disease"],
+    "Heart failure": ["heart failure", "congestive heart failure"],
+    "Atrial fibrillation": ["atrial fibrillation", "afib", "a-fib"],
+    "Type 2 diabetes": ["type 2 diabetes", "type ii diabetes", "diabetes mellitus type 2", "type 2 diabetes mellitus"],
+    "Type 1 diabetes": ["type 1 diabetes", "type i diabetes", "diabetes mellitus type 1", "type 1 diabetes mellitus"],
+    "Diabetes": ["diabetes", "diabetes mellitus"],
+    "Prediabetes": ["prediabetes", "pre-diabetes"],
+    "Obesity": ["obesity"],
+    "Hypothyroidism": ["hypothyroidism", "underactive thyroid"],
+    "Hyperthyroidism": ["hyperthyroidism", "overactive thyroid", "graves disease", "graves' disease"],
+    "Chronic kidney disease": ["chronic kidney disease", "ckd"],
+    "Asthma": ["asthma"],
+    "COPD": ["copd", "chronic obstructive pulmonary disease", "emphysema"],
+    "Pneumonia": ["pneumonia"],
+    "Bronchitis": ["bronchitis"],
+    "Sleep apnea": ["sleep apnea", "obstructive sleep apnea"],
+    "GERD": ["gerd", "acid reflux", "gastroesophageal reflux disease"],
+    "Irritable bowel syndrome": ["irritable bowel syndrome", "ibs"],
+    "Crohn's disease": ["crohn's disease", "crohns disease", "crohn's"],
+    "Ulcerative colitis": ["ulcerative colitis"],
+    "Celiac disease": ["celiac disease", "coeliac disease"],
+    "Cirrhosis": ["cirrhosis"],
+    "Hepatitis C": ["hepatitis c", "hep c"],
+    "HIV": ["hiv", "human immunodeficiency virus"],
+    "Depression": ["depression", "major depressive disorder"],
+    "Anxiety": ["anxiety", "generalized anxiety disorder"],
+    "Bipolar disorder": ["bipolar disorder"],
+    "Schizophrenia": ["schizophrenia"],
+    "PTSD": ["ptsd", "post-traumatic stress disorder", "post traumatic stress disorder"],
+    "ADHD": ["adhd", "attention deficit hyperactivity disorder"],
+    "Insomnia": ["insomnia"],
+    "Psoriasis": ["psoriasis"],
+    "Eczema": ["eczema", "atopic dermatitis"],
+    "Breast cancer": ["breast cancer"],
+    "Prostate cancer": ["prostate cancer"],
+    "Lung cancer": ["lung cancer", "non-small cell lung cancer", "small cell lung cancer"],
+    "Colorectal cancer": ["colorectal cancer", "colon cancer", "rectal cancer"],
+    "Melanoma": ["melanoma"],
+    "Lymphoma": ["lymphoma"],
+    "Leukemia": ["leukemia"],
+    "Anemia": ["anemia", "anaemia"],
+    "Urinary tract infection": ["urinary tract infection", "uti"],
+    "Glaucoma": ["glaucoma"],
+    "Macular degeneration": ["macular degeneration"],
+}
+
+MEDICATIONS: Dict[str, List[str]] = {
+    "Ibuprofen": ["ibuprofen", "advil", "motrin"],
+    "Naproxen": ["naproxen", "aleve"],
+    "Acetaminophen": ["acetaminophen", "tylenol", "paracetamol"],
+    "Aspirin": ["aspirin"],
+    "Celecoxib": ["celecoxib", "celebrex"],
+    "Meloxicam": ["meloxicam"],
+    "Prednisone": ["prednisone"],
+    "Cortisone": ["cortisone", "cortisone shot", "steroid injection"],
+    "Gabapentin": ["gabapentin", "neurontin"],
+    "Pregabalin": ["pregabalin", "lyrica"],
+    "Tramadol": ["tramadol"],
+    "Oxycodone": ["oxycodone"],
+    "Cyclobenzaprine": ["cyclobenzaprine", "flexeril"],
+    "Metformin": ["metformin"],
+    "Insulin": ["insulin"],
+    "Semaglutide": ["semaglutide", "ozempic", "wegovy"],
+    "Lisinopril": ["lisinopril"],
+    "Losartan": ["losartan"],
+    "Amlodipine": ["amlodipine"],
+    "Hydrochlorothiazide": ["hydrochlorothiazide", "hctz"],
+    "Metoprolol": ["metoprolol"],
+    "Atorvastatin": ["atorvastatin", "lipitor"],
+    "Rosuvastatin": ["rosuvastatin", "crestor"],
+    "Simvastatin": ["simvastatin"],
+    "Warfarin": ["warfarin", "coumadin"],
+    "Apixaban": ["apixaban", "eliquis"],
+    "Clopidogrel": ["clopidogrel", "plavix"],
+    "Levothyroxine": ["levothyroxine", "synthroid"],
+    "Omeprazole": ["omeprazole", "prilosec"],
+    "Pantoprazole": ["pantoprazole"],
+    "Albuterol": ["albuterol", "ventolin"],
+    "Fluticasone": ["fluticasone", "flonase"],
+    "Montelukast": ["montelukast", "singulair"],
+    "Sertraline": ["sertraline", "zoloft"],
+    "Fluoxetine": ["fluoxetine", "prozac"],
+    "Escitalopram": ["escitalopram", "lexapro"],
+    "Bupropion": ["bupropion", "wellbutrin"],
+    "Alprazolam": ["alprazolam", "xanax"],
+    "Methotrexate": ["methotrexate"],
+    "Allopurinol": ["allopurinol"],
+    "Colchicine": ["colchicine"],
+    "Sumatriptan": ["sumatriptan", "imitrex"],
+    "Amoxicillin": ["amoxicillin"],
+    "Azithromycin": ["azithromycin", "z-pack", "zpack"],
+}
+
+SYMPTOMS: Dict[str, List[str]] = {
+    "Heel pain": ["heel pain", "pain in my heel", "pain in the heel"],
+    "Foot pain": ["foot pain", "pain in my foot"],
+    "Back pain": ["back pain"],
+    "Joint pain": ["joint pain", "joint pains"],
+    "Knee pain": ["knee pain"],
+    "Chest pain": ["chest pain"],
+    "Abdominal pain": ["abdominal pain", "stomach pain", "stomach ache", "stomachache"],
+    "Headache": ["headache", "headaches"],
+    "Stiffness": ["stiffness", "stiff"],
+    "Swelling": ["swelling", "swollen"],
+    "Tenderness": ["tenderness", "tender"],
+    "Numbness": ["numbness", "numb"],
+    "Tingling": ["tingling", "pins and needles"],
+    "Weakness": ["weakness"],
+    "Fatigue": ["fatigue", "tiredness", "exhaustion"],
+    "Fever": ["fever", "fevers"],
+    "Chills": ["chills"],
+    "Cough": ["cough", "coughing"],
+    "Shortness of breath": ["shortness of breath", "short of breath", "breathlessness"],
+    "Wheezing": ["wheezing"],
+    "Nausea": ["nausea", "nauseous"],
+    "Vomiting": ["vomiting", "throwing up"],
+    "Diarrhea": ["diarrhea"],
+    "Constipation": ["constipation", "constipated"],
+    "Heartburn": ["heartburn"],
+    "Dizziness": ["dizziness", "dizzy", "lightheaded"],
+    "Palpitations": ["palpitations"],
+    "Rash": ["rash"],
+    "Itching": ["itching", "itchy"],
+    "Weight loss": ["weight loss", "losing weight"],
+    "Weight gain": ["weight gain", "gaining weight"],
+    "Insomnia": ["trouble sleeping", "can't sleep"],
+    "Blurred vision": ["blurred vision", "blurry vision"],
+    "Frequent urination": ["frequent urination"],
+    "Excessive thirst": ["excessive thirst"],
+    "Memory loss": ["memory loss", "forgetfulness"],
+    "Tremor": ["tremor", "tremors", "shaking"],
+    "Seizures": ["seizure", "seizures"],
+    "Anxiety": ["anxious", "panic attacks"],
+    "Low mood": ["low mood", "feeling down"],
+}
+
+INTERVENTIONS: Dict[str, List[str]] = {
+    "Physical therapy": ["physical therapy", "physical therapist", "physiotherapy", "pt sessions"],
+    "Stretching": ["stretching", "stretches"],
+    "Ice": ["ice", "icing"],
+    "Custom orthotics": ["custom orthotics", "orthotics", "custom-made inserts", "custom inserts"],
+    "Shoe inserts": ["inserts", "insoles", "over the counter inserts"],
+    "Night splint": ["night splint", "night splints"],
+    "Brace": ["brace", "bracing"],
+    "Corticosteroid injection": ["corticosteroid injection", "steroid shot", "cortisone injection"],
+    "Surgery": ["surgery", "operation"],
+    "Chemotherapy": ["chemotherapy", "chemo"],
+    "Radiation therapy": ["radiation therapy", "radiotherapy"],
+    "Immunotherapy": ["immunotherapy"],
+    "Dialysis": ["dialysis"],
+    "Cognitive behavioral therapy": ["cognitive behavioral therapy", "cbt"],
+    "Counseling": ["counseling", "therapy sessions"],
+    "Diet changes": ["diet changes", "change your diet", "dietary changes"],
+    "Exercise": ["exercise", "exercises"],
+    "Weight loss program": ["weight loss program"],
+    "CPAP": ["cpap"],
+    "X-ray": ["x-ray", "xray", "x ray"],
+    "MRI": ["mri"],
+    "Blood test": ["blood test", "blood work", "bloodwork", "labs"],
+}
@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Test client running the app lifespan (startup/shutdown)"""
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def upstream(client):
+    """Route the app-scoped ClinicalTrials.gov client to an in-process handler.
+
+    Tests set `upstream.response` to the httpx.Response to return, or queue
+    several in `upstream.responses`; every request received is appended to
+    `upstream.requests`.
+    """
+    class Upstream:
+        response = httpx.Response(200, json={"studies": []})
+
+        def __init__(self):
+            self.responses = []
+            self.requests = []
+
+        def handler(self, request):
+            self.requests.append(request)
+            if self.responses:
+                return self.responses.pop(0)
+            return self.response
+
+    stub = Upstream()
+    rest_client = app.state.clinical_trials_service.api_client.rest_client
+    rest_client.client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+    return stub
+
+
+class SlowModels:
+    """Stands in for client.aio.models; each call takes `delay` seconds.
+
+    Calls answer `text`, or the next of the texts queued in `responses`;
+    streamed calls yield it in `chunk_size` pieces spread over `delay`. The
+    (contents, config) of every call is appended to `requests`.
+    """
+
+    def __init__(self, delay, text, chunk_size=8):
+        self.delay = delay
+        self.text = text
+        self.chunk_size = chunk_size
+        self.responses = []
+        self.requests = []
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _next_text(self, contents, config):
+        self.calls += 1
+        self.requests.append((contents, config))
+        return self.responses.pop(0) if self.responses else self.text
+
+    async def generate_content(self, model, contents, config=None):
+        text = self._next_text(contents, config)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(text=text)
+
+    async def generate_content_stream(self, model, contents, config=None):
+        text = self._next_text(contents, config)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+        async def stream():
+            for chunk in chunks:
+                await asyncio.sleep(self.delay / len(chunks))
+                yield SimpleNamespace(text=chunk)
+
+        return stream()
+
+
+@pytest.fixture
+def slow_gemini(monkeypatch):
+    """Replace genai.Client with a stub whose async calls are slow"""
+    models = SlowModels(delay=0.5, text='{"diagnosis": "Plantar fasciitis"}')
+
+    class StubClient:
+        created = []
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            self.aio = SimpleNamespace(models=models)
+            self.created.append(self)
+
+        def close(self):
+            pass
+
+    models.clients = StubClient.created
+
+    monkeypatch.setattr(settings, "gemini_key", "test-key")
+    monkeypatch.setattr("app.services.gemini.genai.Client", StubClient)
+    return models
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.core.config import settings
+
+
+def batch(client, transcripts):
+    response = client.post("/transcripts/extractions:batch", json={"transcripts": transcripts})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_results_stream_in_completion_order(slow_gemini, client):
+    async def generate_content(model, contents, config=None):
+        slow_gemini.calls += 1
+        # The transcript named "slow" finishes last
+        await asyncio.sleep(0.2 if "slow" in contents else 0.01)
+        return SimpleNamespace(text=json.dumps({"diagnosis": "slow" if "slow" in contents else "fast"}))
+
+    slow_gemini.generate_content = generate_content
+
+    results = batch(client, ["slow visit", "fast visit 1", "fast visit 2"])
+
+    assert [r["index"] for r in results][-1] == 0
+    assert sorted(r["index"] for r in results) == [0, 1, 2]
+    assert {r["index"]: r["extraction"]["diagnosis"] for r in results} == {0: "slow", 1: "fast", 2: "fast"}
+    assert all(r["success"] for r in results)
+
+
+def test_identical_transcripts_are_extracted_once(slow_gemini, client, monkeypatch):
+    monkeypatch.setattr(settings, "extraction_cache_enabled", False)
+    slow_gemini.delay = 0
+
+    results = batch(client, ["heel pain", "knee pain", " heel  pain"])
+
+    assert sorted(r["index"] for r in results) == [0, 1, 2]
+    assert slow_gemini.calls == 2
+
+
+def test_concurrency_is_bounded(slow_gemini, client, monkeypatch):
+    monkeypatch.setattr(settings, "extraction_batch_concurrency", 2)
+    slow_gemini.delay = 0.02
+
+    results = batch(client, [f"visit {i}" for i in range(6)])
+
+    assert len(results) == 6
+    assert slow_gemini.max_in_flight == 2
+
+
+def test_slow_items_time_out_without_failing_the_batch(slow_gemini, client, monkeypatch):
+    monkeypatch.setattr(settings, "extraction_batch_item_timeout", 0.3)
+
+    async def generate_content(model, contents, config=None):
+        await asyncio.sleep(1 if "slow" in contents else 0)
+        return SimpleNamespace(text='{"diagnosis": "Plantar fasciitis"}')
+
+    slow_gemini.generate_content = generate_content
+
+    results = {r["index"]: r for r in batch(client, ["slow visit", "heel pain"])}
+
+    assert results[0]["success"] is False
+    assert "timed out" in results[0]["message"]
+    assert results[0]["extraction"] is None
+    assert results[1]["extraction"]["diagnosis"] == "Plantar fasciitis"
+
+
+def test_oversized_batches_are_rejected(slow_gemini, client, monkeypatch):
+    monkeypatch.setattr(settings, "extraction_batch_max_items", 2)
+
+    response = client.post("/transcripts/extractions:batch", json={"transcripts": ["a", "b", "c"]})
+
+    assert response.status_code == 413
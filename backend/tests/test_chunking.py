@@ -0,0 +1,93 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.models.extraction import MedicalExtraction
+from app.services.chunking import chunk_transcript, estimate_tokens, merge_extractions, split_turns
+from app.services.extraction import TranscriptExtractionService
+from app.services.gemini import GeminiService
+
+TRANSCRIPT = "\n\n".join(
+    f"Doctor: Question {i} about the heel pain?\n\nPatient: Answer {i}, it hurts in the morning."
+    for i in range(40)
+)
+
+
+def test_chunks_are_cut_between_speaker_turns():
+    chunks = chunk_transcript(TRANSCRIPT, max_tokens=100, overlap_tokens=20)
+
+    assert len(chunks) > 1
+    turns = set(split_turns(TRANSCRIPT))
+    for chunk in chunks:
+        assert estimate_tokens(chunk) <= 100
+        assert all(turn in turns for turn in chunk.split("\n\n"))
+    # Every turn is in some chunk, in order
+    assert [t for t in split_turns(TRANSCRIPT) if not any(t in c for c in chunks)] == []
+
+
+def test_chunks_overlap_by_trailing_turns():
+    chunks = chunk_transcript(TRANSCRIPT, max_tokens=100, overlap_tokens=20)
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        last_turn = previous.split("\n\n")[-1]
+        assert chunk.startswith(last_turn)
+
+
+def test_long_turns_are_split_at_sentences():
+    monologue = "Patient: " + " ".join(f"Sentence number {i} about my foot." for i in range(50))
+
+    chunks = chunk_transcript(monologue, max_tokens=50, overlap_tokens=0)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+    assert all(chunk.endswith(".") for chunk in chunks)
+
+
+def test_merge_is_deterministic_and_deduplicated():
+    extractions = [
+        MedicalExtraction(diagnosis="Heel spur", symptoms=["heel pain"], keywords=["heel"]),
+        MedicalExtraction(diagnosis="Plantar fasciitis", symptoms=["Heel  pain", "stiffness"], age="45"),
+        MedicalExtraction(diagnosis="plantar fasciitis", conditions=["Plantar Fasciitis"], gender="male"),
+        MedicalExtraction(diagnosis="Unknown", age="46", keywords=["heel", "fascia"]),
+    ]
+
+    merged = merge_extractions(extractions)
+
+    assert merged == merge_extractions(list(extractions))
+    assert merged.diagnosis == "Plantar fasciitis"
+    assert merged.conditions == ["Heel spur"]
+    assert merged.symptoms == ["heel pain", "stiffness"]
+    assert merged.keywords == ["heel", "fascia"]
+    assert (merged.age, merged.gender) == ("45", "male")
+
+
+def test_long_transcripts_are_extracted_concurrently(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "extraction_chunk_tokens", 200)
+    monkeypatch.setattr(settings, "extraction_chunk_overlap_tokens", 20)
+    slow_gemini.delay = 0.2
+
+    async def generate_content(model, contents, config=None):
+        slow_gemini.calls += 1
+        slow_gemini.in_flight += 1
+        slow_gemini.max_in_flight = max(slow_gemini.max_in_flight, slow_gemini.in_flight)
+        await asyncio.sleep(slow_gemini.delay)
+        slow_gemini.in_flight -= 1
+        answer = contents.split("Answer ")[1].split(",")[0]
+        return SimpleNamespace(text=json.dumps({"diagnosis": "Plantar fasciitis", "keywords": [f"answer {answer}"]}))
+
+    slow_gemini.generate_content = generate_content
+    service = TranscriptExtractionService(GeminiService())
+
+    started = time.monotonic()
+    extraction = asyncio.run(service.extract_from_transcript(TRANSCRIPT))
+    elapsed = time.monotonic() - started
+
+    chunks = service.stats()["chunking"]["chunks"]
+    assert chunks > 1
+    assert slow_gemini.calls == chunks
+    assert slow_gemini.max_in_flight == chunks
+    assert elapsed < 2 * slow_gemini.delay
+    assert extraction.diagnosis == "Plantar fasciitis"
+    assert len(extraction.keywords) == chunks
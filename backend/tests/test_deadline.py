@@ -0,0 +1,112 @@
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.main import app, request_cancellations
+
+
+async def run_with_app(scenario):
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), \
+            httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await scenario(client)
+
+
+def test_request_past_its_deadline_is_cancelled(slow_gemini):
+    slow_gemini.delay = 1.0
+    exceeded = request_cancellations.deadline_exceeded
+
+    async def scenario(client):
+        started = time.monotonic()
+        response = await client.post(
+            "/transcripts/extractions",
+            json={"transcript": "heel pain"},
+            headers={"X-Request-Timeout": "0.2", "Origin": "http://localhost:3000"},
+        )
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(0)
+        return response, elapsed, (await client.get("/metrics")).json()
+
+    response, elapsed, metrics = asyncio.run(run_with_app(scenario))
+
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
+    # The browser may read the timeout
+    assert "access-control-allow-origin" in response.headers
+    assert elapsed < 0.5
+    assert metrics["requests"]["deadline_exceeded"] == exceeded + 1
+    assert metrics["gemini"]["cancelled"] == 1
+    assert metrics["gemini"]["retry"]["cancelled"] == 1
+    assert metrics["extraction"]["cancelled"]["extractions"] == 1
+    assert slow_gemini.in_flight == 0
+
+
+def test_client_disconnect_cancels_work(slow_gemini):
+    slow_gemini.delay = 1.0
+    body = json.dumps({"transcript": "heel pain"}).encode()
+    sent = []
+
+    async def receive():
+        if not sent:
+            sent.append(True)
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(0.1)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    async def scenario():
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/transcripts/extractions",
+            "raw_path": b"/transcripts/extractions",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/json"), (b"host", b"test")],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        async with app.router.lifespan_context(app):
+            started = time.monotonic()
+            await app(scope, receive, send)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(0)
+            return elapsed, app.state.extraction_service.stats(), app.state.gemini_service.stats()
+
+    disconnected = request_cancellations.disconnected
+    elapsed, extraction, gemini = asyncio.run(scenario())
+
+    assert elapsed < 0.5
+    assert request_cancellations.disconnected == disconnected + 1
+    assert sent == [True]  # nothing was sent to the departed client
+    assert extraction["cancelled"]["extractions"] == 1
+    # The shared extraction had no one left waiting for it
+    assert extraction["coalescing"]["abandoned"] == 1
+    assert gemini["cancelled"] == 1
+    assert slow_gemini.in_flight == 0
+
+
+def test_started_stream_outlives_the_deadline(slow_gemini):
+    slow_gemini.delay = 0.4
+    exceeded = request_cancellations.deadline_exceeded
+
+    async def scenario(client):
+        response = await client.post(
+            "/transcripts/extractions:stream",
+            json={"transcript": "heel pain"},
+            headers={"X-Request-Timeout": "0.2"},
+        )
+        return response, (await client.get("/metrics")).json()
+
+    response, metrics = asyncio.run(run_with_app(scenario))
+
+    assert response.status_code == 200
+    assert "event: extraction" in response.text
+    assert metrics["requests"]["deadline_exceeded"] == exceeded
+    assert metrics["gemini"]["cancelled"] == 0
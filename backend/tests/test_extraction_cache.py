@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+
+from app.models.extraction import MedicalExtraction
+from app.services.extraction import TranscriptExtractionService
+from app.services.extraction_cache import ExtractionCache
+from app.services.gemini import GeminiService
+
+
+def test_repeated_transcript_is_served_from_cache(slow_gemini, client):
+    slow_gemini.delay = 0
+
+    first = client.post("/transcripts/extractions", json={"transcript": "Heel pain\nfor two weeks"})
+    second = client.post("/transcripts/extractions", json={"transcript": "  Heel pain for   two weeks "})
+
+    assert first.json()["cached"] is False
+    assert second.json()["cached"] is True
+    assert second.json()["extraction"] == first.json()["extraction"]
+    assert slow_gemini.calls == 1
+    stats = client.get("/metrics").json()["extraction"]["cache"]
+    assert stats["memory_hits"] == 1
+    assert stats["stores"] == 1
+
+
+def test_failed_extractions_are_not_cached(slow_gemini, client):
+    slow_gemini.delay = 0
+    slow_gemini.text = "not json"
+
+    first = client.post("/transcripts/extractions", json={"transcript": "heel pain"})
+    slow_gemini.text = '{"diagnosis": "Plantar fasciitis"}'
+    second = client.post("/transcripts/extractions", json={"transcript": "heel pain"})
+
+    assert first.json()["extraction"]["diagnosis"] == "Unknown"
+    assert second.json()["extraction"]["diagnosis"] == "Plantar fasciitis"
+    assert second.json()["cached"] is False
+
+
+def test_concurrent_identical_transcripts_share_one_call(slow_gemini):
+    slow_gemini.delay = 0.05
+    service = TranscriptExtractionService(GeminiService(), ExtractionCache("v1", ttl=60, memory_bytes=1 << 20))
+
+    async def extract_all():
+        return await asyncio.gather(*(service.extract("heel pain") for _ in range(5)))
+
+    results = asyncio.run(extract_all())
+
+    assert [extraction.diagnosis for extraction, _ in results] == ["Plantar fasciitis"] * 5
+    assert service.stats()["coalescing"]["coalesced"] == 4
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = ExtractionCache("v1", ttl=60, memory_bytes=1 << 20)
+    key = cache.key("heel pain")
+    asyncio.run(cache.put(key, MedicalExtraction(diagnosis="Plantar fasciitis")))
+
+    assert asyncio.run(cache.get(key)).diagnosis == "Plantar fasciitis"
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert asyncio.run(cache.get(key)) is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_disk_tier_survives_restart_and_version_change_misses(tmp_path):
+    path = str(tmp_path / "extractions.sqlite")
+    cache = ExtractionCache("v1", ttl=60, memory_bytes=1 << 20, disk_path=path, disk_bytes=1 << 20)
+    asyncio.run(cache.put(cache.key("heel pain"), MedicalExtraction(diagnosis="Plantar fasciitis")))
+    cache.close()
+
+    restarted = ExtractionCache("v1", ttl=60, memory_bytes=1 << 20, disk_path=path, disk_bytes=1 << 20)
+    assert asyncio.run(restarted.get(restarted.key("heel pain"))).diagnosis == "Plantar fasciitis"
+    assert restarted.stats()["disk_hits"] == 1
+    restarted.close()
+
+    new_prompt = ExtractionCache("v2", ttl=60, memory_bytes=1 << 20, disk_path=path, disk_bytes=1 << 20)
+    assert asyncio.run(new_prompt.get(new_prompt.key("heel pain"))) is None
+    new_prompt.close()
+
+
+def test_disk_tier_is_used_off_the_event_loop(tmp_path, monkeypatch):
+    cache = ExtractionCache(
+        "v1", ttl=60, memory_bytes=1 << 20, disk_path=str(tmp_path / "extractions.sqlite"), disk_bytes=1 << 20
+    )
+    threads = []
+    for name in ["get", "put"]:
+        operation = getattr(cache.disk, name)
+
+        def record_thread(*args, operation=operation):
+            threads.append(threading.get_ident())
+            return operation(*args)
+
+        monkeypatch.setattr(cache.disk, name, record_thread)
+
+    async def put_and_get():
+        await cache.put(cache.key("heel pain"), MedicalExtraction(diagnosis="Plantar fasciitis"))
+        cache.memory.discard(cache.key("heel pain"))
+        return await cache.get(cache.key("heel pain")), threading.get_ident()
+
+    try:
+        extraction, loop_thread = asyncio.run(put_and_get())
+    finally:
+        cache.close()
+
+    assert extraction.diagnosis == "Plantar fasciitis"
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_prompt_version_tracks_schema(monkeypatch):
+    version = TranscriptExtractionService.prompt_version()
+    schema = TranscriptExtractionService._get_schema_example()
+    monkeypatch.setattr(
+        TranscriptExtractionService, "_get_schema_example", staticmethod(lambda: {**schema, "allergies": []})
+    )
+
+    assert TranscriptExtractionService.prompt_version() != version
@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+from app.services.extraction import TranscriptExtractionService
+from app.services.fast_path import FastPathExtractor
+from app.services.gemini import GeminiService
+
+STATED = (
+    "Doctor: How old are you?\n"
+    "Patient: I'm 45. The pain in my heel is worst in the morning. I take Advil.\n"
+    "Doctor: She has a history of diabetes. Your heel pain is what we call plantar fasciitis, "
+    "so let's start with stretching and a night splint. There is no sign of gout."
+)
+
+
+def test_stated_diagnosis_is_extracted_with_high_confidence():
+    extraction, confidence = FastPathExtractor().extract(STATED)
+
+    assert confidence >= 0.8
+    assert extraction.diagnosis == "Plantar fasciitis"
+    assert extraction.medical_history == ["Diabetes"]
+    assert extraction.conditions == []  # gout is negated
+    assert extraction.symptoms == ["Heel pain"]
+    assert extraction.medications == ["Ibuprofen"]
+    assert extraction.interventions == ["Stretching", "Night splint"]
+    assert (extraction.age, extraction.gender) == ("45", "female")
+
+
+def test_unclear_transcripts_have_low_confidence():
+    extractor = FastPathExtractor()
+
+    mentioned, mentioned_confidence = extractor.extract("Patient: The asthma is acting up again.")
+    competing, competing_confidence = extractor.extract(
+        "Doctor: This is consistent with gout, or the diagnosis is osteoarthritis."
+    )
+    _, unknown_confidence = extractor.extract("Patient: I'm 30 minutes late, my foot hurts.")
+
+    assert mentioned.diagnosis == "Asthma"
+    assert competing.diagnosis == "Gout" and competing.conditions == ["Osteoarthritis"]
+    assert unknown_confidence < mentioned_confidence < competing_confidence < 0.8
+
+
+def test_small_talk_is_not_a_stated_diagnosis():
+    extraction, confidence = FastPathExtractor().extract(
+        "Patient: My knee hurts. It's been bad since my stroke last year."
+    )
+
+    assert extraction.diagnosis == "Stroke"
+    assert confidence < 0.8
+
+
+def test_questions_are_not_diagnoses():
+    extractor = FastPathExtractor()
+
+    pressure, pressure_confidence = extractor.extract("Doctor: And you have high blood pressure too?")
+    asthma, asthma_confidence = extractor.extract(
+        "Patient: Does it look like asthma?\nDoctor: Maybe, we should test for COPD."
+    )
+
+    assert pressure.diagnosis == "Unknown" and pressure_confidence < 0.8
+    assert asthma.diagnosis == "COPD" and "Asthma" not in asthma.conditions
+    assert asthma_confidence < 0.8
+
+
+def test_relatives_conditions_are_not_the_patients():
+    extraction, confidence = FastPathExtractor().extract(
+        "Patient: My dad had a stroke, and my mother was diagnosed with breast cancer."
+    )
+
+    assert extraction.diagnosis == "Unknown"
+    assert extraction.medical_history == []
+    assert confidence < 0.8
+
+
+def test_past_diagnoses_are_history():
+    extractor = FastPathExtractor()
+
+    extraction, confidence = extractor.extract(
+        "Patient: I was diagnosed with diabetes ten years ago. "
+        "Today my heel has been hurting every morning, especially the first steps out of bed."
+    )
+    dated, _ = extractor.extract("Doctor: Asthma since 2015, and what we call COPD in 2019.")
+
+    assert extraction.diagnosis == "Unknown"
+    assert extraction.medical_history == ["Diabetes"]
+    assert confidence < 0.8
+    assert dated.medical_history == ["Asthma", "COPD"]
+
+
+def test_unrecognized_complaints_lower_the_confidence():
+    extraction, confidence = FastPathExtractor().extract(
+        "Doctor: This is what we call plantar fasciitis.\nPatient: And my wrist hurts when I type."
+    )
+
+    assert extraction.diagnosis == "Plantar fasciitis"
+    assert confidence < 0.8
+
+
+def test_other_conditions_lower_the_confidence_of_a_stated_diagnosis():
+    extraction, confidence = FastPathExtractor().extract(
+        "Doctor: This is what we call plantar fasciitis. The gout in your toe is separate."
+    )
+
+    assert extraction.diagnosis == "Plantar fasciitis"
+    assert extraction.conditions == ["Gout"]
+    assert confidence < 0.8
+
+
+def test_extraction_takes_milliseconds():
+    extractor = FastPathExtractor()
+    transcript = "\n".join([STATED] * 50)
+
+    started = time.perf_counter()
+    extractor.extract(transcript)
+
+    assert time.perf_counter() - started < 0.1
+
+
+def test_confident_transcripts_skip_gemini(slow_gemini):
+    slow_gemini.delay = 0.01
+    slow_gemini.text = '{"diagnosis": "Turf toe"}'
+    service = TranscriptExtractionService(GeminiService(), fast_path=FastPathExtractor(), fast_path_threshold=0.8)
+
+    async def run():
+        return [await service.extract(STATED), await service.extract("Patient: my toe hurts")]
+
+    (fast, fast_cached), (escalated, _) = asyncio.run(run())
+
+    assert fast.diagnosis == "Plantar fasciitis" and not fast_cached
+    assert escalated.diagnosis == "Turf toe"
+    assert slow_gemini.calls == 1
+    stats = service.stats()["fast_path"]
+    assert (stats["attempts"], stats["hits"], stats["escalations"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_stream_serves_fast_path_extraction(slow_gemini):
+    service = TranscriptExtractionService(GeminiService(), fast_path=FastPathExtractor())
+
+    async def collect():
+        return [event async for event in service.extract_stream(STATED)]
+
+    events = asyncio.run(collect())
+
+    assert events[0] == ("diagnosis", "Plantar fasciitis")
+    assert events[-1][0] == "extraction"
+    assert slow_gemini.calls == 0
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import time
+
+import httpx
+
+from app.core.config import settings
+from app.main import app
+
+
+def test_health_stays_responsive_during_extractions(slow_gemini):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app), \
+                httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            extractions = [
+                asyncio.ensure_future(client.post("/transcripts/extractions", json={"transcript": f"heel pain {i}"}))
+                for i in range(4)
+            ]
+            await asyncio.sleep(0.05)
+
+            started = time.monotonic()
+            health = await client.get("/health")
+            health_latency = time.monotonic() - started
+
+            responses = await asyncio.gather(*extractions)
+        return health, health_latency, responses, time.monotonic() - started
+
+    health, health_latency, responses, total = asyncio.run(scenario())
+
+    assert health.status_code == 200
+    assert health_latency < 0.25
+    assert [r.json()["extraction"]["diagnosis"] for r in responses] == ["Plantar fasciitis"] * 4
+    # The four extractions overlapped instead of running one after another
+    assert slow_gemini.max_in_flight == 4
+    assert total < 1.5
+
+
+def test_concurrency_is_bounded(slow_gemini, monkeypatch):
+    from app.services.gemini import GeminiService
+
+    monkeypatch.setattr(settings, "gemini_max_concurrency", 2)
+    slow_gemini.delay = 0.05
+    service = GeminiService()
+
+    async def generate_all():
+        return await asyncio.gather(*(service.generate_response([{"content": "hi"}]) for _ in range(6)))
+
+    assert len(asyncio.run(generate_all())) == 6
+    assert slow_gemini.max_in_flight == 2
+
+
+def test_gemini_client_is_shared_across_requests(slow_gemini, client, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    slow_gemini.delay = 0
+
+    for i in range(3):
+        assert client.post("/completions", json={"prompt": "hi"}).status_code == 200
+        assert client.post("/transcripts/extractions", json={"transcript": f"heel pain {i}"}).status_code == 200
+
+    assert len(slow_gemini.clients) == 1
+    assert slow_gemini.clients[0].kwargs["api_key"] == "test-key"
+    assert "GEMINI_API_KEY" not in os.environ
+
+    stats = client.get("/metrics").json()["gemini"]
+    assert stats["clients_created"] == 1
+    assert stats["calls"] == 6
+    assert stats["failures"] == 0
+    assert stats["in_flight"] == 0
+
+
+def test_missing_gemini_key_is_reported(client, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_key", None)
+
+    response = client.post("/transcripts/extractions", json={"transcript": "heel pain"})
+
+    assert response.status_code == 500
+    assert "GEMINI_KEY" in response.json()["detail"]
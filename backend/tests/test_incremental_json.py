@@ -0,0 +1,41 @@
+import pytest
+
+from app.core.incremental_json import IncrementalObjectParser
+
+DOCUMENT = (
+    '```json\n{"diagnosis": "Plantar fasciitis, left {heel}", '
+    '"symptoms": ["heel pain", "stiffness \\"mornings\\""], '
+    '"age": null, "details": {"onset": [1, 2]}}\n```'
+)
+
+
+def feed_all(chunks):
+    parser = IncrementalObjectParser()
+    return [parser.feed(chunk) for chunk in chunks], parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(DOCUMENT)])
+def test_members_are_parsed_whatever_the_chunking(size):
+    steps, parser = feed_all(DOCUMENT[i:i + size] for i in range(0, len(DOCUMENT), size))
+
+    assert [member for step in steps for member in step] == [
+        ("diagnosis", "Plantar fasciitis, left {heel}"),
+        ("symptoms", ["heel pain", 'stiffness "mornings"']),
+        ("age", None),
+        ("details", {"onset": [1, 2]}),
+    ]
+    assert parser.done
+
+
+def test_member_is_returned_as_soon_as_it_is_complete():
+    parser = IncrementalObjectParser()
+
+    assert parser.feed('{"diagnosis": "Gout", "symptoms": ["toe') == [("diagnosis", "Gout")]
+    assert parser.feed(' pain"]') == []
+    assert parser.feed("}") == [("symptoms", ["toe pain"])]
+    assert parser.feed(', "ignored": 1}') == []
+
+
+def test_non_object_documents_are_rejected():
+    with pytest.raises(ValueError):
+        IncrementalObjectParser().feed('["diagnosis"]')
@@ -0,0 +1,120 @@
+import asyncio
+
+import httpx
+import pytest
+from google import genai
+from google.genai import errors, types
+
+from app.core.config import settings
+from app.core.retry import EmptyResponseError
+from app.services.gemini import GeminiService
+from app.services.llm import Recording, RecordingBackend, load_recordings
+from app.services.llm_stub import StubBackend, create_stub_app
+
+MESSAGES = [{"content": "heel pain"}]
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "gemini_retry_backoff_base", 0)
+
+
+def test_recorded_errors_are_retried(no_backoff):
+    stub = StubBackend([Recording(None, 0, 503), Recording('{"diagnosis": "Gout"}', 0)], latency="recorded")
+    gemini = GeminiService(stub)
+
+    assert asyncio.run(gemini.generate_response(MESSAGES)) == '{"diagnosis": "Gout"}'
+
+    stats = gemini.stats()
+    assert (stats["backend"], stats["stub_calls"], stats["stub_errors"]) == ("stub", 2, 1)
+    assert stats["retry"]["retries"] == 1
+    assert stats["prompt_tokens"] > 0
+
+
+def test_empty_and_error_rates(no_backoff):
+    stub = StubBackend(latency="fixed", latency_median=0, empty_rate=1.0)
+    with pytest.raises(EmptyResponseError):
+        asyncio.run(GeminiService(stub).generate_response(MESSAGES))
+    assert stub.empty_responses == settings.gemini_retry_attempts
+
+    stub = StubBackend(latency="fixed", latency_median=0, error_rate=1.0, error_status=400)
+    with pytest.raises(errors.ClientError):
+        asyncio.run(GeminiService(stub).generate_response(MESSAGES))
+    assert stub.errors == 1  # 400 is not retried
+
+
+def test_lognormal_latency_is_reproducible():
+    first, second = StubBackend(seed=7), StubBackend(seed=7)
+    recording = Recording("x", 0)
+
+    delays = [first._delay(recording) for _ in range(200)]
+
+    assert delays == [second._delay(recording) for _ in range(200)]
+    assert 1.2 < sorted(delays)[100] < 1.8
+
+
+def test_recorded_responses_are_replayed(tmp_path, no_backoff):
+    path = tmp_path / "recordings.jsonl"
+    source = StubBackend([Recording("a", 0.01), Recording(None, 0.01, 429), Recording("b", 0.01)], latency="recorded")
+    gemini = GeminiService(RecordingBackend(source, str(path)))
+
+    async def record():
+        return [await gemini.generate_response(MESSAGES), await gemini.generate_response(MESSAGES)]
+
+    assert asyncio.run(record()) == ["a", "b"]
+    recordings = load_recordings(str(path))
+    assert [(r.text, r.status) for r in recordings] == [("a", None), (None, 429), ("b", None)]
+    assert all(r.latency >= 0.01 for r in recordings)
+
+    replay = StubBackend(recordings, latency="recorded")
+    assert asyncio.run(GeminiService(replay).generate_response(MESSAGES)) == "a"
+
+
+def test_stub_server_speaks_the_gemini_api():
+    stub = StubBackend(
+        [Recording('{"diagnosis": "Gout"}', 0), Recording(None, 0, 503)],
+        latency="fixed",
+        latency_median=0,
+        chunk_size=4,
+    )
+    transport = httpx.ASGITransport(app=create_stub_app(stub))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = genai.Client(
+                api_key="any",
+                http_options=types.HttpOptions(base_url="http://stub", httpx_async_client=http_client),
+            )
+            streamed = []
+            async for chunk in await client.aio.models.generate_content_stream(model="m", contents="hi"):
+                streamed.append(chunk.text)
+            with pytest.raises(errors.ServerError) as failure:
+                await client.aio.models.generate_content(model="m", contents="hi")
+            response = await client.aio.models.generate_content(model="m", contents="hi")
+            return streamed, failure.value, response
+
+    streamed, failure, response = asyncio.run(scenario())
+
+    assert "".join(streamed) == '{"diagnosis": "Gout"}' and len(streamed) > 1
+    assert failure.code == 503
+    assert response.text == '{"diagnosis": "Gout"}'
+    assert response.usage_metadata.prompt_token_count == 1
+
+
+def test_app_runs_on_the_stub_backend_without_a_key(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    monkeypatch.setattr(settings, "gemini_key", None)
+    monkeypatch.setattr(settings, "llm_backend", "stub")
+    monkeypatch.setattr(settings, "llm_stub_latency", "fixed")
+    monkeypatch.setattr(settings, "llm_stub_latency_median", 0)
+
+    with TestClient(app) as client:
+        response = client.post("/transcripts/extractions", json={"transcript": "Patient: my toe hurts"})
+        stats = client.get("/metrics").json()["gemini"]
+
+    assert response.status_code == 200
+    assert response.json()["extraction"]["diagnosis"] == "Plantar fasciitis"
+    assert (stats["backend"], stats["stub_calls"]) == ("stub", 1)
@@ -0,0 +1,216 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors
+
+from app.core.config import settings
+from app.prompt.extract_keywords import PROMPT
+from app.services.extraction import TranscriptExtractionService
+from app.services.gemini import GeminiService
+from app.services.llm_stub import StubBackend
+
+
+class StubCaches:
+    """Stands in for client.aio.caches"""
+
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    async def create(self, model, config):
+        self.created.append(config)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    async def delete(self, name):
+        self.deleted.append(name)
+
+
+def run_extractions(service, transcripts):
+    async def extract_all():
+        return [await service.extract_from_transcript(t) for t in transcripts]
+
+    return asyncio.run(extract_all())
+
+
+def test_prompt_prefix_and_suffix_rebuild_the_prompt():
+    service = TranscriptExtractionService(GeminiService())
+    schema_json = json.dumps(service._get_schema_example(), indent=2)
+
+    assert service.prompt_prefix + "heel pain" + service.prompt_suffix == PROMPT.format(schema_json, "heel pain")
+    assert service.prompt_prefix.rstrip().endswith("```text")
+
+
+def test_prefix_is_sent_as_cached_content(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = caches = StubCaches()
+    service = TranscriptExtractionService(gemini)
+
+    run_extractions(service, ["heel pain", "knee pain"])
+
+    for (contents, config), transcript in zip(slow_gemini.requests, ["heel pain", "knee pain"]):
+        assert contents.startswith(transcript)
+        assert "JSON extraction engine" not in contents
+        assert config.cached_content == "cachedContents/1"
+    assert caches.created[0].contents == [service.prompt_prefix]
+    assert gemini.stats()["context_cache"]["created"] == 1
+    assert gemini.stats()["context_cache"]["hits"] == 1
+
+
+def test_local_context_cache_is_only_for_backends_without_one(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache", "local")
+
+    with pytest.raises(ValueError, match="'local'"):
+        GeminiService()
+
+    gemini = GeminiService(StubBackend(latency="fixed", latency_median=0))
+    service = TranscriptExtractionService(gemini)
+    run_extractions(service, ["heel pain"])
+
+    assert list(gemini.context_cache.prefixes.values()) == [service.prompt_prefix]
+
+
+def test_small_prefixes_are_sent_inline(slow_gemini):
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    service = TranscriptExtractionService(gemini)
+
+    run_extractions(service, ["heel pain"])
+
+    contents, config = slow_gemini.requests[0]
+    assert contents.startswith(service.prompt_prefix)
+    assert config.cached_content is None
+    assert gemini.stats()["context_cache"]["too_small"] == 1
+
+
+def test_provider_cache_is_created_once_and_deleted_on_close(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = caches = StubCaches()
+    service = TranscriptExtractionService(gemini)
+
+    async def scenario():
+        await asyncio.gather(*(service.extract_from_transcript(f"visit {i}") for i in range(3)))
+        await gemini.close()
+
+    asyncio.run(scenario())
+
+    assert len(caches.created) == 1
+    assert caches.created[0].contents == [service.prompt_prefix]
+    assert {config.cached_content for _, config in slow_gemini.requests} == {"cachedContents/1"}
+    assert caches.deleted == ["cachedContents/1"]
+
+
+def test_transient_cache_failures_are_retried_after_a_cool_down(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = caches = StubCaches()
+    create = caches.create
+
+    async def create_failing_once(model, config):
+        if not caches.created:
+            caches.created.append(None)
+            raise errors.ServerError(503, {"error": {"message": "Unavailable"}})
+        return await create(model, config)
+
+    caches.create = create_failing_once
+    now = [1000.0]
+    monkeypatch.setattr("app.services.prompt_cache.time", SimpleNamespace(monotonic=lambda: now[0]))
+    service = TranscriptExtractionService(gemini)
+
+    run_extractions(service, ["heel pain", "knee pain"])
+    now[0] += gemini.context_cache.RETRY_AFTER
+    run_extractions(service, ["toe pain"])
+
+    assert [config.cached_content for _, config in slow_gemini.requests] == [None, None, "cachedContents/2"]
+    assert len(caches.created) == 2
+    assert gemini.stats()["context_cache"]["failures"] == 1
+
+
+def test_refused_prefix_is_not_cached_again(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = caches = StubCaches()
+
+    async def refuse(model, config):
+        caches.created.append(config)
+        raise errors.ClientError(400, {"error": {"message": "Cached content is too small"}})
+
+    caches.create = refuse
+
+    run_extractions(TranscriptExtractionService(gemini), ["heel pain", "knee pain"])
+
+    assert len(caches.created) == 1
+    assert [config.cached_content for _, config in slow_gemini.requests] == [None, None]
+
+
+def test_expired_cached_content_falls_back_to_inline_prefix(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    generate = slow_gemini.generate_content
+
+    async def generate_content(model, contents, config=None):
+        if config.cached_content:
+            slow_gemini.requests.append((contents, config))
+            raise errors.ClientError(404, {"error": {"message": "CachedContent not found"}})
+        return await generate(model, contents, config)
+
+    slow_gemini.generate_content = generate_content
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = StubCaches()
+    service = TranscriptExtractionService(gemini)
+
+    extraction, = run_extractions(service, ["heel pain"])
+
+    assert extraction.diagnosis == "Plantar fasciitis"
+    contents, config = slow_gemini.requests[-1]
+    assert contents.startswith(service.prompt_prefix)
+    assert config.cached_content is None
+
+
+def test_rate_limited_cached_request_is_retried_not_sent_inline(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+    monkeypatch.setattr(settings, "gemini_retry_backoff_base", 0)
+    generate = slow_gemini.generate_content
+    attempts = []
+
+    async def generate_content(model, contents, config=None):
+        attempts.append(config.cached_content)
+        if len(attempts) == 1:
+            raise errors.ClientError(429, {"error": {"message": "Resource exhausted"}})
+        return await generate(model, contents, config)
+
+    slow_gemini.generate_content = generate_content
+    slow_gemini.delay = 0
+    gemini = GeminiService()
+    gemini.client.aio.caches = StubCaches()
+
+    run_extractions(TranscriptExtractionService(gemini), ["heel pain"])
+
+    assert attempts == ["cachedContents/1", "cachedContents/1"]
+    assert gemini.stats()["retry"]["retries"] == 1
+
+
+def test_cached_prompt_tokens_are_accounted(slow_gemini, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_context_cache_min_tokens", 0)
+
+    async def generate_content(model, contents, config=None):
+        usage = SimpleNamespace(prompt_token_count=400, cached_content_token_count=300)
+        return SimpleNamespace(text='{"diagnosis": "Gout"}', usage_metadata=usage)
+
+    slow_gemini.generate_content = generate_content
+    gemini = GeminiService()
+    gemini.client.aio.caches = StubCaches()
+
+    run_extractions(TranscriptExtractionService(gemini), ["toe pain", "toe ache"])
+
+    stats = gemini.stats()
+    assert stats["prompt_tokens"] == 800
+    assert stats["cached_prompt_tokens"] == 600
+    assert stats["cached_prompt_tokens_per_call"] == 300
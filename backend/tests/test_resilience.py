@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.core.resilience import CircuitBreaker, Hedger
+
+
+def test_slow_call_is_hedged_and_fastest_answer_wins():
+    hedger = Hedger(default_delay=0.01)
+    delays = [1.0, 0.0]
+    discarded = []
+
+    async def call():
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    async def discard(result):
+        discarded.append(result)
+
+    assert asyncio.run(hedger.call(call, discard)) == 0.0
+    assert hedger.stats()["hedged"] == 1
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+def test_fast_call_is_not_hedged():
+    hedger = Hedger(default_delay=1.0)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return "ok"
+
+    assert asyncio.run(hedger.call(call)) == "ok"
+    assert len(calls) == 1
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_hedge_survives_failure_of_one_call():
+    hedger = Hedger(default_delay=0.01)
+    outcomes = [(0.05, ValueError("first failed")), (0.1, None)]
+
+    async def call():
+        delay, error = outcomes.pop(0)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return "second"
+
+    assert asyncio.run(hedger.call(call)) == "second"
+
+
+def test_failure_before_hedge_is_raised():
+    hedger = Hedger(default_delay=1.0)
+
+    async def call():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(hedger.call(call))
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_hedge_delay_follows_latency_quantile():
+    hedger = Hedger(quantile=0.95, default_delay=1.0, min_delay=0.05, max_delay=2.0, min_samples=20)
+    assert hedger.delay() == 1.0
+
+    for i in range(100):
+        hedger.latencies.record(i / 100)
+
+    assert hedger.delay() == 0.95
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("app.core.resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.allow()  # half-open trial
+    assert not breaker.allow()  # only one trial at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["opened"] == 2
+    assert breaker.stats()["short_circuited"] == 2
@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from google.genai import errors
+
+from app.core.retry import DeadlineExceededError, EmptyResponseError, RetryPolicy
+from app.services.gemini import GeminiService
+
+
+class Flaky:
+    """Async callable failing with the given errors before returning "ok\""""
+
+    def __init__(self, *errors, delay=0):
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def fast_policy(**kwargs):
+    return RetryPolicy(backoff_base=0.001, backoff_max=0.001, **kwargs)
+
+
+def test_transient_errors_are_retried():
+    policy = fast_policy(max_attempts=3)
+    fn = Flaky(httpx.ConnectError("refused"), EmptyResponseError("empty"))
+
+    assert asyncio.run(policy.call(fn)) == "ok"
+    assert fn.calls == 3
+    stats = policy.stats()
+    assert (stats["attempts"], stats["retries"], stats["successes"]) == (3, 2, 1)
+    assert stats["attempt_latency_p50"] is not None
+
+
+def test_fatal_errors_are_not_retried():
+    policy = fast_policy(max_attempts=3)
+    fn = Flaky(ValueError("bad request"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(policy.call(fn))
+    assert fn.calls == 1
+    assert policy.stats()["fatal"] == 1
+
+
+def test_gives_up_after_max_attempts():
+    policy = fast_policy(max_attempts=2)
+    fn = Flaky(*[EmptyResponseError("empty")] * 3)
+
+    with pytest.raises(EmptyResponseError):
+        asyncio.run(policy.call(fn))
+    assert fn.calls == 2
+    assert policy.stats()["gave_up"] == 1
+
+
+def test_deadline_bounds_total_time():
+    policy = fast_policy(max_attempts=5, timeout=0.1)
+    fn = Flaky(delay=1)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(policy.call(fn))
+
+    assert time.monotonic() - started < 0.5
+    assert fn.calls == 1
+    assert policy.stats()["deadline_exceeded"] == 1
+
+
+def test_no_backoff_is_waited_past_the_deadline():
+    policy = RetryPolicy(max_attempts=5, backoff_base=10, backoff_max=10, timeout=0.2)
+    # Draw the longest possible delay
+    policy.backoff = lambda retry: 10
+    fn = Flaky(EmptyResponseError("empty"))
+
+    started = time.monotonic()
+    with pytest.raises(EmptyResponseError):
+        asyncio.run(policy.call(fn))
+
+    assert time.monotonic() - started < 0.1
+    assert policy.stats()["gave_up"] == 1
+
+
+def test_caller_deadline_takes_precedence():
+    policy = fast_policy(max_attempts=5, timeout=10)
+
+    async def call():
+        deadline = asyncio.get_running_loop().time() + 0.05
+        return await policy.call(Flaky(delay=1), deadline=deadline)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(call())
+
+
+def test_gemini_retries_empty_and_overloaded_responses(slow_gemini, monkeypatch):
+    slow_gemini.delay = 0
+    slow_gemini.responses = ["", "  ", "hello"]
+    service = GeminiService()
+    monkeypatch.setattr(service._retry, "backoff", lambda retry: 0)
+
+    assert asyncio.run(service.generate_response([{"content": "hi"}])) == "hello"
+    assert slow_gemini.calls == 3
+    assert service.stats()["retry"]["retries"] == 2
+
+
+def test_gemini_client_errors_are_not_retried(slow_gemini):
+    async def generate_content(model, contents, config=None):
+        slow_gemini.calls += 1
+        raise errors.ClientError(400, {"error": {"message": "invalid argument"}})
+
+    slow_gemini.generate_content = generate_content
+    service = GeminiService()
+
+    with pytest.raises(errors.ClientError):
+        asyncio.run(service.generate_response([{"content": "hi"}]))
+    assert slow_gemini.calls == 1
+    assert service.stats()["retry"]["fatal"] == 1
+
+
+def test_clinical_trials_server_errors_are_retried(client, upstream):
+    upstream.responses = [httpx.Response(502, text="bad gateway"), httpx.Response(200, json={"studies": []})]
+
+    response = client.get("/studies", params={"condition": "asthma"})
+
+    assert response.status_code == 200
+    assert len(upstream.requests) == 2
+    assert client.get("/metrics").json()["clinical_trials"]["retry"]["retries"] == 1
+
+
+def test_clinical_trials_client_errors_are_not_retried(client, upstream):
+    upstream.response = httpx.Response(400, text="bad query")
+
+    assert client.get("/studies", params={"condition": "asthma"}).status_code == 500
+    assert len(upstream.requests) == 1
@@ -0,0 +1,66 @@
+import asyncio
+
+from app.core.deadline import current_deadline, deadline_scope
+from app.core.retry import DeadlineExceededError
+from app.core.singleflight import SingleFlight
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def call():
+        await release.wait()
+        return "result"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("key", call))
+        second = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await second
+
+    assert asyncio.run(run()) == "result"
+    assert flight.stats() == {"issued": 1, "coalesced": 1, "abandoned": 0, "in_flight": 0}
+
+
+def test_new_call_after_completion_is_issued():
+    flight = SingleFlight()
+
+    async def call():
+        return object()
+
+    async def run():
+        return await flight.do("key", call), await flight.do("key", call)
+
+    first, second = asyncio.run(run())
+
+    assert first is not second
+    assert flight.stats()["issued"] == 2
+
+
+def test_each_waiter_applies_its_own_deadline():
+    flight = SingleFlight()
+    seen_deadlines = []
+
+    async def call():
+        seen_deadlines.append(current_deadline())
+        await asyncio.sleep(0.2)
+        return "result"
+
+    async def wait(timeout):
+        with deadline_scope(timeout):
+            return await flight.do("key", call)
+
+    async def run():
+        return await asyncio.gather(wait(0.05), wait(1.0), return_exceptions=True)
+
+    impatient, patient = asyncio.run(run())
+
+    assert isinstance(impatient, DeadlineExceededError)
+    assert patient == "result"
+    # The shared call ran without the first caller's deadline
+    assert seen_deadlines == [None]
+    assert flight.stats()["abandoned"] == 0
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import time
+
+from app.main import app
+from app.services.extraction import TranscriptExtractionService
+from app.services.gemini import GeminiService
+
+EXTRACTION = {
+    "symptoms": ["heel pain"],
+    "diagnosis": "Plantar fasciitis",
+    "medications": ["ibuprofen"],
+    "keywords": ["plantar fasciitis", "heel"],
+}
+
+
+def parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def stream(client, transcript):
+    response = client.post("/transcripts/extractions:stream", json={"transcript": transcript})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return parse_events(response.text)
+
+
+def test_fields_stream_with_diagnosis_first(slow_gemini, client):
+    slow_gemini.delay = 0
+    slow_gemini.text = "```json\n" + json.dumps(EXTRACTION) + "\n```"
+
+    events = stream(client, "heel pain")
+
+    fields = [data["field"] for name, data in events if name == "field"]
+    assert fields == ["diagnosis", "symptoms", "medications", "keywords"]
+    assert events[0] == ("field", {"field": "diagnosis", "value": "Plantar fasciitis"})
+    name, final = events[-1]
+    assert name == "extraction"
+    assert final["extraction"]["medications"] == ["ibuprofen"]
+    assert final["extraction"]["conditions"] == []
+    assert final["cached"] is False
+
+
+def test_diagnosis_arrives_before_the_generation_ends(slow_gemini):
+    slow_gemini.delay = 0.5
+    slow_gemini.text = json.dumps({"diagnosis": "Gout", "keywords": ["x" * 200]})
+    service = TranscriptExtractionService(GeminiService())
+
+    async def first_field():
+        started = time.monotonic()
+        fields = service.extract_stream("toe pain")
+        try:
+            return await fields.__anext__(), time.monotonic() - started
+        finally:
+            await fields.aclose()
+
+    first, latency = asyncio.run(first_field())
+
+    assert first == ("diagnosis", "Gout")
+    assert latency < 0.25
+
+
+def test_cached_extractions_stream_immediately(slow_gemini, client):
+    slow_gemini.delay = 0
+    client.post("/transcripts/extractions", json={"transcript": "heel pain"})
+
+    events = stream(client, "heel pain")
+
+    assert events[0] == ("field", {"field": "diagnosis", "value": "Plantar fasciitis"})
+    assert events[-1][1]["cached"] is True
+    assert slow_gemini.calls == 1
+
+
+def test_unparseable_output_ends_with_fallback(slow_gemini, client):
+    slow_gemini.delay = 0
+    slow_gemini.text = "Sorry, I cannot help with that."
+
+    events = stream(client, "heel pain")
+
+    assert events == [
+        ("field", {"field": "diagnosis", "value": "Unknown"}),
+        ("extraction", events[-1][1]),
+    ]
+    assert events[-1][1]["extraction"]["diagnosis"] == "Unknown"
+
+
+def test_failures_mid_stream_end_with_an_error_event(slow_gemini, client, monkeypatch):
+    async def failing_stream(transcript):
+        yield "diagnosis", "Plantar fasciitis"
+        raise ValueError("cannot encode")
+
+    monkeypatch.setattr(app.state.extraction_service, "extract_stream", failing_stream)
+
+    events = stream(client, "heel pain")
+
+    assert events == [
+        ("field", {"field": "diagnosis", "value": "Plantar fasciitis"}),
+        ("error", {"detail": "Extraction failed: cannot encode"}),
+    ]
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+from app.models.extraction import MedicalExtraction
+from app.services.extraction import TranscriptExtractionService
+from app.services.gemini import GeminiService
+
+
+def extract(slow_gemini, transcript="heel pain"):
+    slow_gemini.delay = 0
+    service = TranscriptExtractionService(GeminiService())
+    return asyncio.run(service.extract_from_transcript(transcript)), service.stats()["validation"]
+
+
+def test_output_is_constrained_to_the_extraction_schema(slow_gemini):
+    slow_gemini.text = json.dumps({"diagnosis": "Plantar fasciitis", "symptoms": ["heel pain"]})
+
+    extraction, stats = extract(slow_gemini)
+
+    assert extraction == MedicalExtraction(diagnosis="Plantar fasciitis", symptoms=["heel pain"])
+    _, config = slow_gemini.requests[0]
+    assert config.response_mime_type == "application/json"
+    assert config.response_schema is MedicalExtraction
+    assert stats["parse_failures"] == 0
+    assert stats["repairs"] == 0
+
+
+def test_only_invalid_fields_are_asked_again(slow_gemini):
+    slow_gemini.responses = [
+        json.dumps({"diagnosis": "Gout", "symptoms": "toe pain", "age": 54, "keywords": ["gout"]}),
+        json.dumps({"symptoms": ["toe pain"], "age": "54"}),
+    ]
+
+    extraction, stats = extract(slow_gemini)
+
+    assert extraction == MedicalExtraction(diagnosis="Gout", symptoms=["toe pain"], age="54", keywords=["gout"])
+    contents, config = slow_gemini.requests[1]
+    assert set(config.response_schema.model_fields) == {"age", "symptoms"}
+    assert '"keywords"' not in contents.split("Transcript:")[0]
+    assert stats["invalid_responses"] == 1
+    assert stats["repaired_fields"] == 2
+
+
+def test_truncated_output_keeps_complete_members(slow_gemini):
+    slow_gemini.responses = [
+        '{"diagnosis": "Gout", "conditions": ["gout"], "symptoms": ["toe pa',
+        json.dumps({"symptoms": ["toe pain"]}),
+    ]
+
+    extraction, stats = extract(slow_gemini)
+
+    assert extraction.diagnosis == "Gout"
+    assert extraction.conditions == ["gout"]
+    assert extraction.symptoms == ["toe pain"]
+    _, config = slow_gemini.requests[1]
+    assert "diagnosis" not in config.response_schema.model_fields
+    assert "symptoms" in config.response_schema.model_fields
+    assert stats["parse_failures"] == 1
+    assert stats["parse_failure_rate"] == 1.0
+    # Fields the re-ask did not answer keep their defaults
+    assert stats["unrepaired_fields"] == len(MedicalExtraction.model_fields) - 3
+
+
+def test_fenced_output_is_accepted_without_asking_again(slow_gemini):
+    slow_gemini.text = '```json\n{"diagnosis": "Gout"}\n```'
+
+    extraction, stats = extract(slow_gemini)
+
+    assert extraction.diagnosis == "Gout"
+    assert stats["parse_failures"] == 1
+    assert stats["repairs"] == 0
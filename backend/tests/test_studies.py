@@ -0,0 +1,339 @@
+import asyncio
+
+import httpx
+
+from app.core.config import settings
+from app.main import app
+from app.services.clinical_trials import (
+    STUDY_VIEW_FIELDS,
+    ClinicalTrialsService,
+    StudyView,
+    get_clinical_trials_service,
+)
+from openapi_client.api_response import ApiResponse
+from openapi_client.models.paged_studies import PagedStudies
+
+
+def api_response(data):
+    return ApiResponse(status_code=200, data=data, raw_data=b"")
+
+
+class FakeStudiesApi:
+    def __init__(self):
+        self.calls = []
+
+    async def list_studies_with_http_info(self, **kwargs):
+        self.calls.append(kwargs)
+        return api_response(PagedStudies.from_dict({"studies": []}))
+
+
+class SlowStudiesApi:
+    """Studies API whose calls block until `release` is set"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def list_studies_with_http_info(self, **kwargs):
+        self.calls.append(kwargs)
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return api_response(PagedStudies.from_dict({"studies": [], "nextPageToken": kwargs["query_cond"]}))
+
+
+class FakeClinicalTrialsService:
+    def __init__(self):
+        self.calls = []
+
+    async def search_clinical_trials(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"studies": [], "nextPageToken": None}
+
+
+def test_lifespan_creates_single_service(client):
+    service = app.state.clinical_trials_service
+    assert isinstance(service, ClinicalTrialsService)
+
+    # Same pooled client is handed out for every request
+    assert service.api_client is service.api_client
+
+
+def test_studies_uses_injected_service(client):
+    fake = FakeClinicalTrialsService()
+    app.dependency_overrides[get_clinical_trials_service] = lambda: fake
+
+    response = client.get("/studies", params={"condition": "asthma", "page_size": 5})
+
+    assert response.status_code == 200
+    assert fake.calls == [
+        {
+            "condition": "asthma",
+            "page_size": 5,
+            "is_recruiting": True,
+            "page_token": None,
+            "view": StudyView.FULL,
+        }
+    ]
+
+
+def test_studies_view_query_parameter(client):
+    fake = FakeClinicalTrialsService()
+    app.dependency_overrides[get_clinical_trials_service] = lambda: fake
+
+    assert client.get("/studies", params={"condition": "asthma", "view": "card"}).status_code == 200
+    assert client.get("/studies", params={"condition": "asthma", "view": "bogus"}).status_code == 422
+    assert fake.calls[0]["view"] is StudyView.CARD
+
+
+def test_view_maps_to_upstream_fields():
+    service = ClinicalTrialsService()
+    service._studies_api = FakeStudiesApi()
+
+    asyncio.run(service.search_clinical_trials("asthma", 10, view=StudyView.CARD))
+    asyncio.run(service.search_clinical_trials("asthma", 10, view=StudyView.FULL))
+
+    card_call, full_call = service._studies_api.calls
+    assert card_call["fields"] == STUDY_VIEW_FIELDS[StudyView.CARD]
+    assert "NCTId" in card_call["fields"]
+    assert full_call["fields"] is None
+
+
+def test_metrics_exposes_pool_stats(client):
+    app.state.clinical_trials_service.api_client
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    stats = response.json()["clinical_trials"]
+    assert stats["pool"] == {"pools": 1, "connections_created": 0, "connections_reused": 0, "requests": 0}
+    assert stats["searches"] == {"issued": 0, "coalesced": 0, "abandoned": 0, "in_flight": 0}
+    assert stats["throttle"]["throttled"] == 0
+
+
+def test_raw_passthrough_streams_upstream_body(client, upstream):
+    body = b'{"studies":[{"protocolSection":{"identificationModule":{"nctId":"NCT1"}}}],"extra":1}'
+    upstream.response = httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    response = client.get("/studies", params={"condition": "asthma", "view": "card", "raw": "true"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == body
+    assert "fields=NCTId" in str(upstream.requests[0].url)
+
+
+def test_raw_passthrough_rejects_upstream_errors(client, upstream):
+    upstream.response = httpx.Response(400, text="bad query", headers={"content-type": "text/plain"})
+
+    response = client.get("/studies", params={"condition": "(", "raw": "true"})
+
+    assert response.status_code == 500
+    assert "bad query" in response.json()["detail"]
+
+
+def test_parsed_and_raw_responses_match(client, upstream):
+    page = {
+        "studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000001", "briefTitle": "T"}}}],
+        "nextPageToken": "next",
+    }
+    upstream.response = httpx.Response(200, json=page)
+
+    parsed = client.get("/studies", params={"condition": "asthma"}).json()
+    raw = client.get("/studies", params={"condition": "asthma", "raw": "true"}).json()
+
+    assert parsed == raw == page
+
+
+def test_iter_studies_walks_pages_within_budget():
+    pages = {
+        None: {"studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}},
+                           {"protocolSection": {"identificationModule": {"nctId": "NCT00000002"}}}],
+               "nextPageToken": "p2"},
+        "p2": {"studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000003"}}},
+                           {"protocolSection": {"identificationModule": {"nctId": "NCT00000004"}}}],
+               "nextPageToken": "p3"},
+    }
+    requests = []
+
+    def handler(request):
+        requests.append(request.url)
+        return httpx.Response(200, json=pages[request.url.params.get("pageToken")])
+
+    async def collect():
+        service = ClinicalTrialsService()
+        service.api_client.rest_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return [
+                study.protocol_section.identification_module.nct_id
+                async for study in service.iter_studies("asthma", 2, view=StudyView.CARD, max_results=3)
+            ]
+        finally:
+            await service.close()
+
+    assert asyncio.run(collect()) == ["NCT00000001", "NCT00000002", "NCT00000003"]
+    assert len(requests) == 2
+    assert requests[1].params["pageSize"] == "1"
+    assert "NCTId" in requests[1].params["fields"]
+
+
+def test_iter_studies_retries_failed_pages():
+    pages = [
+        httpx.Response(502, text="bad gateway"),
+        httpx.Response(200, json={"studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}]}),
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return pages.pop(0)
+
+    async def collect():
+        service = ClinicalTrialsService()
+        service._retry.backoff_base = 0
+        service.api_client.rest_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            studies = [study async for study in service.iter_studies("asthma", 10, view=StudyView.CARD)]
+            return studies, service.stats()
+        finally:
+            await service.close()
+
+    studies, stats = asyncio.run(collect())
+
+    assert [s.protocol_section.identification_module.nct_id for s in studies] == ["NCT00000001"]
+    assert len(requests) == 2
+    assert stats["retry"]["attempts"] == 2
+    assert stats["circuit"]["state"] == "closed"
+
+
+def test_identical_concurrent_searches_are_coalesced():
+    service = ClinicalTrialsService()
+    service._studies_api = SlowStudiesApi()
+
+    async def search_all():
+        searches = [
+            service.search_clinical_trials("Asthma", 10),
+            service.search_clinical_trials("asthma ", 10),
+            service.search_clinical_trials("asthma", 10),
+            service.search_clinical_trials("asthma", 20),
+        ]
+        tasks = [asyncio.ensure_future(s) for s in searches]
+        await asyncio.sleep(0)
+        assert service.stats()["searches"]["in_flight"] == 2
+        service._studies_api.release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(search_all())
+
+    assert len(service._studies_api.calls) == 2
+    assert results[0] == results[1] == results[2] == {"studies": [], "nextPageToken": "Asthma"}
+    assert results[0] is not results[1]
+    assert service.stats()["searches"] == {"issued": 2, "coalesced": 2, "abandoned": 0, "in_flight": 0}
+
+
+def test_coalesced_searches_share_failures():
+    service = ClinicalTrialsService()
+    service._studies_api = SlowStudiesApi(error=ValueError("upstream down"))
+
+    async def search_all():
+        tasks = [asyncio.ensure_future(service.search_clinical_trials("asthma", 10)) for _ in range(3)]
+        await asyncio.sleep(0)
+        service._studies_api.release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = asyncio.run(search_all())
+
+    assert len(service._studies_api.calls) == 1
+    assert all(isinstance(e, RuntimeError) and "upstream down" in str(e) for e in errors)
+
+
+def test_searches_past_their_deadline_time_out(client):
+    service = app.state.clinical_trials_service
+    service._studies_api = SlowStudiesApi()
+    service._retry.timeout = 0.05
+
+    response = client.get("/studies", params={"condition": "asthma"})
+
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
+
+
+def test_upstream_throttling_is_retried(client, upstream):
+    upstream.responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}, text="slow down"),
+        httpx.Response(200, json={"studies": []}),
+    ]
+
+    response = client.get("/studies", params={"condition": "asthma"})
+
+    assert response.status_code == 200
+    assert len(upstream.requests) == 2
+    throttle = client.get("/metrics").json()["clinical_trials"]["throttle"]
+    assert throttle["throttled"] == 1
+    assert throttle["retried"] == 1
+
+
+def test_repeated_searches_are_served_from_cache(client, upstream):
+    upstream.response = httpx.Response(200, json={"studies": []}, headers={"ETag": '"v1"'})
+
+    for _ in range(2):
+        assert client.get("/studies", params={"condition": "asthma", "view": "card"}).status_code == 200
+    raw = client.get("/studies", params={"condition": "asthma", "view": "card", "raw": "true"})
+
+    assert raw.json() == {"studies": []}
+    assert len(upstream.requests) == 1
+    # The view's cache policy stays with the client's cache
+    assert "Cache-Control" not in upstream.requests[0].headers
+    cache = client.get("/metrics").json()["clinical_trials"]["cache"]
+    assert cache["hits"] == 2
+    assert cache["misses"] == 1
+
+
+def test_cache_hits_do_not_shorten_the_hedge_delay(monkeypatch):
+    monkeypatch.setattr(settings, "clinical_trials_hedge_min_delay", 0.001)
+
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"studies": []})
+
+    async def search():
+        service = ClinicalTrialsService()
+        service.api_client.rest_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            # A few upstream round trips, then many more answers from the cache
+            await asyncio.gather(*(service.search_clinical_trials(f"condition {i}", 10) for i in range(25)))
+            for _ in range(200):
+                await service.search_clinical_trials("condition 0", 10)
+            return service.stats()
+        finally:
+            await service.close()
+
+    stats = asyncio.run(search())
+
+    assert stats["cache"]["hits"] == 200
+    assert stats["hedging"]["delay"] >= 0.02
+    assert stats["hedging"]["hedged"] == 0
+
+
+def test_open_circuit_serves_cached_pages(client, upstream, monkeypatch):
+    app.state.clinical_trials_service._breaker.failure_threshold = 2
+    page = {"studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}]}
+    upstream.response = httpx.Response(200, json=page)
+    assert client.get("/studies", params={"condition": "asthma"}).json() == page
+
+    # Upstream degrades: the circuit opens after two failures
+    upstream.response = httpx.Response(500, text="down")
+    for condition in ["copd", "gout"]:
+        assert client.get("/studies", params={"condition": condition}).status_code == 500
+    assert client.get("/metrics").json()["clinical_trials"]["circuit"]["state"] == "open"
+
+    # Cached pages are still served, even once expired; others fail fast
+    monkeypatch.setitem(settings.clinical_trials_cache_ttl, "full", 0)
+    monkeypatch.setattr(settings, "clinical_trials_cache_stale_while_revalidate", 0)
+    sent = len(upstream.requests)
+    assert client.get("/studies", params={"condition": "asthma"}).json() == page
+    failed = client.get("/studies", params={"condition": "eczema"})
+    assert failed.status_code == 500
+    assert "circuit open" in failed.json()["detail"]
+    assert len(upstream.requests) == sent
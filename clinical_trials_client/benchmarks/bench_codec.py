@@ -0,0 +1,41 @@
+"""Decode/encode throughput of the JSON codecs on 100- and 1000-study pages.
+
+Usage (from clinical_trials_client/):
+
+    python -m benchmarks.bench_codec [--page recorded_page.json] [--repeat 5]
+"""
+
+import argparse
+
+from openapi_client.codec import CODECS, get_codec
+
+from benchmarks.pages import page_bytes, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", help="recorded /studies JSON body to use instead of synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = [None] if args.page else [100, 1000]
+    print("%-8s %-6s %10s %12s %12s" % ("codec", "size", "MB", "decode MB/s", "encode MB/s"))
+    for size in sizes:
+        body = page_bytes(size, args.page)
+        text = body.decode("utf-8")
+        megabytes = len(body) / 1e6
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                print("%-8s not installed" % name)
+                continue
+            data = codec.loads(text)
+            decode = timeit(lambda: codec.loads(text), args.repeat)
+            encode = timeit(lambda: codec.dumps_bytes(data), args.repeat)
+            print("%-8s %-6s %10.2f %12.1f %12.1f" % (
+                name, size or "page", megabytes, megabytes / decode, megabytes / encode))
+
+
+if __name__ == "__main__":
+    main()
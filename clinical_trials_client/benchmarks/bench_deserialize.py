@@ -0,0 +1,39 @@
+"""Deserialization of 100- and 1000-study pages into PagedStudies.
+
+Compares the generated per-model from_dict chain (the previous
+ApiClient.__deserialize path) with ApiClient's cached deserialization plan.
+
+Usage (from clinical_trials_client/):
+
+    python -m benchmarks.bench_deserialize [--page recorded_page.json] [--repeat 5]
+"""
+
+import argparse
+
+from openapi_client.api_client import ApiClient
+from openapi_client.models.paged_studies import PagedStudies
+
+from benchmarks.pages import page_bytes, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", help="recorded /studies JSON body to use instead of synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = ApiClient()
+    codec = client.configuration.json_codec
+    plan = client.deserializer_for("PagedStudies")
+
+    print("%-6s %14s %14s %8s" % ("size", "from_dict ms", "plan ms", "speedup"))
+    for size in [None] if args.page else [100, 1000]:
+        data = codec.loads(page_bytes(size, args.page))
+        assert plan(data) == PagedStudies.from_dict(data)
+        before = timeit(lambda: PagedStudies.from_dict(data), args.repeat)
+        after = timeit(lambda: plan(data), args.repeat)
+        print("%-6s %14.1f %14.1f %7.1fx" % (size or "page", before * 1e3, after * 1e3, before / after))
+
+
+if __name__ == "__main__":
+    main()
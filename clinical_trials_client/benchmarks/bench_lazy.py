@@ -0,0 +1,63 @@
+"""Listing NCT IDs from 100- and 1000-study pages, eager vs. lazy models.
+
+Compares PagedStudies (every section validated up front) with
+LazyPagedStudies (fields validated on first access) for a listing that only
+reads `protocol_section.identification_module.nct_id` and the brief title,
+reporting time and peak memory allocated while deserializing.
+
+Usage (from clinical_trials_client/):
+
+    python -m benchmarks.bench_lazy [--page recorded_page.json] [--repeat 5]
+"""
+
+import argparse
+import tracemalloc
+
+from openapi_client.configuration import Configuration
+from openapi_client.lazy import LazyPagedStudies
+from openapi_client.models.paged_studies import PagedStudies
+
+from benchmarks.pages import page_bytes, timeit
+
+
+def listing(page_class, data):
+    page = page_class.from_dict(data)
+    return [
+        (s.protocol_section.identification_module.nct_id,
+         s.protocol_section.identification_module.brief_title)
+        for s in page.studies
+    ]
+
+
+def peak_kib(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", help="recorded /studies JSON body to use instead of synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codec = Configuration.get_default().json_codec
+
+    print("%-6s %10s %10s %8s %12s %12s" % ("size", "eager ms", "lazy ms", "speedup", "eager KiB", "lazy KiB"))
+    for size in [None] if args.page else [100, 1000]:
+        data = codec.loads(page_bytes(size, args.page))
+        assert listing(LazyPagedStudies, data) == listing(PagedStudies, data)
+        eager = timeit(lambda: listing(PagedStudies, data), args.repeat)
+        lazy = timeit(lambda: listing(LazyPagedStudies, data), args.repeat)
+        print("%-6s %10.1f %10.1f %7.1fx %12.0f %12.0f" % (
+            size or "page", eager * 1e3, lazy * 1e3, eager / lazy,
+            peak_kib(lambda: listing(PagedStudies, data)),
+            peak_kib(lambda: listing(LazyPagedStudies, data)),
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Study pages used by the benchmarks.
+
+Pages are either loaded from a recorded ClinicalTrials.gov response
+(``--page path/to/page.json``) or built from the recorded study in
+tests/fixtures/study.json, repeated with distinct NCT IDs.
+"""
+
+import copy
+import json
+import os
+import time
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "study.json")
+
+
+def load_study():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_page(size, study=None):
+    """Returns a PagedStudies-shaped dict holding `size` studies."""
+    study = study or load_study()
+    studies = []
+    for i in range(size):
+        item = copy.deepcopy(study)
+        item["protocolSection"]["identificationModule"]["nctId"] = "NCT%08d" % (i + 1)
+        studies.append(item)
+    return {"studies": studies, "nextPageToken": "NF0g5JGBlPMv"}
+
+
+def page_bytes(size, path=None):
+    """Returns the raw JSON body of a page of `size` studies."""
+    if path:
+        with open(path, "rb") as f:
+            return f.read()
+    return json.dumps(make_page(size)).encode("utf-8")
+
+
+def timeit(func, repeat):
+    """Best wall time of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
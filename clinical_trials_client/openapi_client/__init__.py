@@ -19,6 +19,11 @@ __version__ = "1.0.0"
 # Define package exports
 __all__ = [
     "StudiesApi",
+    "AsyncStudiesApi",
+    "AsyncApiClient",
+    "LazyModel",
+    "LazyPagedStudies",
+    "LazyStudy",
     "ApiResponse",
     "ApiClient",
     "Configuration",
@@ -157,9 +162,6 @@ __all__ = [
     "WhoMasked",
 ]
 
-# import apis into sdk package
-from openapi_client.api.studies_api import StudiesApi as StudiesApi
-
 # import ApiClient
 from openapi_client.api_response import ApiResponse as ApiResponse
 from openapi_client.api_client import ApiClient as ApiClient
@@ -171,132 +173,167 @@ from openapi_client.exceptions import ApiKeyError as ApiKeyError
 from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
 from openapi_client.exceptions import ApiException as ApiException
 
-# import models into sdk package
-from openapi_client.models.adverse_event import AdverseEvent as AdverseEvent
-from openapi_client.models.adverse_events_module import AdverseEventsModule as AdverseEventsModule
-from openapi_client.models.agency_class import AgencyClass as AgencyClass
-from openapi_client.models.agreement_restriction_type import AgreementRestrictionType as AgreementRestrictionType
-from openapi_client.models.analysis_dispersion_type import AnalysisDispersionType as AnalysisDispersionType
-from openapi_client.models.annotation_module import AnnotationModule as AnnotationModule
-from openapi_client.models.annotation_section import AnnotationSection as AnnotationSection
-from openapi_client.models.arm_group import ArmGroup as ArmGroup
-from openapi_client.models.arm_group_type import ArmGroupType as ArmGroupType
-from openapi_client.models.arms_interventions_module import ArmsInterventionsModule as ArmsInterventionsModule
-from openapi_client.models.avail_ipd import AvailIpd as AvailIpd
-from openapi_client.models.baseline_characteristics_module import BaselineCharacteristicsModule as BaselineCharacteristicsModule
-from openapi_client.models.baseline_measure import BaselineMeasure as BaselineMeasure
-from openapi_client.models.bio_spec import BioSpec as BioSpec
-from openapi_client.models.bio_spec_retention import BioSpecRetention as BioSpecRetention
-from openapi_client.models.browse_branch import BrowseBranch as BrowseBranch
-from openapi_client.models.browse_leaf import BrowseLeaf as BrowseLeaf
-from openapi_client.models.browse_leaf_relevance import BrowseLeafRelevance as BrowseLeafRelevance
-from openapi_client.models.browse_module import BrowseModule as BrowseModule
-from openapi_client.models.certain_agreement import CertainAgreement as CertainAgreement
-from openapi_client.models.conditions_module import ConditionsModule as ConditionsModule
-from openapi_client.models.confidence_interval_num_sides import ConfidenceIntervalNumSides as ConfidenceIntervalNumSides
-from openapi_client.models.contact import Contact as Contact
-from openapi_client.models.contact_role import ContactRole as ContactRole
-from openapi_client.models.contacts_locations_module import ContactsLocationsModule as ContactsLocationsModule
-from openapi_client.models.date_struct import DateStruct as DateStruct
-from openapi_client.models.date_type import DateType as DateType
-from openapi_client.models.denom import Denom as Denom
-from openapi_client.models.denom_count import DenomCount as DenomCount
-from openapi_client.models.derived_section import DerivedSection as DerivedSection
-from openapi_client.models.description_module import DescriptionModule as DescriptionModule
-from openapi_client.models.design_allocation import DesignAllocation as DesignAllocation
-from openapi_client.models.design_info import DesignInfo as DesignInfo
-from openapi_client.models.design_masking import DesignMasking as DesignMasking
-from openapi_client.models.design_module import DesignModule as DesignModule
-from openapi_client.models.design_time_perspective import DesignTimePerspective as DesignTimePerspective
-from openapi_client.models.document_section import DocumentSection as DocumentSection
-from openapi_client.models.drop_withdraw import DropWithdraw as DropWithdraw
-from openapi_client.models.eligibility_module import EligibilityModule as EligibilityModule
-from openapi_client.models.enrollment_info import EnrollmentInfo as EnrollmentInfo
-from openapi_client.models.enrollment_type import EnrollmentType as EnrollmentType
-from openapi_client.models.event_assessment import EventAssessment as EventAssessment
-from openapi_client.models.event_group import EventGroup as EventGroup
-from openapi_client.models.event_stats import EventStats as EventStats
-from openapi_client.models.expanded_access_info import ExpandedAccessInfo as ExpandedAccessInfo
-from openapi_client.models.expanded_access_status import ExpandedAccessStatus as ExpandedAccessStatus
-from openapi_client.models.expanded_access_types import ExpandedAccessTypes as ExpandedAccessTypes
-from openapi_client.models.field_node import FieldNode as FieldNode
-from openapi_client.models.first_mcp_info import FirstMcpInfo as FirstMcpInfo
-from openapi_client.models.flow_group import FlowGroup as FlowGroup
-from openapi_client.models.flow_milestone import FlowMilestone as FlowMilestone
-from openapi_client.models.flow_period import FlowPeriod as FlowPeriod
-from openapi_client.models.flow_stats import FlowStats as FlowStats
-from openapi_client.models.geo_point import GeoPoint as GeoPoint
-from openapi_client.models.identification_module import IdentificationModule as IdentificationModule
-from openapi_client.models.intervention import Intervention as Intervention
-from openapi_client.models.intervention_type import InterventionType as InterventionType
-from openapi_client.models.interventional_assignment import InterventionalAssignment as InterventionalAssignment
-from openapi_client.models.ipd_sharing import IpdSharing as IpdSharing
-from openapi_client.models.ipd_sharing_info_type import IpdSharingInfoType as IpdSharingInfoType
-from openapi_client.models.ipd_sharing_statement_module import IpdSharingStatementModule as IpdSharingStatementModule
-from openapi_client.models.large_doc import LargeDoc as LargeDoc
-from openapi_client.models.large_document_module import LargeDocumentModule as LargeDocumentModule
-from openapi_client.models.limitations_and_caveats import LimitationsAndCaveats as LimitationsAndCaveats
-from openapi_client.models.location import Location as Location
-from openapi_client.models.masking_block import MaskingBlock as MaskingBlock
-from openapi_client.models.measure_analysis import MeasureAnalysis as MeasureAnalysis
-from openapi_client.models.measure_category import MeasureCategory as MeasureCategory
-from openapi_client.models.measure_class import MeasureClass as MeasureClass
-from openapi_client.models.measure_dispersion_type import MeasureDispersionType as MeasureDispersionType
-from openapi_client.models.measure_group import MeasureGroup as MeasureGroup
-from openapi_client.models.measure_param import MeasureParam as MeasureParam
-from openapi_client.models.measurement import Measurement as Measurement
-from openapi_client.models.mesh import Mesh as Mesh
-from openapi_client.models.misc_info_module import MiscInfoModule as MiscInfoModule
-from openapi_client.models.more_info_module import MoreInfoModule as MoreInfoModule
-from openapi_client.models.non_inferiority_type import NonInferiorityType as NonInferiorityType
-from openapi_client.models.observational_model import ObservationalModel as ObservationalModel
-from openapi_client.models.official import Official as Official
-from openapi_client.models.official_role import OfficialRole as OfficialRole
-from openapi_client.models.org_study_id_info import OrgStudyIdInfo as OrgStudyIdInfo
-from openapi_client.models.org_study_id_type import OrgStudyIdType as OrgStudyIdType
-from openapi_client.models.organization import Organization as Organization
-from openapi_client.models.outcome import Outcome as Outcome
-from openapi_client.models.outcome_measure import OutcomeMeasure as OutcomeMeasure
-from openapi_client.models.outcome_measure_type import OutcomeMeasureType as OutcomeMeasureType
-from openapi_client.models.outcome_measures_module import OutcomeMeasuresModule as OutcomeMeasuresModule
-from openapi_client.models.outcomes_module import OutcomesModule as OutcomesModule
-from openapi_client.models.oversight_module import OversightModule as OversightModule
-from openapi_client.models.paged_studies import PagedStudies as PagedStudies
-from openapi_client.models.partial_date_struct import PartialDateStruct as PartialDateStruct
-from openapi_client.models.participant_flow_module import ParticipantFlowModule as ParticipantFlowModule
-from openapi_client.models.phase import Phase as Phase
-from openapi_client.models.point_of_contact import PointOfContact as PointOfContact
-from openapi_client.models.primary_purpose import PrimaryPurpose as PrimaryPurpose
-from openapi_client.models.protocol_section import ProtocolSection as ProtocolSection
-from openapi_client.models.recruitment_status import RecruitmentStatus as RecruitmentStatus
-from openapi_client.models.reference import Reference as Reference
-from openapi_client.models.reference_type import ReferenceType as ReferenceType
-from openapi_client.models.references_module import ReferencesModule as ReferencesModule
-from openapi_client.models.reporting_status import ReportingStatus as ReportingStatus
-from openapi_client.models.responsible_party import ResponsibleParty as ResponsibleParty
-from openapi_client.models.responsible_party_type import ResponsiblePartyType as ResponsiblePartyType
-from openapi_client.models.results_section import ResultsSection as ResultsSection
-from openapi_client.models.retraction import Retraction as Retraction
-from openapi_client.models.sampling_method import SamplingMethod as SamplingMethod
-from openapi_client.models.secondary_id_info import SecondaryIdInfo as SecondaryIdInfo
-from openapi_client.models.secondary_id_type import SecondaryIdType as SecondaryIdType
-from openapi_client.models.see_also_link import SeeAlsoLink as SeeAlsoLink
-from openapi_client.models.sex import Sex as Sex
-from openapi_client.models.sponsor import Sponsor as Sponsor
-from openapi_client.models.sponsor_collaborators_module import SponsorCollaboratorsModule as SponsorCollaboratorsModule
-from openapi_client.models.standard_age import StandardAge as StandardAge
-from openapi_client.models.status import Status as Status
-from openapi_client.models.status_module import StatusModule as StatusModule
-from openapi_client.models.study import Study as Study
-from openapi_client.models.study_type import StudyType as StudyType
-from openapi_client.models.submission_info import SubmissionInfo as SubmissionInfo
-from openapi_client.models.submission_tracking import SubmissionTracking as SubmissionTracking
-from openapi_client.models.unposted_annotation import UnpostedAnnotation as UnpostedAnnotation
-from openapi_client.models.unposted_event import UnpostedEvent as UnpostedEvent
-from openapi_client.models.unposted_event_type import UnpostedEventType as UnpostedEventType
-from openapi_client.models.violation_annotation import ViolationAnnotation as ViolationAnnotation
-from openapi_client.models.violation_event import ViolationEvent as ViolationEvent
-from openapi_client.models.violation_event_type import ViolationEventType as ViolationEventType
-from openapi_client.models.web_link import WebLink as WebLink
-from openapi_client.models.who_masked import WhoMasked as WhoMasked
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openapi_client.api.studies_api import StudiesApi as StudiesApi
+    from openapi_client.api.studies_api_async import AsyncStudiesApi as AsyncStudiesApi
+    from openapi_client.api_client_async import AsyncApiClient as AsyncApiClient
+    from openapi_client.lazy import LazyModel as LazyModel
+    from openapi_client.lazy import LazyPagedStudies as LazyPagedStudies
+    from openapi_client.lazy import LazyStudy as LazyStudy
+    from openapi_client.models import AdverseEvent as AdverseEvent
+    from openapi_client.models import AdverseEventsModule as AdverseEventsModule
+    from openapi_client.models import AgencyClass as AgencyClass
+    from openapi_client.models import AgreementRestrictionType as AgreementRestrictionType
+    from openapi_client.models import AnalysisDispersionType as AnalysisDispersionType
+    from openapi_client.models import AnnotationModule as AnnotationModule
+    from openapi_client.models import AnnotationSection as AnnotationSection
+    from openapi_client.models import ArmGroup as ArmGroup
+    from openapi_client.models import ArmGroupType as ArmGroupType
+    from openapi_client.models import ArmsInterventionsModule as ArmsInterventionsModule
+    from openapi_client.models import AvailIpd as AvailIpd
+    from openapi_client.models import BaselineCharacteristicsModule as BaselineCharacteristicsModule
+    from openapi_client.models import BaselineMeasure as BaselineMeasure
+    from openapi_client.models import BioSpec as BioSpec
+    from openapi_client.models import BioSpecRetention as BioSpecRetention
+    from openapi_client.models import BrowseBranch as BrowseBranch
+    from openapi_client.models import BrowseLeaf as BrowseLeaf
+    from openapi_client.models import BrowseLeafRelevance as BrowseLeafRelevance
+    from openapi_client.models import BrowseModule as BrowseModule
+    from openapi_client.models import CertainAgreement as CertainAgreement
+    from openapi_client.models import ConditionsModule as ConditionsModule
+    from openapi_client.models import ConfidenceIntervalNumSides as ConfidenceIntervalNumSides
+    from openapi_client.models import Contact as Contact
+    from openapi_client.models import ContactRole as ContactRole
+    from openapi_client.models import ContactsLocationsModule as ContactsLocationsModule
+    from openapi_client.models import DateStruct as DateStruct
+    from openapi_client.models import DateType as DateType
+    from openapi_client.models import Denom as Denom
+    from openapi_client.models import DenomCount as DenomCount
+    from openapi_client.models import DerivedSection as DerivedSection
+    from openapi_client.models import DescriptionModule as DescriptionModule
+    from openapi_client.models import DesignAllocation as DesignAllocation
+    from openapi_client.models import DesignInfo as DesignInfo
+    from openapi_client.models import DesignMasking as DesignMasking
+    from openapi_client.models import DesignModule as DesignModule
+    from openapi_client.models import DesignTimePerspective as DesignTimePerspective
+    from openapi_client.models import DocumentSection as DocumentSection
+    from openapi_client.models import DropWithdraw as DropWithdraw
+    from openapi_client.models import EligibilityModule as EligibilityModule
+    from openapi_client.models import EnrollmentInfo as EnrollmentInfo
+    from openapi_client.models import EnrollmentType as EnrollmentType
+    from openapi_client.models import EventAssessment as EventAssessment
+    from openapi_client.models import EventGroup as EventGroup
+    from openapi_client.models import EventStats as EventStats
+    from openapi_client.models import ExpandedAccessInfo as ExpandedAccessInfo
+    from openapi_client.models import ExpandedAccessStatus as ExpandedAccessStatus
+    from openapi_client.models import ExpandedAccessTypes as ExpandedAccessTypes
+    from openapi_client.models import FieldNode as FieldNode
+    from openapi_client.models import FirstMcpInfo as FirstMcpInfo
+    from openapi_client.models import FlowGroup as FlowGroup
+    from openapi_client.models import FlowMilestone as FlowMilestone
+    from openapi_client.models import FlowPeriod as FlowPeriod
+    from openapi_client.models import FlowStats as FlowStats
+    from openapi_client.models import GeoPoint as GeoPoint
+    from openapi_client.models import IdentificationModule as IdentificationModule
+    from openapi_client.models import Intervention as Intervention
+    from openapi_client.models import InterventionType as InterventionType
+    from openapi_client.models import InterventionalAssignment as InterventionalAssignment
+    from openapi_client.models import IpdSharing as IpdSharing
+    from openapi_client.models import IpdSharingInfoType as IpdSharingInfoType
+    from openapi_client.models import IpdSharingStatementModule as IpdSharingStatementModule
+    from openapi_client.models import LargeDoc as LargeDoc
+    from openapi_client.models import LargeDocumentModule as LargeDocumentModule
+    from openapi_client.models import LimitationsAndCaveats as LimitationsAndCaveats
+    from openapi_client.models import Location as Location
+    from openapi_client.models import MaskingBlock as MaskingBlock
+    from openapi_client.models import MeasureAnalysis as MeasureAnalysis
+    from openapi_client.models import MeasureCategory as MeasureCategory
+    from openapi_client.models import MeasureClass as MeasureClass
+    from openapi_client.models import MeasureDispersionType as MeasureDispersionType
+    from openapi_client.models import MeasureGroup as MeasureGroup
+    from openapi_client.models import MeasureParam as MeasureParam
+    from openapi_client.models import Measurement as Measurement
+    from openapi_client.models import Mesh as Mesh
+    from openapi_client.models import MiscInfoModule as MiscInfoModule
+    from openapi_client.models import MoreInfoModule as MoreInfoModule
+    from openapi_client.models import NonInferiorityType as NonInferiorityType
+    from openapi_client.models import ObservationalModel as ObservationalModel
+    from openapi_client.models import Official as Official
+    from openapi_client.models import OfficialRole as OfficialRole
+    from openapi_client.models import OrgStudyIdInfo as OrgStudyIdInfo
+    from openapi_client.models import OrgStudyIdType as OrgStudyIdType
+    from openapi_client.models import Organization as Organization
+    from openapi_client.models import Outcome as Outcome
+    from openapi_client.models import OutcomeMeasure as OutcomeMeasure
+    from openapi_client.models import OutcomeMeasureType as OutcomeMeasureType
+    from openapi_client.models import OutcomeMeasuresModule as OutcomeMeasuresModule
+    from openapi_client.models import OutcomesModule as OutcomesModule
+    from openapi_client.models import OversightModule as OversightModule
+    from openapi_client.models import PagedStudies as PagedStudies
+    from openapi_client.models import PartialDateStruct as PartialDateStruct
+    from openapi_client.models import ParticipantFlowModule as ParticipantFlowModule
+    from openapi_client.models import Phase as Phase
+    from openapi_client.models import PointOfContact as PointOfContact
+    from openapi_client.models import PrimaryPurpose as PrimaryPurpose
+    from openapi_client.models import ProtocolSection as ProtocolSection
+    from openapi_client.models import RecruitmentStatus as RecruitmentStatus
+    from openapi_client.models import Reference as Reference
+    from openapi_client.models import ReferenceType as ReferenceType
+    from openapi_client.models import ReferencesModule as ReferencesModule
+    from openapi_client.models import ReportingStatus as ReportingStatus
+    from openapi_client.models import ResponsibleParty as ResponsibleParty
+    from openapi_client.models import ResponsiblePartyType as ResponsiblePartyType
+    from openapi_client.models import ResultsSection as ResultsSection
+    from openapi_client.models import Retraction as Retraction
+    from openapi_client.models import SamplingMethod as SamplingMethod
+    from openapi_client.models import SecondaryIdInfo as SecondaryIdInfo
+    from openapi_client.models import SecondaryIdType as SecondaryIdType
+    from openapi_client.models import SeeAlsoLink as SeeAlsoLink
+    from openapi_client.models import Sex as Sex
+    from openapi_client.models import Sponsor as Sponsor
+    from openapi_client.models import SponsorCollaboratorsModule as SponsorCollaboratorsModule
+    from openapi_client.models import StandardAge as StandardAge
+    from openapi_client.models import Status as Status
+    from openapi_client.models import StatusModule as StatusModule
+    from openapi_client.models import Study as Study
+    from openapi_client.models import StudyType as StudyType
+    from openapi_client.models import SubmissionInfo as SubmissionInfo
+    from openapi_client.models import SubmissionTracking as SubmissionTracking
+    from openapi_client.models import UnpostedAnnotation as UnpostedAnnotation
+    from openapi_client.models import UnpostedEvent as UnpostedEvent
+    from openapi_client.models import UnpostedEventType as UnpostedEventType
+    from openapi_client.models import ViolationAnnotation as ViolationAnnotation
+    from openapi_client.models import ViolationEvent as ViolationEvent
+    from openapi_client.models import ViolationEventType as ViolationEventType
+    from openapi_client.models import WebLink as WebLink
+    from openapi_client.models import WhoMasked as WhoMasked
+
+# APIs and models are imported on first access (PEP 562); see
+# openapi_client.models. The asyncio classes additionally need httpx.
+_LAZY_ATTRIBUTES = {
+    "StudiesApi": "openapi_client.api.studies_api",
+    "AsyncStudiesApi": "openapi_client.api.studies_api_async",
+    "AsyncApiClient": "openapi_client.api_client_async",
+    "LazyModel": "openapi_client.lazy",
+    "LazyPagedStudies": "openapi_client.lazy",
+    "LazyStudy": "openapi_client.lazy",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    elif name in __all__:
+        value = getattr(importlib.import_module("openapi_client.models"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,25 @@
 # flake8: noqa
 
-# import apis into api package
-from openapi_client.api.studies_api import StudiesApi
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from openapi_client.api.studies_api import StudiesApi
+    from openapi_client.api.studies_api_async import AsyncStudiesApi
+
+# import apis into api package on first access (PEP 562)
+_APIS = {
+    "StudiesApi": "openapi_client.api.studies_api",
+    "AsyncStudiesApi": "openapi_client.api.studies_api_async",
+}
+
+__all__ = list(_APIS)
+
+
+def __getattr__(name):
+    module = _APIS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
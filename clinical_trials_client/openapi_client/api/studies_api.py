@@ -13,7 +13,7 @@
 
 import warnings
 from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from pydantic import Field, StrictBool, StrictStr, field_validator
@@ -24,10 +24,231 @@ from openapi_client.models.status import Status
 
 from openapi_client.api_client import ApiClient, RequestSerialized
 from openapi_client.api_response import ApiResponse
+from openapi_client.pagination import StudyType, iter_studies
 from openapi_client.rest import RESTResponseType
 
 
-class StudiesApi:
+class BaseStudiesApi:
+    """Request serialization shared by :class:`StudiesApi` and
+    :class:`AsyncStudiesApi`, which send the requests.
+    """
+
+    # An ApiClient or AsyncApiClient, set by the subclass
+    api_client: Any
+
+    def _list_studies_serialize(
+        self,
+        format,
+        markup_format,
+        query_cond,
+        query_term,
+        query_locn,
+        query_titles,
+        query_intr,
+        query_outc,
+        query_spons,
+        query_lead,
+        query_id,
+        query_patient,
+        filter_overall_status,
+        filter_geo,
+        filter_ids,
+        filter_advanced,
+        filter_synonyms,
+        post_filter_overall_status,
+        post_filter_geo,
+        post_filter_ids,
+        post_filter_advanced,
+        post_filter_synonyms,
+        agg_filters,
+        geo_decay,
+        fields,
+        sort,
+        count_total,
+        page_size,
+        page_token,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'filter.overallStatus': 'pipes',
+            'filter.ids': 'pipes',
+            'filter.synonyms': 'pipes',
+            'postFilter.overallStatus': 'pipes',
+            'postFilter.ids': 'pipes',
+            'postFilter.synonyms': 'pipes',
+            'fields': 'pipes',
+            'sort': 'pipes',
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if format is not None:
+            
+            _query_params.append(('format', format))
+            
+        if markup_format is not None:
+            
+            _query_params.append(('markupFormat', markup_format))
+            
+        if query_cond is not None:
+            
+            _query_params.append(('query.cond', query_cond))
+            
+        if query_term is not None:
+            
+            _query_params.append(('query.term', query_term))
+            
+        if query_locn is not None:
+            
+            _query_params.append(('query.locn', query_locn))
+            
+        if query_titles is not None:
+            
+            _query_params.append(('query.titles', query_titles))
+            
+        if query_intr is not None:
+            
+            _query_params.append(('query.intr', query_intr))
+            
+        if query_outc is not None:
+            
+            _query_params.append(('query.outc', query_outc))
+            
+        if query_spons is not None:
+            
+            _query_params.append(('query.spons', query_spons))
+            
+        if query_lead is not None:
+            
+            _query_params.append(('query.lead', query_lead))
+            
+        if query_id is not None:
+            
+            _query_params.append(('query.id', query_id))
+            
+        if query_patient is not None:
+            
+            _query_params.append(('query.patient', query_patient))
+            
+        if filter_overall_status is not None:
+            
+            _query_params.append(('filter.overallStatus', filter_overall_status))
+            
+        if filter_geo is not None:
+            
+            _query_params.append(('filter.geo', filter_geo))
+            
+        if filter_ids is not None:
+            
+            _query_params.append(('filter.ids', filter_ids))
+            
+        if filter_advanced is not None:
+            
+            _query_params.append(('filter.advanced', filter_advanced))
+            
+        if filter_synonyms is not None:
+            
+            _query_params.append(('filter.synonyms', filter_synonyms))
+            
+        if post_filter_overall_status is not None:
+            
+            _query_params.append(('postFilter.overallStatus', post_filter_overall_status))
+            
+        if post_filter_geo is not None:
+            
+            _query_params.append(('postFilter.geo', post_filter_geo))
+            
+        if post_filter_ids is not None:
+            
+            _query_params.append(('postFilter.ids', post_filter_ids))
+            
+        if post_filter_advanced is not None:
+            
+            _query_params.append(('postFilter.advanced', post_filter_advanced))
+            
+        if post_filter_synonyms is not None:
+            
+            _query_params.append(('postFilter.synonyms', post_filter_synonyms))
+            
+        if agg_filters is not None:
+            
+            _query_params.append(('aggFilters', agg_filters))
+            
+        if geo_decay is not None:
+            
+            _query_params.append(('geoDecay', geo_decay))
+            
+        if fields is not None:
+            
+            _query_params.append(('fields', fields))
+            
+        if sort is not None:
+            
+            _query_params.append(('sort', sort))
+            
+        if count_total is not None:
+            
+            _query_params.append(('countTotal', count_total))
+            
+        if page_size is not None:
+            
+            _query_params.append(('pageSize', page_size))
+            
+        if page_token is not None:
+            
+            _query_params.append(('pageToken', page_token))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json', 
+                    'text/plain'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/studies',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+class StudiesApi(BaseStudiesApi):
     """NOTE: This class is auto generated by OpenAPI Generator
     Ref: https://openapi-generator.tech
 
@@ -576,215 +797,36 @@ class StudiesApi:
         return response_data.response
 
 
-    def _list_studies_serialize(
+    def iter_studies(
         self,
-        format,
-        markup_format,
-        query_cond,
-        query_term,
-        query_locn,
-        query_titles,
-        query_intr,
-        query_outc,
-        query_spons,
-        query_lead,
-        query_id,
-        query_patient,
-        filter_overall_status,
-        filter_geo,
-        filter_ids,
-        filter_advanced,
-        filter_synonyms,
-        post_filter_overall_status,
-        post_filter_geo,
-        post_filter_ids,
-        post_filter_advanced,
-        post_filter_synonyms,
-        agg_filters,
-        geo_decay,
-        fields,
-        sort,
-        count_total,
-        page_size,
-        page_token,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            'filter.overallStatus': 'pipes',
-            'filter.ids': 'pipes',
-            'filter.synonyms': 'pipes',
-            'postFilter.overallStatus': 'pipes',
-            'postFilter.ids': 'pipes',
-            'postFilter.synonyms': 'pipes',
-            'fields': 'pipes',
-            'sort': 'pipes',
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[
-            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
-        ] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if format is not None:
-            
-            _query_params.append(('format', format))
-            
-        if markup_format is not None:
-            
-            _query_params.append(('markupFormat', markup_format))
-            
-        if query_cond is not None:
-            
-            _query_params.append(('query.cond', query_cond))
-            
-        if query_term is not None:
-            
-            _query_params.append(('query.term', query_term))
-            
-        if query_locn is not None:
-            
-            _query_params.append(('query.locn', query_locn))
-            
-        if query_titles is not None:
-            
-            _query_params.append(('query.titles', query_titles))
-            
-        if query_intr is not None:
-            
-            _query_params.append(('query.intr', query_intr))
-            
-        if query_outc is not None:
-            
-            _query_params.append(('query.outc', query_outc))
-            
-        if query_spons is not None:
-            
-            _query_params.append(('query.spons', query_spons))
-            
-        if query_lead is not None:
-            
-            _query_params.append(('query.lead', query_lead))
-            
-        if query_id is not None:
-            
-            _query_params.append(('query.id', query_id))
-            
-        if query_patient is not None:
-            
-            _query_params.append(('query.patient', query_patient))
-            
-        if filter_overall_status is not None:
-            
-            _query_params.append(('filter.overallStatus', filter_overall_status))
-            
-        if filter_geo is not None:
-            
-            _query_params.append(('filter.geo', filter_geo))
-            
-        if filter_ids is not None:
-            
-            _query_params.append(('filter.ids', filter_ids))
-            
-        if filter_advanced is not None:
-            
-            _query_params.append(('filter.advanced', filter_advanced))
-            
-        if filter_synonyms is not None:
-            
-            _query_params.append(('filter.synonyms', filter_synonyms))
-            
-        if post_filter_overall_status is not None:
-            
-            _query_params.append(('postFilter.overallStatus', post_filter_overall_status))
-            
-        if post_filter_geo is not None:
-            
-            _query_params.append(('postFilter.geo', post_filter_geo))
-            
-        if post_filter_ids is not None:
-            
-            _query_params.append(('postFilter.ids', post_filter_ids))
-            
-        if post_filter_advanced is not None:
-            
-            _query_params.append(('postFilter.advanced', post_filter_advanced))
-            
-        if post_filter_synonyms is not None:
-            
-            _query_params.append(('postFilter.synonyms', post_filter_synonyms))
-            
-        if agg_filters is not None:
-            
-            _query_params.append(('aggFilters', agg_filters))
-            
-        if geo_decay is not None:
-            
-            _query_params.append(('geoDecay', geo_decay))
-            
-        if fields is not None:
-            
-            _query_params.append(('fields', fields))
-            
-        if sort is not None:
-            
-            _query_params.append(('sort', sort))
-            
-        if count_total is not None:
-            
-            _query_params.append(('countTotal', count_total))
-            
-        if page_size is not None:
-            
-            _query_params.append(('pageSize', page_size))
-            
-        if page_token is not None:
-            
-            _query_params.append(('pageToken', page_token))
-            
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-
-        # set the HTTP header `Accept`
-        if 'Accept' not in _header_params:
-            _header_params['Accept'] = self.api_client.select_header_accept(
-                [
-                    'application/json', 
-                    'text/plain'
-                ]
-            )
-
-
-        # authentication setting
-        _auth_settings: List[str] = [
-        ]
-
-        return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/studies',
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth
+        max_results: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        lazy: bool = False,
+        prefetch: bool = True,
+        **params: Any,
+    ) -> Generator[StudyType, None, None]:
+        """Studies of all pages of a search, following `nextPageToken`
+
+        The next page is downloaded in the background while the current one
+        is consumed; at most two pages are held in memory.
+
+        :param max_results: stop after this many studies.
+        :type max_results: int, optional
+        :param max_pages: stop after this many pages.
+        :type max_pages: int, optional
+        :param lazy: yield `LazyStudy` views instead of `Study` models.
+        :type lazy: bool
+        :param prefetch: download the next page ahead of time.
+        :type prefetch: bool
+        :param params: parameters of `list_studies`; `page_token` resumes a
+                       search at that page.
+        :return: Iterator over the studies.
+        """
+        return iter_studies(
+            self,
+            max_results=max_results,
+            max_pages=max_pages,
+            lazy=lazy,
+            prefetch=prefetch,
+            **params
         )
-
-
@@ -24,8 +24,8 @@ import tempfile
 import uuid
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Callable, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr
 
 from openapi_client.configuration import Configuration
 from openapi_client.api_response import ApiResponse, T as ApiResponseT
@@ -43,13 +43,9 @@ from openapi_client.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
-class ApiClient:
-    """Generic API client for OpenAPI client library builds.
-
-    OpenAPI generic API client. This client handles the client-
-    server communication, and is invariant across implementations. Specifics of
-    the methods and models for each application are generated from the OpenAPI
-    templates.
+class BaseApiClient:
+    """Request serialization and response deserialization shared by
+    :class:`ApiClient` and :class:`AsyncApiClient`, which add the transport.
 
     :param configuration: .Configuration object for this client
     :param header_name: a header to pass when making calls to the API.
@@ -72,6 +68,8 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    # The transport, set by the sync and async clients
+    rest_client_class: type
 
     def __init__(
         self,
@@ -85,7 +83,7 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self.rest_client_class(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,12 +91,7 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self._deserialization_plans: Dict[str, Callable[[Any], Any]] = {}
 
     @property
     def user_agent(self):
@@ -112,33 +105,6 @@ class ApiClient:
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
-
-    _default = None
-
-    @classmethod
-    def get_default(cls):
-        """Return new instance of ApiClient.
-
-        This method returns newly created, based on default constructor,
-        object of ApiClient class or returns a copy of default
-        ApiClient.
-
-        :return: The ApiClient object.
-        """
-        if cls._default is None:
-            cls._default = ApiClient()
-        return cls._default
-
-    @classmethod
-    def set_default(cls, default):
-        """Set default instance of ApiClient.
-
-        It stores default ApiClient.
-
-        :param default: object of ApiClient.
-        """
-        cls._default = default
-
     def param_serialize(
         self,
         method,
@@ -248,41 +214,6 @@ class ApiClient:
         return method, url, header_params, body, post_params
 
 
-    def call_api(
-        self,
-        method,
-        url,
-        header_params=None,
-        body=None,
-        post_params=None,
-        _request_timeout=None
-    ) -> rest.RESTResponse:
-        """Makes the HTTP request (synchronous)
-        :param method: Method to call.
-        :param url: Path to method endpoint.
-        :param header_params: Header parameters to be
-            placed in the request header.
-        :param body: Request body.
-        :param post_params dict: Request post form parameters,
-            for `application/x-www-form-urlencoded`, `multipart/form-data`.
-        :param _request_timeout: timeout setting for this request.
-        :return: RESTResponse
-        """
-
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
-                method, url,
-                headers=header_params,
-                body=body, post_params=post_params,
-                _request_timeout=_request_timeout
-            )
-
-        except ApiException as e:
-            raise e
-
-        return response_data
-
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -394,7 +325,7 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: str, response_type: Union[str, type], content_type: Optional[str]):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
@@ -405,17 +336,19 @@ class ApiClient:
         :return: deserialized object.
         """
 
+        json_codec = self.configuration.json_codec
+
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
             except ValueError:
                 data = response_text
         elif re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
             if response_text == "":
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -438,40 +371,75 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
-            if klass.startswith('List['):
-                m = re.match(r'List\[(.*)]', klass)
-                assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('Dict['):
-                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
-                assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(openapi_client.models, klass)
+            return self.deserializer_for(klass)(data)
+
+        return self.__converter_for_class(klass)(data)
+
+    def deserializer_for(self, klass: str):
+        """Returns the cached deserialization plan for a response type.
+
+        The plan is a callable taking decoded JSON and returning the
+        deserialized object. It is built once per type string: `List[...]`
+        and `Dict[...]` are unwrapped and the class is resolved up front, so
+        deserializing a page does no regex matching or attribute lookup per
+        value.
+
+        :param klass: string of class name, e.g. `List[Study]`.
+        """
+        plan = self._deserialization_plans.get(klass)
+        if plan is None:
+            plan = self.__build_plan(klass)
+            self._deserialization_plans[klass] = plan
+        return plan
+
+    def __build_plan(self, klass: str):
+        if klass.startswith('List['):
+            m = re.match(r'List\[(.*)]', klass)
+            assert m is not None, "Malformed List type definition"
+            sub_plan = self.deserializer_for(m.group(1))
+            return lambda data: None if data is None else [
+                None if sub_data is None else sub_plan(sub_data)
+                for sub_data in data
+            ]
 
+        if klass.startswith('Dict['):
+            m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+            assert m is not None, "Malformed Dict type definition"
+            sub_plan = self.deserializer_for(m.group(2))
+            return lambda data: None if data is None else {
+                k: None if v is None else sub_plan(v)
+                for k, v in data.items()
+            }
+
+        # convert str to class
+        if klass in self.NATIVE_TYPES_MAPPING:
+            cls = self.NATIVE_TYPES_MAPPING[klass]
+        else:
+            cls = getattr(openapi_client.models, klass)
+        convert = self.__converter_for_class(cls)
+        return lambda data: None if data is None else convert(data)
+
+    def __converter_for_class(self, klass):
+        """Returns the function deserializing non-null data into klass."""
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda data: self.__deserialize_primitive(data, klass)
         elif klass is object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass is datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass is datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return self.__deserialize_datetime
         elif klass is decimal.Decimal:
-            return decimal.Decimal(data)
+            return decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return lambda data: self.__deserialize_enum(data, klass)
+        elif issubclass(klass, BaseModel):
+            # The generated from_dict only maps aliases and recurses into
+            # from_dict of nested models before validating the result again;
+            # pydantic resolves aliases and nested models itself in one pass.
+            return klass.model_validate
         else:
-            return self.__deserialize_model(data, klass)
+            return lambda data: self.__deserialize_model(data, klass)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -802,3 +770,93 @@ class ApiClient:
         """
 
         return klass.from_dict(data)
+
+
+class ApiClient(BaseApiClient):
+    """Generic API client for OpenAPI client library builds.
+
+    OpenAPI generic API client. This client handles the client-
+    server communication, and is invariant across implementations. Specifics of
+    the methods and models for each application are generated from the OpenAPI
+    templates.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    rest_client_class = rest.RESTClientObject
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Releases the pooled connections held by the REST client."""
+        self.rest_client.close()
+
+    _default = None
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of ApiClient.
+
+        This method returns newly created, based on default constructor,
+        object of ApiClient class or returns a copy of default
+        ApiClient.
+
+        :return: The ApiClient object.
+        """
+        if cls._default is None:
+            cls._default = ApiClient()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Set default instance of ApiClient.
+
+        It stores default ApiClient.
+
+        :param default: object of ApiClient.
+        """
+        cls._default = default
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Makes the HTTP request (synchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: RESTResponse
+        """
+
+        try:
+            # perform request and return response
+            response_data = self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        return response_data
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+"""  # noqa: E501
+
+
+from openapi_client import rest_async
+from openapi_client.api_client import BaseApiClient
+from openapi_client.exceptions import ApiException
+
+
+class AsyncApiClient(BaseApiClient):
+    """ApiClient whose requests are awaited on the running event loop.
+
+    Request serialization (`param_serialize`) and response deserialization
+    (`response_deserialize`) are shared with :class:`ApiClient` through
+    :class:`BaseApiClient`; only the transport differs. Use it as an async
+    context manager, or call :meth:`close` when done, to release the pooled
+    connections.
+    """
+
+    rest_client_class = rest_async.AsyncRESTClientObject
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Releases the pooled connections held by the REST client."""
+        await self.rest_client.close()
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest_async.AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: AsyncRESTResponse
+        """
+
+        try:
+            # perform request and return response
+            response_data = await self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        return response_data
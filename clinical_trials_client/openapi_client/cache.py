@@ -0,0 +1,411 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    Response cache for GET requests: an in-memory LRU tier in front of an
+    optional SQLite tier that survives restarts. Freshness is chosen per
+    request with a `Cache-Control` request header, so callers can give
+    different kinds of queries different lifetimes.
+"""  # noqa: E501
+
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+# lookup states
+MISS = "miss"
+FRESH = "fresh"
+STALE = "stale"  # servable while it is revalidated in the background
+EXPIRED = "expired"  # must be revalidated before it is served
+
+# headers describing the connection or the encoded body rather than the
+# (decoded) content that is cached
+_UNCACHED_HEADERS = frozenset([
+    "connection",
+    "keep-alive",
+    "transfer-encoding",
+    "content-encoding",
+    "content-length",
+    "date",
+    "age",
+])
+
+
+class CacheEntry:
+    """A cached response body with its headers and validators."""
+
+    __slots__ = ("status", "headers", "body", "stored_at")
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes, stored_at: float) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def age(self, now: Optional[float] = None) -> float:
+        return max(0.0, (now if now is not None else time.time()) - self.stored_at)
+
+
+class CachePolicy:
+    """Freshness requirements of one request, parsed from its
+    `Cache-Control` header.
+
+    Supported directives: `max-age` (seconds a cached response stays
+    fresh), `stale-while-revalidate` (seconds after that during which the
+    stale response is served while it is refreshed in the background),
+    `max-stale` (accept a stale response without revalidating it; any age
+    if no value is given), `only-if-cached` (never go upstream; a miss is
+    answered with 504), `no-cache` (always revalidate) and `no-store`
+    (bypass the cache).
+    """
+
+    __slots__ = ("max_age", "stale_while_revalidate", "max_stale", "only_if_cached", "no_cache", "no_store")
+
+    def __init__(
+        self,
+        max_age: float,
+        stale_while_revalidate: float = 0.0,
+        max_stale: Optional[float] = None,
+        only_if_cached: bool = False,
+        no_cache: bool = False,
+        no_store: bool = False,
+    ) -> None:
+        self.max_age = max_age
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_stale = max_stale
+        self.only_if_cached = only_if_cached
+        self.no_cache = no_cache
+        self.no_store = no_store
+
+    @classmethod
+    def parse(cls, value: Optional[str], default: "CachePolicy") -> "CachePolicy":
+        policy = cls(default.max_age, default.stale_while_revalidate)
+        if not value:
+            return policy
+        for directive in value.split(","):
+            name, _, argument = directive.strip().partition("=")
+            name = name.strip().lower()
+            try:
+                seconds = float(argument.strip().strip('"')) if argument else None
+            except ValueError:
+                continue
+            if name == "max-age" and seconds is not None:
+                policy.max_age = seconds
+            elif name == "stale-while-revalidate" and seconds is not None:
+                policy.stale_while_revalidate = seconds
+            elif name == "max-stale":
+                policy.max_stale = float("inf") if seconds is None else seconds
+            elif name == "only-if-cached":
+                policy.only_if_cached = True
+            elif name == "no-cache":
+                policy.no_cache = True
+            elif name == "no-store":
+                policy.no_store = True
+        return policy
+
+    def state(self, entry: Optional[CacheEntry], now: Optional[float] = None) -> str:
+        if entry is None:
+            return MISS
+        age = entry.age(now)
+        if self.no_cache:
+            return EXPIRED
+        if age <= self.max_age:
+            return FRESH
+        if self.max_stale is not None and age <= self.max_age + self.max_stale:
+            return FRESH
+        if age <= self.max_age + self.stale_while_revalidate:
+            return STALE
+        return EXPIRED
+
+
+class MemoryTier:
+    """LRU of entries bounded by the total size of their bodies."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self.discard(key)
+        if len(entry.body) > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.bytes += len(entry.body)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted.body)
+            self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry.body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskTier:
+    """Entries in a SQLite file, evicted least recently used first once
+    the bodies exceed max_bytes. Safe to share between processes.
+
+    Triggers keep the total size of the bodies in a one-row table, so
+    writes and stats do not have to sum the whole cache. Calls block on
+    file I/O; async callers run them in a worker thread.
+    """
+
+    # rows examined per step of an eviction
+    EVICTION_BATCH = 64
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status INTEGER NOT NULL, headers TEXT NOT NULL, "
+                "body BLOB NOT NULL, size INTEGER NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS responses_size (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)"
+            )
+            cursor.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_inserted AFTER INSERT ON responses "
+                "BEGIN UPDATE responses_size SET bytes = bytes + new.size; END"
+            )
+            cursor.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_updated AFTER UPDATE OF size ON responses "
+                "BEGIN UPDATE responses_size SET bytes = bytes + new.size - old.size; END"
+            )
+            cursor.execute(
+                "CREATE TRIGGER IF NOT EXISTS responses_deleted AFTER DELETE ON responses "
+                "BEGIN UPDATE responses_size SET bytes = bytes - old.size; END"
+            )
+            # Files written before the size was tracked are summed once
+            if cursor.execute("SELECT 1 FROM responses_size").fetchone() is None:
+                cursor.execute("INSERT INTO responses_size (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM responses")
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection.execute(
+            "SELECT status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(row[0], json.loads(row[1]), bytes(row[2]), row[3])
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        size = len(entry.body)
+        if size > self.max_bytes:
+            self.discard(key)
+            return
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete
+        # would not fire the size trigger
+        self._connection.execute(
+            "INSERT INTO responses (key, status, headers, body, size, stored_at, used_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET status = excluded.status, headers = excluded.headers, "
+            "body = excluded.body, size = excluded.size, stored_at = excluded.stored_at, used_at = excluded.used_at",
+            (key, entry.status, json.dumps(entry.headers), entry.body, size, entry.stored_at, time.time()),
+        )
+        self._evict()
+
+    def discard(self, key: str) -> None:
+        self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _evict(self) -> None:
+        while self.bytes > self.max_bytes:
+            rows = self._connection.execute(
+                "SELECT key FROM responses ORDER BY used_at LIMIT ?", (self.EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                return
+            for (key,) in rows:
+                self.discard(key)
+                self.evictions += 1
+                if self.bytes <= self.max_bytes:
+                    return
+
+    @property
+    def bytes(self) -> int:
+        return self._connection.execute("SELECT bytes FROM responses_size").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ResponseCache:
+    """Two-tier cache of GET responses keyed by URL.
+
+    :param max_age: seconds a response stays fresh unless the request's
+        Cache-Control says otherwise.
+    :param stale_while_revalidate: seconds a stale response is still
+        served while it is refreshed in the background.
+    :param memory_bytes: bound on the bodies kept in memory.
+    :param disk_path: SQLite file of the on-disk tier; memory only if None.
+    :param disk_bytes: bound on the bodies kept on disk.
+    """
+
+    def __init__(
+        self,
+        max_age: float = 300.0,
+        stale_while_revalidate: float = 0.0,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        disk_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.default_policy = CachePolicy(max_age, stale_while_revalidate)
+        self.memory = MemoryTier(memory_bytes)
+        self.disk = DiskTier(disk_path, disk_bytes) if disk_path else None
+        self._lock = threading.Lock()
+        self._revalidating: Set[str] = set()
+        self._stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "not_modified": 0,
+            "stores": 0,
+            "bytes_served": 0,
+            "bytes_stored": 0,
+        }
+
+    def policy(self, cache_control: Optional[str]) -> CachePolicy:
+        """The freshness policy of a request with this Cache-Control."""
+        return CachePolicy.parse(cache_control, self.default_policy)
+
+    def lookup(self, key: str, policy: CachePolicy) -> Tuple[Optional[CacheEntry], str]:
+        """Finds the entry for key and classifies it under policy."""
+        with self._lock:
+            entry = self.memory.get(key)
+            tier = "memory_hits"
+            if entry is None and self.disk is not None:
+                entry = self.disk.get(key)
+                tier = "disk_hits"
+                if entry is not None:
+                    self.memory.put(key, entry)
+            state = policy.state(entry)
+            if entry is not None and (state == FRESH or state == STALE):
+                self._stats["hits"] += 1
+                self._stats[tier] += 1
+                self._stats["bytes_served"] += len(entry.body)
+                if state == STALE:
+                    self._stats["stale_hits"] += 1
+            elif state == MISS:
+                self._stats["misses"] += 1
+            else:
+                self._stats["revalidations"] += 1
+            return entry, state
+
+    def store(self, key: str, status: int, headers, body: bytes) -> CacheEntry:
+        """Stores a response; returns the new entry."""
+        entry = CacheEntry(
+            status,
+            {k.lower(): v for k, v in headers.items() if k.lower() not in _UNCACHED_HEADERS},
+            body,
+            time.time(),
+        )
+        with self._lock:
+            self.memory.put(key, entry)
+            if self.disk is not None:
+                self.disk.put(key, entry)
+            self._stats["stores"] += 1
+            self._stats["bytes_stored"] += len(body)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, headers) -> CacheEntry:
+        """Marks entry fresh again after a 304 Not Modified."""
+        updated = {k.lower(): v for k, v in headers.items() if k.lower() not in _UNCACHED_HEADERS}
+        entry = CacheEntry(entry.status, dict(entry.headers, **updated), entry.body, time.time())
+        with self._lock:
+            self.memory.put(key, entry)
+            if self.disk is not None:
+                self.disk.put(key, entry)
+            self._stats["not_modified"] += 1
+            self._stats["bytes_served"] += len(entry.body)
+        return entry
+
+    def validators(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Conditional request headers revalidating entry."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def start_revalidation(self, key: str) -> bool:
+        """Claims the background refresh of key; False if one is running."""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def finish_revalidation(self, key: str) -> None:
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def response_headers(self, entry: CacheEntry, state: str) -> Dict[str, str]:
+        """Headers of a response served from entry."""
+        headers = dict(entry.headers)
+        headers["content-length"] = str(len(entry.body))
+        headers["age"] = str(int(entry.age()))
+        headers["x-cache"] = "STALE" if state == STALE else "HIT"
+        return headers
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the size of both tiers."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self.memory)
+            stats["memory_bytes"] = self.memory.bytes
+            stats["evictions"] = self.memory.evictions
+            if self.disk is not None:
+                stats["disk_bytes"] = self.disk.bytes
+                stats["evictions"] += self.disk.evictions
+            return stats
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,94 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    JSON codecs used to decode response bodies and encode models. The
+    codec in use is selected by `Configuration.json_codec`.
+"""  # noqa: E501
+
+
+import datetime
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _encode_default(obj: Any) -> Any:
+    """Encodes dates and datetimes in ISO 8601, as orjson does."""
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+class JsonCodec:
+    """Standard library JSON codec. Dates and datetimes are encoded in ISO
+    8601 and NaN or infinite floats are rejected, so that it produces the
+    same documents as orjson."""
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """Encodes obj as a JSON string."""
+        return json.dumps(obj, default=_encode_default, allow_nan=False)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Encodes obj as UTF-8 JSON bytes."""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=_encode_default, allow_nan=False
+        ).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return "<%s %s>" % (type(self).__name__, self.name)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec; several times faster than the standard library
+    on large study pages. Dates and datetimes are encoded natively."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+CODECS: Dict[str, type] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Returns a codec by name.
+
+    :param name: "json", "orjson", or None/"auto" for the fastest installed
+        codec (orjson if available, the standard library otherwise).
+    """
+    if name is None or name == "auto":
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError("Unknown JSON codec: %s" % name) from None
@@ -18,11 +18,13 @@ import logging
 from logging import FileHandler
 import multiprocessing
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, TypedDict, Union
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from openapi_client.cache import ResponseCache
+from openapi_client.codec import JsonCodec, get_codec
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -285,6 +287,16 @@ class Configuration:
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_block = False
+        """Set this to True to make requests wait for a free pooled
+           connection instead of opening (and discarding) an extra one once
+           connection_pool_maxsize connections are in use.
+        """
+        self.timeout: Optional[Union[float, Tuple[float, float]]] = None
+        """Default timeout for every request, either a total number of
+           seconds or a (connection, read) tuple. A `_request_timeout`
+           passed to an operation takes precedence.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -298,6 +310,36 @@ class Configuration:
         self.retries = retries
         """Adding retries to override urllib3 default value 3
         """
+        self.rate_limit: Optional[float] = None
+        """Requests per second sent to the host; None for no client-side
+           limit. Requests over the limit wait for a token.
+        """
+        self.rate_limit_burst: Optional[float] = None
+        """Requests that may be sent at once before rate_limit applies;
+           defaults to one second worth of requests.
+        """
+        self.rate_limit_file: Optional[str] = None
+        """SQLite file holding the rate limiter state, to share one limit
+           between processes (e.g. server workers). In-process if None.
+        """
+        self.throttle_retries = 3
+        """Times a request answered with 429 or 503 is retried, honouring
+           the Retry-After header or backing off exponentially with jitter.
+        """
+        self.backoff_base = 0.5
+        """First backoff delay in seconds for throttled requests; doubled
+           on every further retry.
+        """
+        self.backoff_max = 30.0
+        """Longest backoff in seconds; a longer Retry-After is not waited
+           for and the throttled response is returned.
+        """
+        self.response_cache: Optional[ResponseCache] = None
+        """openapi_client.cache.ResponseCache answering GET requests; None
+           disables caching. A `Cache-Control` header passed with
+           `_headers` sets the freshness required by a single request
+           and is not sent to the server.
+        """
         # Enable client side validation
         self.client_side_validation = True
 
@@ -313,15 +355,23 @@ class Configuration:
         """date format
         """
 
+        self.json_codec: JsonCodec = get_codec()
+        """JSON codec used to decode responses and encode request bodies
+           and models (see openapi_client.codec). Defaults to orjson when
+           it is installed, the standard library json module otherwise.
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'response_cache'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # copies share the response cache
+        result.response_cache = self.response_cache
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
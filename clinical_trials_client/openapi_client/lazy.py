@@ -0,0 +1,192 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    Lazily materialized views of the generated models. A view keeps the
+    decoded JSON dict and only validates a field when it is first read, so
+    code that lists studies but reads a handful of fields allocates a
+    fraction of the objects a fully validated `Study` would.
+"""  # noqa: E501
+
+
+import pprint
+import typing
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from openapi_client.configuration import Configuration
+from openapi_client.models.paged_studies import PagedStudies
+from openapi_client.models.study import Study
+
+# field kinds
+_VALUE = 0
+_MODEL = 1
+_MODEL_LIST = 2
+
+_views: Dict[Type[BaseModel], Type["LazyModel"]] = {}
+
+
+def _field_kind(annotation) -> Tuple[int, Optional[Type[BaseModel]]]:
+    """Classifies a field annotation as a nested model, a list of models
+    or any other value."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return _VALUE, None
+        annotation = args[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _MODEL, annotation
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return _MODEL_LIST, item
+    return _VALUE, None
+
+
+def lazy_model(model: Type[BaseModel]) -> Type["LazyModel"]:
+    """Returns the lazy view class of a generated model."""
+    view = _views.get(model)
+    if view is None:
+        view = type("Lazy" + model.__name__, (LazyModel,), {"model": model, "__slots__": ()})
+        _views[model] = view
+    return view
+
+
+class LazyModel:
+    """Read-only view of a generated model backed by its JSON dict.
+
+    Attributes have the same names and values as on the model. Nested
+    models are returned as views themselves and are only validated when
+    one of their own fields is read; other fields are validated against
+    the model's field definition (including its validators) on first
+    access and cached. `to_dict` and `to_json` produce the same output as
+    the model, and `materialize` returns the fully validated model.
+    """
+
+    model: ClassVar[Type[BaseModel]]
+    _fields: ClassVar[Dict[str, Tuple[str, int, Optional[Type[BaseModel]]]]]
+
+    __slots__ = ("_raw", "_values")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_values", {})
+
+    @classmethod
+    def __fields(cls) -> Dict[str, Tuple[str, int, Optional[Type[BaseModel]]]]:
+        fields = cls.__dict__.get("_fields")
+        if fields is None:
+            fields = {}
+            for name, info in cls.model.model_fields.items():
+                kind, nested = _field_kind(info.annotation)
+                fields[name] = (info.alias or name, kind, nested)
+            cls._fields = fields
+        return fields
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create a view from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            raise TypeError("%s expects a dict, got %s" % (cls.__name__, type(obj).__name__))
+
+        return cls(obj)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create a view from a JSON string"""
+        return cls.from_dict(Configuration.get_default().json_codec.loads(json_str))
+
+    def __getattr__(self, name: str) -> Any:
+        field = self.__fields().get(name)
+        if field is None:
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        alias, kind, nested = field
+        data = self._raw.get(alias)
+        if data is None:
+            value = self.model.model_fields[name].get_default(call_default_factory=True)
+            if value is not None and kind == _VALUE:
+                value = self.__validate(name, value)
+        elif nested is None:
+            value = self.__validate(name, data)
+        elif kind == _MODEL:
+            value = lazy_model(nested)(data)
+        else:
+            view = lazy_model(nested)
+            value = [None if item is None else view(item) for item in data]
+        values[name] = value
+        return value
+
+    def __validate(self, name: str, data: Any) -> Any:
+        # Validating an assignment on an empty instance runs the field's
+        # type coercion and validators without touching the other fields.
+        instance = self.model.model_construct()
+        self.model.__pydantic_validator__.validate_assignment(instance, name, data)
+        return getattr(instance, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("%s is read-only; call materialize() to get a mutable model" % type(self).__name__)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self.__fields()))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            return self.model is other.model and self._raw == other._raw
+        if isinstance(other, self.model):
+            return self.materialize() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "%s(%s)" % (type(self).__name__, ", ".join(
+            "%s=..." % name for name, (alias, _, _) in self.__fields().items() if alias in self._raw
+        ))
+
+    def materialize(self) -> Any:
+        """Returns the fully validated model, e.g. a `Study` for a `LazyStudy`."""
+        # from_dict is defined by each generated model, not by BaseModel
+        return typing.cast(Any, self.model).from_dict(self._raw)
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.materialize().model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        return Configuration.get_default().json_codec.dumps(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias,
+        as the model's own `to_dict` would."""
+        return self.materialize().to_dict()
+
+
+class LazyPagedStudies(LazyModel):
+    """Lazy view of :class:`PagedStudies`"""
+
+    model = PagedStudies
+    __slots__ = ()
+
+
+class LazyStudy(LazyModel):
+    """Lazy view of :class:`Study`"""
+
+    model = Study
+    __slots__ = ()
+
+
+_views.update({PagedStudies: LazyPagedStudies, Study: LazyStudy})
@@ -12,132 +12,281 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from openapi_client.models.adverse_event import AdverseEvent
-from openapi_client.models.adverse_events_module import AdverseEventsModule
-from openapi_client.models.agency_class import AgencyClass
-from openapi_client.models.agreement_restriction_type import AgreementRestrictionType
-from openapi_client.models.analysis_dispersion_type import AnalysisDispersionType
-from openapi_client.models.annotation_module import AnnotationModule
-from openapi_client.models.annotation_section import AnnotationSection
-from openapi_client.models.arm_group import ArmGroup
-from openapi_client.models.arm_group_type import ArmGroupType
-from openapi_client.models.arms_interventions_module import ArmsInterventionsModule
-from openapi_client.models.avail_ipd import AvailIpd
-from openapi_client.models.baseline_characteristics_module import BaselineCharacteristicsModule
-from openapi_client.models.baseline_measure import BaselineMeasure
-from openapi_client.models.bio_spec import BioSpec
-from openapi_client.models.bio_spec_retention import BioSpecRetention
-from openapi_client.models.browse_branch import BrowseBranch
-from openapi_client.models.browse_leaf import BrowseLeaf
-from openapi_client.models.browse_leaf_relevance import BrowseLeafRelevance
-from openapi_client.models.browse_module import BrowseModule
-from openapi_client.models.certain_agreement import CertainAgreement
-from openapi_client.models.conditions_module import ConditionsModule
-from openapi_client.models.confidence_interval_num_sides import ConfidenceIntervalNumSides
-from openapi_client.models.contact import Contact
-from openapi_client.models.contact_role import ContactRole
-from openapi_client.models.contacts_locations_module import ContactsLocationsModule
-from openapi_client.models.date_struct import DateStruct
-from openapi_client.models.date_type import DateType
-from openapi_client.models.denom import Denom
-from openapi_client.models.denom_count import DenomCount
-from openapi_client.models.derived_section import DerivedSection
-from openapi_client.models.description_module import DescriptionModule
-from openapi_client.models.design_allocation import DesignAllocation
-from openapi_client.models.design_info import DesignInfo
-from openapi_client.models.design_masking import DesignMasking
-from openapi_client.models.design_module import DesignModule
-from openapi_client.models.design_time_perspective import DesignTimePerspective
-from openapi_client.models.document_section import DocumentSection
-from openapi_client.models.drop_withdraw import DropWithdraw
-from openapi_client.models.eligibility_module import EligibilityModule
-from openapi_client.models.enrollment_info import EnrollmentInfo
-from openapi_client.models.enrollment_type import EnrollmentType
-from openapi_client.models.event_assessment import EventAssessment
-from openapi_client.models.event_group import EventGroup
-from openapi_client.models.event_stats import EventStats
-from openapi_client.models.expanded_access_info import ExpandedAccessInfo
-from openapi_client.models.expanded_access_status import ExpandedAccessStatus
-from openapi_client.models.expanded_access_types import ExpandedAccessTypes
-from openapi_client.models.field_node import FieldNode
-from openapi_client.models.first_mcp_info import FirstMcpInfo
-from openapi_client.models.flow_group import FlowGroup
-from openapi_client.models.flow_milestone import FlowMilestone
-from openapi_client.models.flow_period import FlowPeriod
-from openapi_client.models.flow_stats import FlowStats
-from openapi_client.models.geo_point import GeoPoint
-from openapi_client.models.identification_module import IdentificationModule
-from openapi_client.models.intervention import Intervention
-from openapi_client.models.intervention_type import InterventionType
-from openapi_client.models.interventional_assignment import InterventionalAssignment
-from openapi_client.models.ipd_sharing import IpdSharing
-from openapi_client.models.ipd_sharing_info_type import IpdSharingInfoType
-from openapi_client.models.ipd_sharing_statement_module import IpdSharingStatementModule
-from openapi_client.models.large_doc import LargeDoc
-from openapi_client.models.large_document_module import LargeDocumentModule
-from openapi_client.models.limitations_and_caveats import LimitationsAndCaveats
-from openapi_client.models.location import Location
-from openapi_client.models.masking_block import MaskingBlock
-from openapi_client.models.measure_analysis import MeasureAnalysis
-from openapi_client.models.measure_category import MeasureCategory
-from openapi_client.models.measure_class import MeasureClass
-from openapi_client.models.measure_dispersion_type import MeasureDispersionType
-from openapi_client.models.measure_group import MeasureGroup
-from openapi_client.models.measure_param import MeasureParam
-from openapi_client.models.measurement import Measurement
-from openapi_client.models.mesh import Mesh
-from openapi_client.models.misc_info_module import MiscInfoModule
-from openapi_client.models.more_info_module import MoreInfoModule
-from openapi_client.models.non_inferiority_type import NonInferiorityType
-from openapi_client.models.observational_model import ObservationalModel
-from openapi_client.models.official import Official
-from openapi_client.models.official_role import OfficialRole
-from openapi_client.models.org_study_id_info import OrgStudyIdInfo
-from openapi_client.models.org_study_id_type import OrgStudyIdType
-from openapi_client.models.organization import Organization
-from openapi_client.models.outcome import Outcome
-from openapi_client.models.outcome_measure import OutcomeMeasure
-from openapi_client.models.outcome_measure_type import OutcomeMeasureType
-from openapi_client.models.outcome_measures_module import OutcomeMeasuresModule
-from openapi_client.models.outcomes_module import OutcomesModule
-from openapi_client.models.oversight_module import OversightModule
-from openapi_client.models.paged_studies import PagedStudies
-from openapi_client.models.partial_date_struct import PartialDateStruct
-from openapi_client.models.participant_flow_module import ParticipantFlowModule
-from openapi_client.models.phase import Phase
-from openapi_client.models.point_of_contact import PointOfContact
-from openapi_client.models.primary_purpose import PrimaryPurpose
-from openapi_client.models.protocol_section import ProtocolSection
-from openapi_client.models.recruitment_status import RecruitmentStatus
-from openapi_client.models.reference import Reference
-from openapi_client.models.reference_type import ReferenceType
-from openapi_client.models.references_module import ReferencesModule
-from openapi_client.models.reporting_status import ReportingStatus
-from openapi_client.models.responsible_party import ResponsibleParty
-from openapi_client.models.responsible_party_type import ResponsiblePartyType
-from openapi_client.models.results_section import ResultsSection
-from openapi_client.models.retraction import Retraction
-from openapi_client.models.sampling_method import SamplingMethod
-from openapi_client.models.secondary_id_info import SecondaryIdInfo
-from openapi_client.models.secondary_id_type import SecondaryIdType
-from openapi_client.models.see_also_link import SeeAlsoLink
-from openapi_client.models.sex import Sex
-from openapi_client.models.sponsor import Sponsor
-from openapi_client.models.sponsor_collaborators_module import SponsorCollaboratorsModule
-from openapi_client.models.standard_age import StandardAge
-from openapi_client.models.status import Status
-from openapi_client.models.status_module import StatusModule
-from openapi_client.models.study import Study
-from openapi_client.models.study_type import StudyType
-from openapi_client.models.submission_info import SubmissionInfo
-from openapi_client.models.submission_tracking import SubmissionTracking
-from openapi_client.models.unposted_annotation import UnpostedAnnotation
-from openapi_client.models.unposted_event import UnpostedEvent
-from openapi_client.models.unposted_event_type import UnpostedEventType
-from openapi_client.models.violation_annotation import ViolationAnnotation
-from openapi_client.models.violation_event import ViolationEvent
-from openapi_client.models.violation_event_type import ViolationEventType
-from openapi_client.models.web_link import WebLink
-from openapi_client.models.who_masked import WhoMasked
+import importlib
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from openapi_client.models.adverse_event import AdverseEvent
+    from openapi_client.models.adverse_events_module import AdverseEventsModule
+    from openapi_client.models.agency_class import AgencyClass
+    from openapi_client.models.agreement_restriction_type import AgreementRestrictionType
+    from openapi_client.models.analysis_dispersion_type import AnalysisDispersionType
+    from openapi_client.models.annotation_module import AnnotationModule
+    from openapi_client.models.annotation_section import AnnotationSection
+    from openapi_client.models.arm_group import ArmGroup
+    from openapi_client.models.arm_group_type import ArmGroupType
+    from openapi_client.models.arms_interventions_module import ArmsInterventionsModule
+    from openapi_client.models.avail_ipd import AvailIpd
+    from openapi_client.models.baseline_characteristics_module import BaselineCharacteristicsModule
+    from openapi_client.models.baseline_measure import BaselineMeasure
+    from openapi_client.models.bio_spec import BioSpec
+    from openapi_client.models.bio_spec_retention import BioSpecRetention
+    from openapi_client.models.browse_branch import BrowseBranch
+    from openapi_client.models.browse_leaf import BrowseLeaf
+    from openapi_client.models.browse_leaf_relevance import BrowseLeafRelevance
+    from openapi_client.models.browse_module import BrowseModule
+    from openapi_client.models.certain_agreement import CertainAgreement
+    from openapi_client.models.conditions_module import ConditionsModule
+    from openapi_client.models.confidence_interval_num_sides import ConfidenceIntervalNumSides
+    from openapi_client.models.contact import Contact
+    from openapi_client.models.contact_role import ContactRole
+    from openapi_client.models.contacts_locations_module import ContactsLocationsModule
+    from openapi_client.models.date_struct import DateStruct
+    from openapi_client.models.date_type import DateType
+    from openapi_client.models.denom import Denom
+    from openapi_client.models.denom_count import DenomCount
+    from openapi_client.models.derived_section import DerivedSection
+    from openapi_client.models.description_module import DescriptionModule
+    from openapi_client.models.design_allocation import DesignAllocation
+    from openapi_client.models.design_info import DesignInfo
+    from openapi_client.models.design_masking import DesignMasking
+    from openapi_client.models.design_module import DesignModule
+    from openapi_client.models.design_time_perspective import DesignTimePerspective
+    from openapi_client.models.document_section import DocumentSection
+    from openapi_client.models.drop_withdraw import DropWithdraw
+    from openapi_client.models.eligibility_module import EligibilityModule
+    from openapi_client.models.enrollment_info import EnrollmentInfo
+    from openapi_client.models.enrollment_type import EnrollmentType
+    from openapi_client.models.event_assessment import EventAssessment
+    from openapi_client.models.event_group import EventGroup
+    from openapi_client.models.event_stats import EventStats
+    from openapi_client.models.expanded_access_info import ExpandedAccessInfo
+    from openapi_client.models.expanded_access_status import ExpandedAccessStatus
+    from openapi_client.models.expanded_access_types import ExpandedAccessTypes
+    from openapi_client.models.field_node import FieldNode
+    from openapi_client.models.first_mcp_info import FirstMcpInfo
+    from openapi_client.models.flow_group import FlowGroup
+    from openapi_client.models.flow_milestone import FlowMilestone
+    from openapi_client.models.flow_period import FlowPeriod
+    from openapi_client.models.flow_stats import FlowStats
+    from openapi_client.models.geo_point import GeoPoint
+    from openapi_client.models.identification_module import IdentificationModule
+    from openapi_client.models.intervention import Intervention
+    from openapi_client.models.intervention_type import InterventionType
+    from openapi_client.models.interventional_assignment import InterventionalAssignment
+    from openapi_client.models.ipd_sharing import IpdSharing
+    from openapi_client.models.ipd_sharing_info_type import IpdSharingInfoType
+    from openapi_client.models.ipd_sharing_statement_module import IpdSharingStatementModule
+    from openapi_client.models.large_doc import LargeDoc
+    from openapi_client.models.large_document_module import LargeDocumentModule
+    from openapi_client.models.limitations_and_caveats import LimitationsAndCaveats
+    from openapi_client.models.location import Location
+    from openapi_client.models.masking_block import MaskingBlock
+    from openapi_client.models.measure_analysis import MeasureAnalysis
+    from openapi_client.models.measure_category import MeasureCategory
+    from openapi_client.models.measure_class import MeasureClass
+    from openapi_client.models.measure_dispersion_type import MeasureDispersionType
+    from openapi_client.models.measure_group import MeasureGroup
+    from openapi_client.models.measure_param import MeasureParam
+    from openapi_client.models.measurement import Measurement
+    from openapi_client.models.mesh import Mesh
+    from openapi_client.models.misc_info_module import MiscInfoModule
+    from openapi_client.models.more_info_module import MoreInfoModule
+    from openapi_client.models.non_inferiority_type import NonInferiorityType
+    from openapi_client.models.observational_model import ObservationalModel
+    from openapi_client.models.official import Official
+    from openapi_client.models.official_role import OfficialRole
+    from openapi_client.models.org_study_id_info import OrgStudyIdInfo
+    from openapi_client.models.org_study_id_type import OrgStudyIdType
+    from openapi_client.models.organization import Organization
+    from openapi_client.models.outcome import Outcome
+    from openapi_client.models.outcome_measure import OutcomeMeasure
+    from openapi_client.models.outcome_measure_type import OutcomeMeasureType
+    from openapi_client.models.outcome_measures_module import OutcomeMeasuresModule
+    from openapi_client.models.outcomes_module import OutcomesModule
+    from openapi_client.models.oversight_module import OversightModule
+    from openapi_client.models.paged_studies import PagedStudies
+    from openapi_client.models.partial_date_struct import PartialDateStruct
+    from openapi_client.models.participant_flow_module import ParticipantFlowModule
+    from openapi_client.models.phase import Phase
+    from openapi_client.models.point_of_contact import PointOfContact
+    from openapi_client.models.primary_purpose import PrimaryPurpose
+    from openapi_client.models.protocol_section import ProtocolSection
+    from openapi_client.models.recruitment_status import RecruitmentStatus
+    from openapi_client.models.reference import Reference
+    from openapi_client.models.reference_type import ReferenceType
+    from openapi_client.models.references_module import ReferencesModule
+    from openapi_client.models.reporting_status import ReportingStatus
+    from openapi_client.models.responsible_party import ResponsibleParty
+    from openapi_client.models.responsible_party_type import ResponsiblePartyType
+    from openapi_client.models.results_section import ResultsSection
+    from openapi_client.models.retraction import Retraction
+    from openapi_client.models.sampling_method import SamplingMethod
+    from openapi_client.models.secondary_id_info import SecondaryIdInfo
+    from openapi_client.models.secondary_id_type import SecondaryIdType
+    from openapi_client.models.see_also_link import SeeAlsoLink
+    from openapi_client.models.sex import Sex
+    from openapi_client.models.sponsor import Sponsor
+    from openapi_client.models.sponsor_collaborators_module import SponsorCollaboratorsModule
+    from openapi_client.models.standard_age import StandardAge
+    from openapi_client.models.status import Status
+    from openapi_client.models.status_module import StatusModule
+    from openapi_client.models.study import Study
+    from openapi_client.models.study_type import StudyType
+    from openapi_client.models.submission_info import SubmissionInfo
+    from openapi_client.models.submission_tracking import SubmissionTracking
+    from openapi_client.models.unposted_annotation import UnpostedAnnotation
+    from openapi_client.models.unposted_event import UnpostedEvent
+    from openapi_client.models.unposted_event_type import UnpostedEventType
+    from openapi_client.models.violation_annotation import ViolationAnnotation
+    from openapi_client.models.violation_event import ViolationEvent
+    from openapi_client.models.violation_event_type import ViolationEventType
+    from openapi_client.models.web_link import WebLink
+    from openapi_client.models.who_masked import WhoMasked
+
+# Models are imported on first access (PEP 562) rather than with the package:
+# building the pydantic schema of every model up front dominated start-up time.
+_MODELS = {
+    "AdverseEvent": "openapi_client.models.adverse_event",
+    "AdverseEventsModule": "openapi_client.models.adverse_events_module",
+    "AgencyClass": "openapi_client.models.agency_class",
+    "AgreementRestrictionType": "openapi_client.models.agreement_restriction_type",
+    "AnalysisDispersionType": "openapi_client.models.analysis_dispersion_type",
+    "AnnotationModule": "openapi_client.models.annotation_module",
+    "AnnotationSection": "openapi_client.models.annotation_section",
+    "ArmGroup": "openapi_client.models.arm_group",
+    "ArmGroupType": "openapi_client.models.arm_group_type",
+    "ArmsInterventionsModule": "openapi_client.models.arms_interventions_module",
+    "AvailIpd": "openapi_client.models.avail_ipd",
+    "BaselineCharacteristicsModule": "openapi_client.models.baseline_characteristics_module",
+    "BaselineMeasure": "openapi_client.models.baseline_measure",
+    "BioSpec": "openapi_client.models.bio_spec",
+    "BioSpecRetention": "openapi_client.models.bio_spec_retention",
+    "BrowseBranch": "openapi_client.models.browse_branch",
+    "BrowseLeaf": "openapi_client.models.browse_leaf",
+    "BrowseLeafRelevance": "openapi_client.models.browse_leaf_relevance",
+    "BrowseModule": "openapi_client.models.browse_module",
+    "CertainAgreement": "openapi_client.models.certain_agreement",
+    "ConditionsModule": "openapi_client.models.conditions_module",
+    "ConfidenceIntervalNumSides": "openapi_client.models.confidence_interval_num_sides",
+    "Contact": "openapi_client.models.contact",
+    "ContactRole": "openapi_client.models.contact_role",
+    "ContactsLocationsModule": "openapi_client.models.contacts_locations_module",
+    "DateStruct": "openapi_client.models.date_struct",
+    "DateType": "openapi_client.models.date_type",
+    "Denom": "openapi_client.models.denom",
+    "DenomCount": "openapi_client.models.denom_count",
+    "DerivedSection": "openapi_client.models.derived_section",
+    "DescriptionModule": "openapi_client.models.description_module",
+    "DesignAllocation": "openapi_client.models.design_allocation",
+    "DesignInfo": "openapi_client.models.design_info",
+    "DesignMasking": "openapi_client.models.design_masking",
+    "DesignModule": "openapi_client.models.design_module",
+    "DesignTimePerspective": "openapi_client.models.design_time_perspective",
+    "DocumentSection": "openapi_client.models.document_section",
+    "DropWithdraw": "openapi_client.models.drop_withdraw",
+    "EligibilityModule": "openapi_client.models.eligibility_module",
+    "EnrollmentInfo": "openapi_client.models.enrollment_info",
+    "EnrollmentType": "openapi_client.models.enrollment_type",
+    "EventAssessment": "openapi_client.models.event_assessment",
+    "EventGroup": "openapi_client.models.event_group",
+    "EventStats": "openapi_client.models.event_stats",
+    "ExpandedAccessInfo": "openapi_client.models.expanded_access_info",
+    "ExpandedAccessStatus": "openapi_client.models.expanded_access_status",
+    "ExpandedAccessTypes": "openapi_client.models.expanded_access_types",
+    "FieldNode": "openapi_client.models.field_node",
+    "FirstMcpInfo": "openapi_client.models.first_mcp_info",
+    "FlowGroup": "openapi_client.models.flow_group",
+    "FlowMilestone": "openapi_client.models.flow_milestone",
+    "FlowPeriod": "openapi_client.models.flow_period",
+    "FlowStats": "openapi_client.models.flow_stats",
+    "GeoPoint": "openapi_client.models.geo_point",
+    "IdentificationModule": "openapi_client.models.identification_module",
+    "Intervention": "openapi_client.models.intervention",
+    "InterventionType": "openapi_client.models.intervention_type",
+    "InterventionalAssignment": "openapi_client.models.interventional_assignment",
+    "IpdSharing": "openapi_client.models.ipd_sharing",
+    "IpdSharingInfoType": "openapi_client.models.ipd_sharing_info_type",
+    "IpdSharingStatementModule": "openapi_client.models.ipd_sharing_statement_module",
+    "LargeDoc": "openapi_client.models.large_doc",
+    "LargeDocumentModule": "openapi_client.models.large_document_module",
+    "LimitationsAndCaveats": "openapi_client.models.limitations_and_caveats",
+    "Location": "openapi_client.models.location",
+    "MaskingBlock": "openapi_client.models.masking_block",
+    "MeasureAnalysis": "openapi_client.models.measure_analysis",
+    "MeasureCategory": "openapi_client.models.measure_category",
+    "MeasureClass": "openapi_client.models.measure_class",
+    "MeasureDispersionType": "openapi_client.models.measure_dispersion_type",
+    "MeasureGroup": "openapi_client.models.measure_group",
+    "MeasureParam": "openapi_client.models.measure_param",
+    "Measurement": "openapi_client.models.measurement",
+    "Mesh": "openapi_client.models.mesh",
+    "MiscInfoModule": "openapi_client.models.misc_info_module",
+    "MoreInfoModule": "openapi_client.models.more_info_module",
+    "NonInferiorityType": "openapi_client.models.non_inferiority_type",
+    "ObservationalModel": "openapi_client.models.observational_model",
+    "Official": "openapi_client.models.official",
+    "OfficialRole": "openapi_client.models.official_role",
+    "OrgStudyIdInfo": "openapi_client.models.org_study_id_info",
+    "OrgStudyIdType": "openapi_client.models.org_study_id_type",
+    "Organization": "openapi_client.models.organization",
+    "Outcome": "openapi_client.models.outcome",
+    "OutcomeMeasure": "openapi_client.models.outcome_measure",
+    "OutcomeMeasureType": "openapi_client.models.outcome_measure_type",
+    "OutcomeMeasuresModule": "openapi_client.models.outcome_measures_module",
+    "OutcomesModule": "openapi_client.models.outcomes_module",
+    "OversightModule": "openapi_client.models.oversight_module",
+    "PagedStudies": "openapi_client.models.paged_studies",
+    "PartialDateStruct": "openapi_client.models.partial_date_struct",
+    "ParticipantFlowModule": "openapi_client.models.participant_flow_module",
+    "Phase": "openapi_client.models.phase",
+    "PointOfContact": "openapi_client.models.point_of_contact",
+    "PrimaryPurpose": "openapi_client.models.primary_purpose",
+    "ProtocolSection": "openapi_client.models.protocol_section",
+    "RecruitmentStatus": "openapi_client.models.recruitment_status",
+    "Reference": "openapi_client.models.reference",
+    "ReferenceType": "openapi_client.models.reference_type",
+    "ReferencesModule": "openapi_client.models.references_module",
+    "ReportingStatus": "openapi_client.models.reporting_status",
+    "ResponsibleParty": "openapi_client.models.responsible_party",
+    "ResponsiblePartyType": "openapi_client.models.responsible_party_type",
+    "ResultsSection": "openapi_client.models.results_section",
+    "Retraction": "openapi_client.models.retraction",
+    "SamplingMethod": "openapi_client.models.sampling_method",
+    "SecondaryIdInfo": "openapi_client.models.secondary_id_info",
+    "SecondaryIdType": "openapi_client.models.secondary_id_type",
+    "SeeAlsoLink": "openapi_client.models.see_also_link",
+    "Sex": "openapi_client.models.sex",
+    "Sponsor": "openapi_client.models.sponsor",
+    "SponsorCollaboratorsModule": "openapi_client.models.sponsor_collaborators_module",
+    "StandardAge": "openapi_client.models.standard_age",
+    "Status": "openapi_client.models.status",
+    "StatusModule": "openapi_client.models.status_module",
+    "Study": "openapi_client.models.study",
+    "StudyType": "openapi_client.models.study_type",
+    "SubmissionInfo": "openapi_client.models.submission_info",
+    "SubmissionTracking": "openapi_client.models.submission_tracking",
+    "UnpostedAnnotation": "openapi_client.models.unposted_annotation",
+    "UnpostedEvent": "openapi_client.models.unposted_event",
+    "UnpostedEventType": "openapi_client.models.unposted_event_type",
+    "ViolationAnnotation": "openapi_client.models.violation_annotation",
+    "ViolationEvent": "openapi_client.models.violation_event",
+    "ViolationEventType": "openapi_client.models.violation_event_type",
+    "WebLink": "openapi_client.models.web_link",
+    "WhoMasked": "openapi_client.models.who_masked",
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name):
+    module = _MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
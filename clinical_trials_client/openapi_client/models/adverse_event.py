@@ -15,7 +15,6 @@
 from __future__ import annotations
 import pprint
 import re  # noqa: F401
-import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
@@ -23,6 +22,7 @@ from openapi_client.models.event_assessment import EventAssessment
 from openapi_client.models.event_stats import EventStats
 from typing import Optional, Set
 from typing_extensions import Self
+from openapi_client.configuration import Configuration
 
 class AdverseEvent(BaseModel):
     """
@@ -50,12 +50,12 @@ class AdverseEvent(BaseModel):
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
         # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        return Configuration.get_default().json_codec.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Optional[Self]:
         """Create an instance of AdverseEvent from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(Configuration.get_default().json_codec.loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dictionary representation of the model using alias.
@@ -13,9 +13,9 @@
 
 
 from __future__ import annotations
-import json
 from enum import Enum
 from typing_extensions import Self
+from openapi_client.configuration import Configuration
 
 
 class Phase(str, Enum):
@@ -36,6 +36,6 @@ class Phase(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of Phase from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(Configuration.get_default().json_codec.loads(json_str))
 
 
@@ -0,0 +1,207 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    Study iterators walking `nextPageToken`. While the caller consumes one
+    page the next one is already being downloaded, and only those two pages
+    are held in memory however many studies the search returns.
+"""  # noqa: E501
+
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Union
+
+from openapi_client import rest
+from openapi_client.lazy import LazyPagedStudies, LazyStudy
+from openapi_client.models.study import Study
+
+StudyType = Union[Study, LazyStudy]
+
+# page size the server uses when none is requested
+DEFAULT_PAGE_SIZE = 10
+
+
+def _response_types_map(lazy: bool) -> Dict[str, Any]:
+    return {
+        '200': LazyPagedStudies if lazy else "PagedStudies",
+        '400': "str",
+    }
+
+
+class _Deferred:
+    """Future stand-in running the call when its result is first needed."""
+
+    def __init__(self, fn, *args) -> None:
+        self.fn = fn
+        self.args = args
+
+    def result(self):
+        return self.fn(*self.args)
+
+    def cancel(self) -> bool:
+        return True
+
+
+class _Budget:
+    """Tracks max_results/max_pages and sizes the next page request."""
+
+    def __init__(self, page_size: Optional[int], max_results: Optional[int], max_pages: Optional[int]) -> None:
+        if max_results is not None and max_results < 0:
+            raise ValueError("max_results must be >= 0")
+        if max_pages is not None and max_pages < 0:
+            raise ValueError("max_pages must be >= 0")
+        self.page_size = page_size
+        self.max_results = max_results
+        self.max_pages = max_pages
+        self.pages = 0
+        self.results = 0
+
+    def more_pages(self, fetched_results: int) -> bool:
+        """Whether another page may be requested once `fetched_results`
+        studies have been downloaded."""
+        if self.max_pages is not None and self.pages >= self.max_pages:
+            return False
+        return self.max_results is None or fetched_results < self.max_results
+
+    def next_page_size(self, fetched_results: int) -> Optional[int]:
+        """Page size for the next request: never more than the studies still
+        wanted, so the last page does not download studies that are dropped."""
+        if self.max_results is None:
+            return self.page_size
+        remaining = self.max_results - fetched_results
+        return min(self.page_size or DEFAULT_PAGE_SIZE, remaining)
+
+    def exhausted(self) -> bool:
+        return self.max_results is not None and self.results >= self.max_results
+
+
+def iter_studies(
+    api,
+    max_results: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    lazy: bool = False,
+    prefetch: bool = True,
+    **params: Any,
+) -> Generator[StudyType, None, None]:
+    """Yields the studies of all pages of a `list_studies` search.
+
+    :param api: StudiesApi used to send the requests.
+    :param max_results: stop after this many studies.
+    :param max_pages: stop after this many pages.
+    :param lazy: yield :class:`LazyStudy` views instead of `Study` models.
+    :param prefetch: download the next page in a background thread while
+        the current one is consumed.
+    :param params: `list_studies` parameters; `page_token` resumes a search.
+    """
+    page_token = params.pop("page_token", None)
+    budget = _Budget(params.pop("page_size", None), max_results, max_pages)
+    response_types_map = _response_types_map(lazy)
+
+    def fetch(token, page_size):
+        response_data = rest.RESTResponse(
+            api.list_studies_without_preload_content(page_token=token, page_size=page_size, **params)
+        )
+        response_data.read()
+        return api.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def submit(token, fetched_results):
+        budget.pages += 1
+        page_size = budget.next_page_size(fetched_results)
+        if executor is not None:
+            return executor.submit(fetch, token, page_size)
+        return _Deferred(fetch, token, page_size)
+
+    pending = None
+    try:
+        if budget.more_pages(0):
+            pending = submit(page_token, 0)
+        fetched = 0
+        while pending is not None:
+            page = pending.result()
+            pending = None
+            studies = page.studies or []
+            fetched += len(studies)
+            if page.next_page_token and budget.more_pages(fetched):
+                pending = submit(page.next_page_token, fetched)
+            del page
+
+            for study in studies:
+                if budget.exhausted():
+                    return
+                budget.results += 1
+                yield study
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_studies(
+    api,
+    max_results: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    lazy: bool = False,
+    prefetch: bool = True,
+    **params: Any,
+) -> AsyncGenerator[StudyType, None]:
+    """asyncio variant of :func:`iter_studies` for an AsyncStudiesApi; the
+    next page is prefetched in a task on the running loop."""
+    page_token = params.pop("page_token", None)
+    budget = _Budget(params.pop("page_size", None), max_results, max_pages)
+    response_types_map = _response_types_map(lazy)
+
+    # httpx is an optional dependency of the asyncio transport
+    from openapi_client.rest_async import AsyncRESTResponse
+
+    async def fetch(token, page_size):
+        response_data = AsyncRESTResponse(
+            await api.list_studies_without_preload_content(page_token=token, page_size=page_size, **params)
+        )
+        await response_data.read()
+        return api.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    def submit(token, fetched_results):
+        budget.pages += 1
+        coro = fetch(token, budget.next_page_size(fetched_results))
+        # without prefetching the coroutine only runs once it is awaited
+        return asyncio.ensure_future(coro) if prefetch else coro
+
+    pending = None
+    try:
+        if budget.more_pages(0):
+            pending = submit(page_token, 0)
+        fetched = 0
+        while pending is not None:
+            page = await pending
+            pending = None
+            studies = page.studies or []
+            fetched += len(studies)
+            if page.next_page_token and budget.more_pages(fetched):
+                pending = submit(page.next_page_token, fetched)
+            del page
+
+            for study in studies:
+                if budget.exhausted():
+                    return
+                budget.results += 1
+                yield study
+    finally:
+        if isinstance(pending, asyncio.Future):
+            pending.cancel()
+        elif pending is not None:
+            pending.close()
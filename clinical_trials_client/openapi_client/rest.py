@@ -15,15 +15,22 @@
 import io
 import json
 import re
+import logging
 import ssl
+import threading
+import time
 
 import urllib3
 
+from openapi_client.cache import FRESH, STALE
 from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.throttle import Throttle
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
 
+logger = logging.getLogger(__name__)
+
 
 def is_socks_proxy_url(url):
     if url is None:
@@ -35,6 +42,31 @@ def is_socks_proxy_url(url):
         return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
 
 
+def _get_header(headers, name):
+    """Case-insensitive lookup in a plain dict of request headers."""
+    if headers:
+        name = name.lower()
+        for key, value in headers.items():
+            if key.lower() == name:
+                return value
+    return None
+
+
+def _without_header(headers, name):
+    """Copy of a plain dict of request headers without `name`."""
+    name = name.lower()
+    return {key: value for key, value in (headers or {}).items() if key.lower() != name}
+
+
+def _to_urllib3_timeout(value):
+    """Converts a total or (connection, read) timeout to urllib3.Timeout."""
+    if isinstance(value, (int, float)):
+        return urllib3.Timeout(total=value)
+    elif isinstance(value, tuple) and len(value) == 2:
+        return urllib3.Timeout(connect=value[0], read=value[1])
+    return None
+
+
 class RESTResponse(io.IOBase):
 
     def __init__(self, resp) -> None:
@@ -83,8 +115,14 @@ class RESTClientObject:
                 configuration.assert_hostname
             )
 
-        if configuration.retries is not None:
-            pool_args['retries'] = configuration.retries
+        # 429/503 responses are retried by self.throttle; urllib3 keeps
+        # retrying connection errors but must not also act on Retry-After.
+        retries = configuration.retries
+        if retries is None:
+            retries = urllib3.Retry.DEFAULT
+        elif not isinstance(retries, urllib3.Retry):
+            retries = urllib3.Retry.from_int(retries)
+        pool_args['retries'] = retries.new(respect_retry_after_header=False)
 
         if configuration.tls_server_name:
             pool_args['server_hostname'] = configuration.tls_server_name
@@ -96,6 +134,16 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
+        if configuration.connection_pool_block:
+            pool_args['block'] = configuration.connection_pool_block
+
+        if configuration.timeout is not None:
+            pool_args['timeout'] = _to_urllib3_timeout(configuration.timeout)
+
+        self.json_codec = configuration.json_codec
+        self.throttle = Throttle.from_configuration(configuration)
+        self.response_cache = configuration.response_cache
+
         # https pool manager
         self.pool_manager: urllib3.PoolManager
 
@@ -112,6 +160,34 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+    def pool_stats(self):
+        """Returns connection reuse statistics for the live pools.
+
+        ``connections_created`` counts the connections opened by the pools
+        currently held by the pool manager, ``requests`` the requests sent
+        through them; every request beyond the first one on a connection
+        was served from a kept-alive socket.
+        """
+        created = 0
+        requests = 0
+        pools = self.pool_manager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            created += pool.num_connections
+            requests += pool.num_requests
+        return {
+            "pools": len(pools),
+            "connections_created": created,
+            "connections_reused": max(requests - created, 0),
+            "requests": requests,
+        }
+
+    def close(self):
+        """Closes all pooled connections."""
+        self.pool_manager.clear()
+
     def request(
         self,
         method,
@@ -120,6 +196,115 @@ class RESTClientObject:
         body=None,
         post_params=None,
         _request_timeout=None
+    ):
+        """Perform requests, answering GET requests from the response cache
+        when one is configured.
+
+        See `_request` for the parameters. The request's `Cache-Control`
+        header selects how fresh a cached response must be (see
+        openapi_client.cache.CachePolicy); it is meant for the cache and
+        is not sent to the server.
+        """
+        cache = self.response_cache
+        if cache is None or method.upper() != 'GET':
+            return self._send(method, url, headers, body, post_params, _request_timeout)
+
+        policy = cache.policy(_get_header(headers, 'Cache-Control'))
+        headers = _without_header(headers, 'Cache-Control')
+        if policy.no_store:
+            return self._send(method, url, headers, body, post_params, _request_timeout)
+
+        entry, state = cache.lookup(url, policy)
+        if state == FRESH:
+            return self._cached_response(entry, state)
+        if state == STALE:
+            if cache.start_revalidation(url):
+                threading.Thread(
+                    target=self._revalidate,
+                    args=(url, headers, entry, _request_timeout),
+                    daemon=True,
+                ).start()
+            return self._cached_response(entry, state)
+        if policy.only_if_cached:
+            return RESTResponse(urllib3.HTTPResponse(
+                body=io.BytesIO(b""), status=504, reason="Gateway Timeout", preload_content=False
+            ))
+        return self._fetch(url, headers, entry, _request_timeout)
+
+    def _cached_response(self, entry, state):
+        return RESTResponse(urllib3.HTTPResponse(
+            body=io.BytesIO(entry.body),
+            headers=self.response_cache.response_headers(entry, state),
+            status=entry.status,
+            reason="OK",
+            preload_content=False,
+        ))
+
+    def _fetch(self, url, headers, entry, _request_timeout):
+        """GET url, revalidating entry if there is one, and cache the result."""
+        cache = self.response_cache
+        request_headers = dict(headers or {}, **cache.validators(entry))
+        response = self._send('GET', url, request_headers, None, None, _request_timeout)
+        if response.status == 304 and entry is not None:
+            response.response.drain_conn()
+            response.response.release_conn()
+            return self._cached_response(cache.refresh(url, entry, response.getheaders()), FRESH)
+        if response.status == 200 and 'no-store' not in (response.getheader('Cache-Control') or ''):
+            cache.store(url, response.status, response.getheaders(), response.read())
+        return response
+
+    def _revalidate(self, url, headers, entry, _request_timeout):
+        try:
+            self._fetch(url, headers, entry, _request_timeout).read()
+        except Exception:
+            # the stale entry stays until a foreground request replaces it
+            logger.warning("Background revalidation of %s failed", url, exc_info=True)
+        finally:
+            self.response_cache.finish_revalidation(url)
+
+    def _send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Sends a request, waiting for the rate limiter and retrying
+        throttled (429/503) responses."""
+        attempt = 0
+        while True:
+            wait = self.throttle.acquire()
+            if wait:
+                time.sleep(wait)
+            # _request may drop Content-Type from the headers it is given
+            response = self._request(
+                method,
+                url,
+                headers=dict(headers) if headers else headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+            delay = self.throttle.retry_delay(
+                method.upper(), attempt, response.status, response.getheader('Retry-After')
+            )
+            if delay is None:
+                return response
+            response.response.drain_conn()
+            response.response.release_conn()
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
     ):
         """Perform requests.
 
@@ -156,16 +341,7 @@ class RESTClientObject:
 
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, float)):
-                timeout = urllib3.Timeout(total=_request_timeout)
-            elif (
-                    isinstance(_request_timeout, tuple)
-                    and len(_request_timeout) == 2
-                ):
-                timeout = urllib3.Timeout(
-                    connect=_request_timeout[0],
-                    read=_request_timeout[1]
-                )
+            timeout = _to_urllib3_timeout(_request_timeout)
 
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
@@ -179,7 +355,7 @@ class RESTClientObject:
                 ):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
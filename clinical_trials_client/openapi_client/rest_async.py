@@ -0,0 +1,361 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    asyncio transport for the generated client. It mirrors rest.py on top of
+    httpx so that requests can be awaited without occupying a thread.
+"""  # noqa: E501
+
+
+import asyncio
+import io
+import json
+import logging
+import re
+import ssl
+from typing import Any, Dict, Set, Union
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The asyncio transport requires httpx; install openapi-client[async]"
+    ) from e
+
+from openapi_client.cache import FRESH, STALE
+from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.rest import _get_header, _without_header
+from openapi_client.throttle import Throttle
+
+RESTResponseType = httpx.Response
+
+logger = logging.getLogger(__name__)
+
+
+def _to_httpx_timeout(value):
+    """Converts a total or (connection, read) timeout to httpx.Timeout."""
+    if isinstance(value, (int, float)):
+        return httpx.Timeout(value)
+    elif isinstance(value, tuple) and len(value) == 2:
+        return httpx.Timeout(value[1], connect=value[0])
+    return None
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data = None
+
+    async def read(self):
+        if self.data is None:
+            try:
+                self.data = await self.response.aread()
+            finally:
+                await self.response.aclose()
+        return self.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+
+    def __init__(self, configuration) -> None:
+        # httpx keeps one connection pool per client; all pool settings of
+        # the Configuration are translated to the transport here.
+
+        # verify
+        verify: Union[bool, ssl.SSLContext]
+        if not configuration.verify_ssl:
+            verify = False
+        elif configuration.ssl_ca_cert or configuration.ca_cert_data:
+            verify = ssl.create_default_context(
+                cafile=configuration.ssl_ca_cert,
+                cadata=configuration.ca_cert_data,
+            )
+        else:
+            verify = True
+
+        if configuration.cert_file and isinstance(verify, ssl.SSLContext):
+            verify.load_cert_chain(configuration.cert_file, configuration.key_file)
+        elif configuration.cert_file:
+            verify = ssl.create_default_context()
+            verify.load_cert_chain(configuration.cert_file, configuration.key_file)
+
+        # pool limits: without blocking, urllib3 opens extra connections on
+        # demand and only keeps `maxsize` of them; httpx behaves the same when
+        # the total number of connections is left unbounded.
+        maxsize = configuration.connection_pool_maxsize
+        limits = httpx.Limits(
+            max_connections=maxsize if configuration.connection_pool_block else None,
+            max_keepalive_connections=maxsize,
+        )
+
+        transport_args: Dict[str, Any] = {
+            "verify": verify,
+            "limits": limits,
+            "retries": configuration.retries or 0,
+        }
+        if configuration.socket_options is not None:
+            transport_args["socket_options"] = configuration.socket_options
+        if configuration.proxy:
+            transport_args["proxy"] = httpx.Proxy(
+                configuration.proxy,
+                headers=configuration.proxy_headers,
+            )
+
+        self.json_codec = configuration.json_codec
+        self.throttle = Throttle.from_configuration(configuration)
+        self.response_cache = configuration.response_cache
+        self._background: Set[asyncio.Task[Any]] = set()
+        self.connections_created = 0
+        self.requests = 0
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(**transport_args),
+            timeout=_to_httpx_timeout(configuration.timeout),
+        )
+
+    async def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_created += 1
+
+    def pool_stats(self):
+        """Returns connection reuse statistics since the client was created."""
+        return {
+            "pools": 1,
+            "connections_created": self.connections_created,
+            "connections_reused": max(self.requests - self.connections_created, 0),
+            "requests": self.requests,
+        }
+
+    async def close(self):
+        """Closes all pooled connections."""
+        for task in list(self._background):
+            task.cancel()
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests, answering GET requests from the response cache
+        when one is configured.
+
+        See `_request` for the parameters and rest.RESTClientObject.request
+        for the caching rules.
+        """
+        cache = self.response_cache
+        if cache is None or method.upper() != 'GET':
+            return await self._send(method, url, headers, body, post_params, _request_timeout)
+
+        policy = cache.policy(_get_header(headers, 'Cache-Control'))
+        headers = _without_header(headers, 'Cache-Control')
+        if policy.no_store:
+            return await self._send(method, url, headers, body, post_params, _request_timeout)
+
+        entry, state = await self._cache_io(cache.lookup, url, policy)
+        if state == FRESH:
+            return self._cached_response(entry, state)
+        if state == STALE:
+            if cache.start_revalidation(url):
+                task = asyncio.ensure_future(self._revalidate(url, headers, entry, _request_timeout))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return self._cached_response(entry, state)
+        if policy.only_if_cached:
+            return AsyncRESTResponse(httpx.Response(504))
+        return await self._fetch(url, headers, entry, _request_timeout)
+
+    def _cached_response(self, entry, state):
+        return AsyncRESTResponse(httpx.Response(
+            entry.status,
+            headers=self.response_cache.response_headers(entry, state),
+            content=entry.body,
+        ))
+
+    async def _fetch(self, url, headers, entry, _request_timeout):
+        """GET url, revalidating entry if there is one, and cache the result."""
+        cache = self.response_cache
+        request_headers = dict(headers or {}, **cache.validators(entry))
+        response = await self._send('GET', url, request_headers, None, None, _request_timeout)
+        if response.status == 304 and entry is not None:
+            await response.response.aclose()
+            refreshed = await self._cache_io(cache.refresh, url, entry, response.getheaders())
+            return self._cached_response(refreshed, FRESH)
+        if response.status == 200 and 'no-store' not in (response.getheader('Cache-Control') or ''):
+            body = await response.read()
+            await self._cache_io(cache.store, url, response.status, response.getheaders(), body)
+        return response
+
+    async def _cache_io(self, operation, *args):
+        """Runs a response cache operation, in a worker thread when the
+        cache has a disk tier so SQLite I/O does not block the event loop."""
+        if self.response_cache.disk is not None:
+            return await asyncio.to_thread(operation, *args)
+        return operation(*args)
+
+    async def _revalidate(self, url, headers, entry, _request_timeout):
+        try:
+            await (await self._fetch(url, headers, entry, _request_timeout)).read()
+        except Exception:
+            # the stale entry stays until a foreground request replaces it
+            logger.warning("Background revalidation of %s failed", url, exc_info=True)
+        finally:
+            self.response_cache.finish_revalidation(url)
+
+    async def _send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Sends a request, waiting for the rate limiter and retrying
+        throttled (429/503) responses."""
+        attempt = 0
+        while True:
+            wait = await self._acquire()
+            if wait:
+                await asyncio.sleep(wait)
+            # _request may drop Content-Type from the headers it is given
+            response = await self._request(
+                method,
+                url,
+                headers=dict(headers) if headers else headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+            delay = self.throttle.retry_delay(
+                method.upper(), attempt, response.status, response.getheader('Retry-After')
+            )
+            if delay is None:
+                return response
+            await response.response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _acquire(self):
+        """Throttle.acquire, in a worker thread when the token bucket waits
+        on a file lock (SQLiteTokenBucket) so the event loop is not blocked."""
+        bucket = self.throttle.bucket
+        if bucket is not None and bucket.blocking:
+            return await asyncio.to_thread(self.throttle.acquire)
+        return self.throttle.acquire()
+
+    async def _request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :return: AsyncRESTResponse whose body has not been read yet.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        request_args = {"headers": headers}
+        if _request_timeout:
+            request_args["timeout"] = _to_httpx_timeout(_request_timeout)
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+
+            # no content type provided or payload is json
+            content_type = headers.get('Content-Type')
+            if (
+                not content_type
+                or re.search('json', content_type, re.IGNORECASE)
+            ):
+                if body is not None:
+                    request_args["content"] = self.json_codec.dumps(body)
+            elif content_type == 'application/x-www-form-urlencoded':
+                request_args["data"] = dict(post_params)
+            elif content_type == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by httpx will be
+                # overwritten.
+                del headers['Content-Type']
+                files = []
+                data = []
+                for k, v in post_params:
+                    if isinstance(v, tuple):
+                        files.append((k, v))
+                    elif isinstance(v, dict):
+                        data.append((k, json.dumps(v)))
+                    else:
+                        data.append((k, v))
+                request_args["data"] = dict(data)
+                request_args["files"] = files
+            # Pass a `string` parameter directly in the body to support
+            # other content types than JSON when `body` argument is
+            # provided in serialized form.
+            elif isinstance(body, str) or isinstance(body, bytes):
+                request_args["content"] = body
+            elif headers['Content-Type'].startswith('text/') and isinstance(body, bool):
+                request_args["content"] = "true" if body else "false"
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        request_args["extensions"] = {"trace": self._trace}
+        request = self.client.build_request(method, url, **request_args)
+        self.requests += 1
+        r = await self.client.send(request, stream=True)
+
+        return AsyncRESTResponse(r)
@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+    ClinicalTrials.gov REST API
+
+    This API is made available to provide users meta data, statistics, and the most recent version of the clinical trials available on ClinicalTrials.gov.
+
+    The version of the OpenAPI document: 2.0.5
+
+    Client-side request throttling: a token bucket spacing out requests,
+    optionally shared between processes through a SQLite file, and
+    exponential backoff with jitter for 429/503 answers that honours
+    `Retry-After`. Used by both REST transports.
+"""  # noqa: E501
+
+
+import email.utils
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Union
+
+
+class TokenBucket:
+    """In-process token bucket.
+
+    `reserve()` takes a token and returns how long the caller has to wait
+    before using it. Tokens may go negative, so concurrent callers queue up
+    behind each other instead of all waking at the same instant.
+    """
+
+    # whether reserve() does blocking I/O, which async callers keep off
+    # the event loop
+    blocking = False
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token; returns the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """Token bucket stored in a SQLite file, shared by every process using
+    the same path and bucket name (e.g. all uvicorn workers of a host)."""
+
+    blocking = True
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None, name: str = "default") -> None:
+        super().__init__(rate, capacity)
+        self.path = path
+        self.name = name
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS token_buckets ("
+            "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def reserve(self) -> float:
+        # Wall-clock time is shared between processes, the monotonic clock
+        # is not. BEGIN IMMEDIATE serializes the read-modify-write.
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = cursor.execute(
+                    "SELECT tokens, updated FROM token_buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                tokens = self.capacity if row is None else min(
+                    self.capacity, row[0] + max(0.0, now - row[1]) * self.rate
+                )
+                tokens -= 1
+                cursor.execute(
+                    "INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            return max(0.0, -tokens / self.rate)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta-seconds or
+    HTTP-date), None when absent or malformed."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class Throttle:
+    """Rate limiting and 429/503 retry policy of a REST client.
+
+    :param bucket: token bucket spacing out requests, None for no limit.
+    :param max_retries: times a throttled request is retried.
+    :param backoff_base: first backoff delay in seconds, doubled on every
+        attempt; the actual delay is drawn uniformly from [0, delay]
+        ("full jitter").
+    :param backoff_max: longest delay waited for; a Retry-After asking for
+        more gives up and returns the throttled response.
+    """
+
+    RETRY_STATUSES = frozenset([429, 503])
+    # 429/503 mean the request was not processed, but only requests that
+    # are safe to repeat are retried.
+    RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Union[int, float]] = {
+            "delayed": 0,
+            "delay_seconds": 0.0,
+            "throttled": 0,
+            "retried": 0,
+            "retry_seconds": 0.0,
+            "gave_up": 0,
+        }
+
+    @classmethod
+    def from_configuration(cls, configuration) -> "Throttle":
+        bucket: Optional[TokenBucket] = None
+        if configuration.rate_limit:
+            if configuration.rate_limit_file:
+                bucket = SQLiteTokenBucket(
+                    configuration.rate_limit_file,
+                    configuration.rate_limit,
+                    configuration.rate_limit_burst,
+                    name=configuration.host,
+                )
+            else:
+                bucket = TokenBucket(configuration.rate_limit, configuration.rate_limit_burst)
+        return cls(
+            bucket,
+            max_retries=configuration.throttle_retries,
+            backoff_base=configuration.backoff_base,
+            backoff_max=configuration.backoff_max,
+        )
+
+    def _count(self, name: str, value: Union[int, float] = 1) -> None:
+        with self._lock:
+            self._stats[name] += value
+
+    def acquire(self) -> float:
+        """Returns the seconds to wait before sending the next request."""
+        if self.bucket is None:
+            return 0.0
+        delay = self.bucket.reserve()
+        if delay > 0:
+            self._count("delayed")
+            self._count("delay_seconds", delay)
+        return delay
+
+    def retry_delay(self, method: str, attempt: int, status: int, retry_after: Optional[str]) -> Optional[float]:
+        """Returns the seconds to wait before retrying a response, or None
+        if it is to be returned as is.
+
+        :param attempt: number of retries already made for this request.
+        """
+        if status not in self.RETRY_STATUSES:
+            return None
+        self._count("throttled")
+        if method not in self.RETRY_METHODS or attempt >= self.max_retries:
+            self._count("gave_up")
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        elif delay > self.backoff_max:
+            self._count("gave_up")
+            return None
+        self._count("retried")
+        self._count("retry_seconds", delay)
+        return delay
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Requests delayed by the rate limiter and 429/503 retries."""
+        with self._lock:
+            return dict(self._stats)
@@ -39,7 +39,11 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "ClinicalTrials.gov REST API"],
     install_requires=REQUIRES,
-    packages=find_packages(exclude=["test", "tests"]),
+    extras_require={
+        "async": ["httpx >= 0.26.0"],
+        "fast": ["orjson >= 3.8.0"],
+    },
+    packages=find_packages(exclude=["test", "tests", "benchmarks"]),
     include_package_data=True,
     long_description_content_type='text/markdown',
     long_description="""\
@@ -0,0 +1,64 @@
+"""Helpers shared by the hand-written tests."""
+
+import json
+import threading
+from typing import Dict, List, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+    """Local keep-alive HTTP server answering every GET with a canned reply.
+
+    ``responses`` is consumed in order; the last entry is repeated once the
+    list runs out. Each entry is a ``(status, headers, body)`` tuple where
+    ``body`` may be bytes or a JSON-serializable object.
+    """
+
+    def __init__(self, responses=None):
+        self.responses = list(responses or [(200, {}, {"studies": []})])
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests.append((self.path, dict(self.headers)))
+                    if len(stub.responses) > 1:
+                        status, headers, body = stub.responses.pop(0)
+                    else:
+                        status, headers, body = stub.responses[0]
+                if callable(body):
+                    body = body()
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self.httpd.server_port
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
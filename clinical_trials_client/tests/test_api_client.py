@@ -0,0 +1,51 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from openapi_client.api_client import ApiClient
+from openapi_client.models.paged_studies import PagedStudies
+from openapi_client.models.status import Status
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "study.json")
+
+
+class TestDeserializationPlans(unittest.TestCase):
+    """ApiClient deserialization plan tests"""
+
+    def setUp(self) -> None:
+        self.client = ApiClient()
+        with open(FIXTURE, encoding="utf-8") as f:
+            self.study = json.load(f)
+
+    def test_plan_matches_generated_from_dict(self) -> None:
+        page = {"studies": [self.study, {"hasResults": True}], "nextPageToken": "x"}
+
+        planned = self.client.deserialize(json.dumps(page), "PagedStudies", "application/json")
+        expected = PagedStudies.from_dict(page)
+        assert expected is not None
+
+        self.assertIsInstance(planned, PagedStudies)
+        self.assertEqual(planned.to_dict(), expected.to_dict())
+        self.assertEqual(planned, expected)
+
+    def test_plans_are_cached_per_type(self) -> None:
+        plan = self.client.deserializer_for("List[Status]")
+        self.assertIs(self.client.deserializer_for("List[Status]"), plan)
+
+        with mock.patch("openapi_client.api_client.re.match") as match:
+            self.assertEqual(plan(["RECRUITING", None]), [Status.RECRUITING, None])
+            match.assert_not_called()
+
+    def test_container_and_native_types(self) -> None:
+        body = json.dumps({"a": [1, 2], "b": None})
+        self.assertEqual(
+            self.client.deserialize(body, "Dict[str, List[int]]", "application/json"),
+            {"a": [1, 2], "b": None},
+        )
+        self.assertEqual(self.client.deserialize('"2024-03-13"', "date", None).isoformat(), "2024-03-13")
+        self.assertEqual(self.client.deserialize("plain text", "str", "text/plain"), "plain text")
+
+
+if __name__ == '__main__':
+    unittest.main()
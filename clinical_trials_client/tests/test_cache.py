@@ -0,0 +1,212 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Optional
+from unittest import mock
+
+from openapi_client.api.studies_api import StudiesApi
+from openapi_client.api.studies_api_async import AsyncStudiesApi
+from openapi_client.api_client import ApiClient
+from openapi_client.api_client_async import AsyncApiClient
+from openapi_client.cache import CacheEntry, CachePolicy, DiskTier, MemoryTier, ResponseCache, EXPIRED, FRESH, STALE
+from openapi_client.configuration import Configuration
+from openapi_client.rest import RESTClientObject
+
+from tests.support import StubServer
+
+PAGE = {"studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT00000001"}}}]}
+TAGGED = (200, {"ETag": '"v1"'}, PAGE)
+NOT_MODIFIED = (304, {"ETag": '"v1"'}, b"")
+
+
+def client_for(server, cache):
+    config = Configuration(host=server.url)
+    config.response_cache = cache
+    return RESTClientObject(config)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestCachePolicy(unittest.TestCase):
+    """Cache-Control parsing and freshness tests"""
+
+    def test_parse_and_state(self) -> None:
+        default = CachePolicy(60)
+        entry = CacheEntry(200, {}, b"{}", time.time() - 100)
+
+        self.assertEqual(CachePolicy.parse(None, default).state(entry), EXPIRED)
+        self.assertEqual(CachePolicy.parse("max-age=300", default).state(entry), FRESH)
+        self.assertEqual(CachePolicy.parse("max-age=60, stale-while-revalidate=60", default).state(entry), STALE)
+        self.assertEqual(CachePolicy.parse("max-stale", default).state(entry), FRESH)
+        self.assertEqual(CachePolicy.parse("max-age=300, no-cache", default).state(entry), EXPIRED)
+        self.assertTrue(CachePolicy.parse("only-if-cached, max-age=bogus", default).only_if_cached)
+
+    def test_memory_tier_evicts_least_recently_used(self) -> None:
+        tier = MemoryTier(max_bytes=10)
+        for key in "abc":
+            tier.put(key, CacheEntry(200, {}, b"1234", 0))
+            tier.get("a")
+
+        self.assertIsNotNone(tier.get("a"))
+        self.assertIsNone(tier.get("b"))
+        self.assertEqual(tier.bytes, 8)
+        self.assertEqual(tier.evictions, 1)
+
+
+class TestResponseCache(unittest.TestCase):
+    """RESTClientObject response cache tests against a local stub server"""
+
+    def test_fresh_responses_are_served_from_memory(self) -> None:
+        cache = ResponseCache(max_age=60)
+        with StubServer([TAGGED]) as server:
+            config = Configuration(host=server.url)
+            config.response_cache = cache
+            with ApiClient(config) as api_client:
+                api = StudiesApi(api_client)
+                first = api.list_studies(query_cond="asthma")
+                second = api.list_studies(query_cond="asthma")
+                api.list_studies(query_cond="copd")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(server.requests), 2)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (1, 2, 2))
+        self.assertGreater(stats["bytes_served"], 0)
+
+    def test_expired_entries_are_revalidated(self) -> None:
+        cache = ResponseCache(max_age=60)
+        with StubServer([TAGGED, NOT_MODIFIED]) as server:
+            client = client_for(server, cache)
+            client.request("GET", server.url + "/studies").read()
+            response = client.request("GET", server.url + "/studies", headers={"Cache-Control": "max-age=0"})
+
+        self.assertEqual(response.status, 200)
+        self.assertIn(b"NCT00000001", response.read())
+        self.assertEqual(server.requests[1][1]["If-None-Match"], '"v1"')
+        # The directives are for the cache, not the server
+        self.assertNotIn("Cache-Control", server.requests[1][1])
+        self.assertEqual(cache.stats()["not_modified"], 1)
+
+    def test_stale_while_revalidate(self) -> None:
+        cache = ResponseCache(max_age=60)
+        with StubServer([TAGGED]) as server:
+            client = client_for(server, cache)
+            client.request("GET", server.url + "/studies").read()
+            response = client.request(
+                "GET", server.url + "/studies", headers={"cache-control": "max-age=0, stale-while-revalidate=60"}
+            )
+
+            self.assertEqual(response.getheader("X-Cache"), "STALE")
+            self.assertTrue(wait_for(lambda: len(server.requests) == 2))
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+
+    def test_only_if_cached_miss(self) -> None:
+        with StubServer() as server:
+            client = client_for(server, ResponseCache())
+            response = client.request("GET", server.url + "/studies", headers={"Cache-Control": "only-if-cached"})
+
+        self.assertEqual(response.status, 504)
+        self.assertEqual(server.requests, [])
+
+    def test_disk_tier_survives_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.sqlite")
+            with StubServer([TAGGED]) as server:
+                first = ResponseCache(disk_path=path)
+                client_for(server, first).request("GET", server.url + "/studies").read()
+                first.close()
+
+                second = ResponseCache(disk_path=path)
+                response = client_for(server, second).request("GET", server.url + "/studies")
+                stats = second.stats()
+                second.close()
+
+        self.assertEqual(len(server.requests), 1)
+        self.assertIn(b"NCT00000001", response.read())
+        self.assertEqual(stats["disk_hits"], 1)
+
+    def test_errors_are_not_cached(self) -> None:
+        cache = ResponseCache()
+        with StubServer([(500, {}, b"oops"), TAGGED]) as server:
+            client = client_for(server, cache)
+            self.assertEqual(client.request("GET", server.url + "/studies").status, 500)
+            self.assertEqual(client.request("GET", server.url + "/studies").status, 200)
+
+        self.assertEqual(cache.stats()["stores"], 1)
+
+
+class TestDiskTier(unittest.TestCase):
+    """SQLite tier tests"""
+
+    def test_size_is_tracked_through_replacements_and_evictions(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.sqlite")
+            disk = DiskTier(path, max_bytes=250)
+            for key, size in [("a", 100), ("b", 100), ("a", 50), ("c", 100)]:
+                disk.put(key, CacheEntry(200, {}, b"x" * size, time.time()))
+            self.assertEqual(disk.bytes, 250)
+
+            disk.put("d", CacheEntry(200, {}, b"x" * 100, time.time()))
+            self.assertEqual(disk.bytes, 250)
+            self.assertEqual(disk.evictions, 1)
+            self.assertIsNone(disk.get("b"))
+            disk.close()
+
+            reopened = DiskTier(path, max_bytes=250)
+            self.assertEqual(reopened.bytes, 250)
+            reopened.close()
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    """AsyncRESTClientObject response cache tests"""
+
+    async def test_fresh_and_revalidated_responses(self) -> None:
+        cache = ResponseCache(max_age=60)
+        with StubServer([TAGGED, NOT_MODIFIED]) as server:
+            config = Configuration(host=server.url)
+            config.response_cache = cache
+            async with AsyncApiClient(config) as api_client:
+                api = AsyncStudiesApi(api_client)
+                first = await api.list_studies(query_cond="asthma")
+                second = await api.list_studies(query_cond="asthma")
+                third = await api.list_studies(query_cond="asthma", _headers={"Cache-Control": "max-age=0"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(cache.stats()["not_modified"], 1)
+
+    async def test_disk_tier_is_used_off_the_event_loop(self) -> None:
+        threads = []
+        get, put = DiskTier.get, DiskTier.put
+
+        def record_get(disk: DiskTier, key: str) -> Optional[CacheEntry]:
+            threads.append(threading.get_ident())
+            return get(disk, key)
+
+        def record_put(disk: DiskTier, key: str, entry: CacheEntry) -> None:
+            threads.append(threading.get_ident())
+            put(disk, key, entry)
+
+        with tempfile.TemporaryDirectory() as directory, StubServer([TAGGED]) as server:
+            cache = ResponseCache(disk_path=os.path.join(directory, "responses.sqlite"))
+            config = Configuration(host=server.url)
+            config.response_cache = cache
+            with mock.patch.object(DiskTier, "get", record_get), mock.patch.object(DiskTier, "put", record_put):
+                async with AsyncApiClient(config) as api_client:
+                    await AsyncStudiesApi(api_client).list_studies(query_cond="asthma")
+            cache.close()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
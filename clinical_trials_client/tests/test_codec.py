@@ -0,0 +1,81 @@
+import datetime
+import json
+import os
+import unittest
+
+from openapi_client.api_client import ApiClient
+from openapi_client.codec import JsonCodec, OrjsonCodec, get_codec, orjson
+from openapi_client.configuration import Configuration
+from openapi_client.models.paged_studies import PagedStudies
+from openapi_client.models.study import Study
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "study.json")
+
+
+class TestCodec(unittest.TestCase):
+    """JSON codec selection and round trips"""
+
+    def setUp(self) -> None:
+        with open(FIXTURE, encoding="utf-8") as f:
+            self.study = json.load(f)
+
+    def test_get_codec(self) -> None:
+        self.assertIsInstance(get_codec("json"), JsonCodec)
+        expected = OrjsonCodec if orjson is not None else JsonCodec
+        self.assertIs(type(get_codec()), expected)
+        self.assertIs(type(get_codec("auto")), expected)
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+    def test_codecs_agree(self) -> None:
+        codecs = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+        body = json.dumps(self.study)
+        for codec in codecs:
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(body), self.study)
+                self.assertEqual(codec.loads(body.encode("utf-8")), self.study)
+                self.assertEqual(json.loads(codec.dumps_bytes(self.study)), self.study)
+                self.assertEqual(json.loads(codec.dumps(self.study)), self.study)
+
+    def test_api_client_uses_configured_codec(self) -> None:
+        class CountingCodec(JsonCodec):
+            calls = 0
+
+            def loads(self, data):
+                CountingCodec.calls += 1
+                return super().loads(data)
+
+        config = Configuration()
+        config.json_codec = CountingCodec()
+        page = ApiClient(config).deserialize(
+            json.dumps({"studies": [self.study]}), "PagedStudies", "application/json"
+        )
+
+        self.assertIsInstance(page, PagedStudies)
+        self.assertEqual(CountingCodec.calls, 1)
+
+    def test_model_json_round_trip(self) -> None:
+        study = Study.from_json(json.dumps(self.study))
+        assert study is not None and study.protocol_section is not None
+        status = study.protocol_section.status_module
+        assert status is not None
+        self.assertEqual(status.study_first_submit_date, datetime.date(2023, 4, 18))
+        self.assertEqual(Study.from_json(study.to_json()), study)
+
+    def test_codecs_encode_dates_alike(self) -> None:
+        codecs = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+        value = {"date": datetime.date(2023, 4, 18), "at": datetime.datetime(2023, 4, 18, 9, 30)}
+        for codec in codecs:
+            with self.subTest(codec=codec.name):
+                self.assertEqual(
+                    json.loads(codec.dumps(value)), {"date": "2023-04-18", "at": "2023-04-18T09:30:00"}
+                )
+                self.assertEqual(json.loads(codec.dumps_bytes(value)), json.loads(codec.dumps(value)))
+        with self.assertRaises(ValueError):
+            JsonCodec().dumps({"value": float("nan")})
+        with self.assertRaises(TypeError):
+            JsonCodec().dumps({"value": object()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Self time (ms) all openapi_client modules may spend importing the package.
+# Override on slow machines with OPENAPI_CLIENT_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("OPENAPI_CLIENT_IMPORT_BUDGET_MS", "150"))
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+
+
+def importtime(statement):
+    """Runs statement under `python -X importtime`; returns {module: self_us}."""
+    result = run_python("-X", "importtime", "-c", statement)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+class TestImportTime(unittest.TestCase):
+    """Cold import cost of the package (python -X importtime)"""
+
+    def test_package_import_does_not_load_models(self) -> None:
+        modules = importtime("import openapi_client")
+
+        loaded_models = [m for m in modules if m.startswith("openapi_client.models.")]
+        self.assertEqual(loaded_models, [])
+        self.assertNotIn("openapi_client.api.studies_api", modules)
+
+        own_ms = sum(us for m, us in modules.items() if m.startswith("openapi_client")) / 1000
+        self.assertLess(own_ms, IMPORT_BUDGET_MS)
+
+    def test_models_load_on_first_access(self) -> None:
+        # importlib-driven imports are not reported by -X importtime
+        result = run_python("-c", (
+            "import sys, openapi_client; openapi_client.Status; openapi_client.models.Phase; "
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('openapi_client.models.'))))"
+        ))
+
+        self.assertEqual(
+            result.stdout.split(), ["openapi_client.models.phase", "openapi_client.models.status"]
+        )
+
+    def test_public_names_are_intact(self) -> None:
+        import openapi_client
+        import openapi_client.models
+
+        for name in openapi_client.__all__:
+            self.assertIsNotNone(getattr(openapi_client, name), name)
+        self.assertIs(openapi_client.PagedStudies, openapi_client.models.PagedStudies)
+        self.assertIn("Study", dir(openapi_client.models))
+        with self.assertRaises(AttributeError):
+            openapi_client.models.NotAModel
+
+
+if __name__ == '__main__':
+    unittest.main()
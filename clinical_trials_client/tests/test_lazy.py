@@ -0,0 +1,102 @@
+import json
+import os
+import unittest
+from typing import Any
+from unittest import mock
+
+from pydantic import ValidationError
+
+from openapi_client.api_client import ApiClient
+from openapi_client.codec import JsonCodec, OrjsonCodec, orjson
+from openapi_client.configuration import Configuration
+from openapi_client.lazy import LazyModel, LazyPagedStudies, LazyStudy, lazy_model
+from openapi_client.models.design_module import DesignModule
+from openapi_client.models.paged_studies import PagedStudies
+from openapi_client.models.status import Status
+from openapi_client.models.study import Study
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "study.json")
+
+
+class TestLazyStudy(unittest.TestCase):
+    """Lazy model view tests"""
+
+    def setUp(self) -> None:
+        with open(FIXTURE, encoding="utf-8") as f:
+            self.data = json.load(f)
+        # The model side of each comparison; its fields are all Optional
+        self.study: Any = Study.from_dict(self.data)
+
+    def test_attributes_match_model(self) -> None:
+        lazy = LazyStudy.from_dict(self.data)
+        assert lazy is not None
+        protocol = lazy.protocol_section
+
+        self.assertEqual(
+            protocol.identification_module.nct_id,
+            self.study.protocol_section.identification_module.nct_id,
+        )
+        self.assertIsInstance(protocol.status_module.overall_status, Status)
+        self.assertEqual(
+            protocol.status_module.start_date_struct.type,
+            self.study.protocol_section.status_module.start_date_struct.type,
+        )
+        self.assertEqual(
+            protocol.status_module.study_first_submit_date,
+            self.study.protocol_section.status_module.study_first_submit_date,
+        )
+        self.assertEqual(lazy.has_results, self.study.has_results)
+        self.assertIsNone(lazy.results_section)
+        self.assertEqual(lazy.protocol_section.conditions_module.conditions,
+                         self.study.protocol_section.conditions_module.conditions)
+
+    def test_sections_materialize_on_first_access(self) -> None:
+        lazy = LazyStudy(self.data)
+        self.assertEqual(lazy._values, {})
+
+        identification = lazy.protocol_section.identification_module
+        identification.nct_id
+
+        self.assertEqual(list(lazy._values), ["protocol_section"])
+        self.assertEqual(list(lazy.protocol_section._values), ["identification_module"])
+        self.assertEqual(list(identification._values), ["nct_id"])
+        self.assertIs(lazy.protocol_section, lazy.protocol_section)
+
+    def test_to_dict_matches_model(self) -> None:
+        lazy = LazyStudy(self.data)
+        lazy.protocol_section.identification_module.nct_id
+
+        self.assertEqual(lazy.to_dict(), self.study.to_dict())
+        codecs = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+        for codec in codecs:
+            with self.subTest(codec=codec.name), \
+                    mock.patch.object(Configuration.get_default(), "json_codec", codec):
+                self.assertEqual(json.loads(lazy.to_json()), json.loads(self.study.to_json()))
+        self.assertEqual(lazy.materialize(), self.study)
+        self.assertEqual(lazy, self.study)
+
+    def test_field_validators_run_on_access(self) -> None:
+        view = lazy_model(DesignModule)({"targetDuration": "soon"})
+
+        with self.assertRaises(ValidationError):
+            view.target_duration
+
+    def test_views_are_read_only(self) -> None:
+        lazy = LazyStudy(self.data)
+
+        with self.assertRaises(AttributeError):
+            lazy.has_results = False
+        with self.assertRaises(AttributeError):
+            lazy.no_such_field
+
+    def test_api_client_deserializes_into_views(self) -> None:
+        page = {"studies": [self.data], "nextPageToken": "x"}
+
+        lazy = ApiClient().deserialize(json.dumps(page), LazyPagedStudies, "application/json")
+
+        self.assertIsInstance(lazy, LazyModel)
+        self.assertIsInstance(lazy.studies[0], LazyStudy)
+        self.assertEqual(lazy.next_page_token, "x")
+        expected = PagedStudies.from_dict(page)
+        assert expected is not None
+        self.assertEqual(lazy.to_dict(), expected.to_dict())
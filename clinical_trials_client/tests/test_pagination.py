@@ -0,0 +1,129 @@
+import time
+import unittest
+
+from openapi_client.api.studies_api import StudiesApi
+from openapi_client.api.studies_api_async import AsyncStudiesApi
+from openapi_client.api_client import ApiClient
+from openapi_client.api_client_async import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import BadRequestException
+from openapi_client.lazy import LazyStudy
+from openapi_client.models.study import Study
+
+from tests.support import StubServer
+
+
+def page(first, count, token=None):
+    body = {"studies": [
+        {"protocolSection": {"identificationModule": {"nctId": "NCT%08d" % i}}}
+        for i in range(first, first + count)
+    ]}
+    if token:
+        body["nextPageToken"] = token
+    return (200, {}, body)
+
+
+PAGES = [page(1, 3, "p2"), page(4, 3, "p3"), page(7, 2)]
+
+
+def nct_ids(studies):
+    return [s.protocol_section.identification_module.nct_id for s in studies]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestIterStudies(unittest.TestCase):
+    """StudiesApi.iter_studies tests against a local stub server"""
+
+    def test_walks_all_pages(self) -> None:
+        with StubServer(PAGES) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = list(StudiesApi(api_client).iter_studies(query_cond="asthma", page_size=3))
+
+        self.assertEqual(nct_ids(studies), ["NCT%08d" % i for i in range(1, 9)])
+        self.assertIsInstance(studies[0], Study)
+        self.assertEqual([path for path, _ in server.requests], [
+            "/studies?query.cond=asthma&pageSize=3",
+            "/studies?query.cond=asthma&pageSize=3&pageToken=p2",
+            "/studies?query.cond=asthma&pageSize=3&pageToken=p3",
+        ])
+
+    def test_next_page_is_prefetched(self) -> None:
+        with StubServer(PAGES) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = StudiesApi(api_client).iter_studies(page_size=3)
+                next(studies)
+                self.assertTrue(wait_for(lambda: len(server.requests) == 2))
+                studies.close()
+
+    def test_without_prefetch_pages_are_fetched_on_demand(self) -> None:
+        with StubServer(PAGES) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = StudiesApi(api_client).iter_studies(page_size=3, prefetch=False)
+                for _ in range(3):
+                    next(studies)
+                self.assertEqual(len(server.requests), 1)
+                next(studies)
+                self.assertEqual(len(server.requests), 2)
+
+    def test_max_results_limits_requests_and_page_size(self) -> None:
+        with StubServer(PAGES) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = list(StudiesApi(api_client).iter_studies(page_size=3, max_results=5))
+
+        self.assertEqual(nct_ids(studies), ["NCT%08d" % i for i in range(1, 6)])
+        self.assertEqual([path for path, _ in server.requests], [
+            "/studies?pageSize=3",
+            "/studies?pageSize=2&pageToken=p2",
+        ])
+
+    def test_max_pages(self) -> None:
+        with StubServer(PAGES) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = list(StudiesApi(api_client).iter_studies(max_pages=2, lazy=True))
+
+        self.assertEqual(len(studies), 6)
+        self.assertIsInstance(studies[0], LazyStudy)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_error_status_raises(self) -> None:
+        with StubServer([page(1, 3, "p2"), (400, {}, b"bad token")]) as server:
+            with ApiClient(Configuration(host=server.url)) as api_client:
+                studies = StudiesApi(api_client).iter_studies()
+                with self.assertRaises(BadRequestException):
+                    list(studies)
+
+
+class TestAsyncIterStudies(unittest.IsolatedAsyncioTestCase):
+    """AsyncStudiesApi.iter_studies tests against a local stub server"""
+
+    async def test_walks_all_pages(self) -> None:
+        with StubServer(PAGES) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                studies = [s async for s in AsyncStudiesApi(api_client).iter_studies(page_size=3)]
+
+        self.assertEqual(nct_ids(studies), ["NCT%08d" % i for i in range(1, 9)])
+        self.assertEqual(len(server.requests), 3)
+
+    async def test_budget_and_early_exit(self) -> None:
+        with StubServer(PAGES) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                api = AsyncStudiesApi(api_client)
+                limited = [s async for s in api.iter_studies(page_size=3, max_results=4, lazy=True)]
+
+                studies = api.iter_studies(page_size=3)
+                async for _ in studies:
+                    break
+                await studies.aclose()
+
+        self.assertEqual(nct_ids(limited), ["NCT%08d" % i for i in range(1, 5)])
+        self.assertEqual(server.requests[1][0], "/studies?pageSize=1&pageToken=p2")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from openapi_client.configuration import Configuration
+from openapi_client.rest import RESTClientObject
+
+from tests.support import StubServer
+
+
+class TestRESTClientPooling(unittest.TestCase):
+    """RESTClientObject connection pool tests"""
+
+    def test_keep_alive_connections_are_reused(self) -> None:
+        with StubServer() as server:
+            client = RESTClientObject(Configuration(host=server.url))
+            for _ in range(3):
+                client.request("GET", server.url + "/studies").read()
+
+            stats = client.pool_stats()
+            self.assertEqual(stats["pools"], 1)
+            self.assertEqual(stats["requests"], 3)
+            self.assertEqual(stats["connections_created"], 1)
+            self.assertEqual(stats["connections_reused"], 2)
+
+            client.close()
+            self.assertEqual(client.pool_stats()["pools"], 0)
+
+    def test_default_timeout_from_configuration(self) -> None:
+        config = Configuration()
+        config.timeout = (1.5, 10.0)
+        client = RESTClientObject(config)
+
+        timeout = client.pool_manager.connection_pool_kw["timeout"]
+        self.assertEqual(timeout.connect_timeout, 1.5)
+        self.assertEqual(timeout.read_timeout, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from openapi_client.api.studies_api_async import AsyncStudiesApi
+from openapi_client.api_client_async import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import BadRequestException
+from openapi_client.models.paged_studies import PagedStudies
+
+from tests.support import StubServer
+
+PAGE = {
+    "studies": [
+        {"protocolSection": {"identificationModule": {"nctId": "NCT00000001", "briefTitle": "A"}}},
+        {"protocolSection": {"identificationModule": {"nctId": "NCT00000002", "briefTitle": "B"}}},
+    ],
+    "nextPageToken": "abc",
+}
+
+
+class TestAsyncStudiesApi(unittest.IsolatedAsyncioTestCase):
+    """AsyncStudiesApi tests against a local stub server"""
+
+    async def test_list_studies(self) -> None:
+        with StubServer([(200, {}, PAGE)]) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                api = AsyncStudiesApi(api_client)
+                page = await api.list_studies(query_cond="asthma", page_size=2, fields=["NCTId"])
+
+        self.assertIsInstance(page, PagedStudies)
+        self.assertEqual(page.next_page_token, "abc")
+        self.assertEqual(page.studies[1].to_dict()["protocolSection"]["identificationModule"]["nctId"], "NCT00000002")
+        self.assertEqual(server.requests[0][0], "/studies?query.cond=asthma&fields=NCTId&pageSize=2")
+
+    async def test_list_studies_with_http_info(self) -> None:
+        with StubServer([(200, {}, PAGE)]) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                response = await AsyncStudiesApi(api_client).list_studies_with_http_info()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.studies), 2)
+
+    async def test_error_status_raises(self) -> None:
+        with StubServer([(400, {}, b"bad query")]) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                with self.assertRaises(BadRequestException):
+                    await AsyncStudiesApi(api_client).list_studies(query_cond="(")
+
+    async def test_concurrent_requests_share_pool(self) -> None:
+        with StubServer([(200, {}, PAGE)]) as server:
+            async with AsyncApiClient(Configuration(host=server.url)) as api_client:
+                api = AsyncStudiesApi(api_client)
+                await asyncio.gather(*(api.list_studies() for _ in range(10)))
+                for _ in range(5):
+                    await api.list_studies()
+                stats = api_client.rest_client.pool_stats()
+
+        self.assertEqual(stats["requests"], 15)
+        self.assertLessEqual(stats["connections_created"], 10)
+        self.assertGreaterEqual(stats["connections_reused"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import email.utils
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Any, Dict, Tuple
+from unittest import mock
+
+from openapi_client.api_client_async import AsyncApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.rest import RESTClientObject
+from openapi_client.throttle import SQLiteTokenBucket, Throttle, TokenBucket, parse_retry_after
+
+from tests.support import StubServer
+
+OK: Tuple[int, Dict[str, str], Any] = (200, {}, {"studies": []})
+THROTTLED = (429, {"Retry-After": "0"}, b"slow down")
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Token bucket tests"""
+
+    def test_burst_then_rate(self) -> None:
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        # later callers queue up one interval apart
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_sqlite_bucket_is_shared_between_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "limits", "ratelimit.sqlite")
+            first = SQLiteTokenBucket(path, rate=10, capacity=1, name="host")
+            second = SQLiteTokenBucket(path, rate=10, capacity=1, name="host")
+            other = SQLiteTokenBucket(path, rate=10, capacity=1, name="other")
+            try:
+                self.assertEqual(first.reserve(), 0)
+                self.assertAlmostEqual(second.reserve(), 0.1, places=2)
+                self.assertEqual(other.reserve(), 0)
+            finally:
+                for bucket in (first, second, other):
+                    bucket.close()
+
+
+class TestThrottle(unittest.TestCase):
+    """Retry policy tests"""
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        later = email.utils.formatdate(time.time() + 60, usegmt=True)
+        delay = parse_retry_after(later)
+        assert delay is not None
+        self.assertAlmostEqual(delay, 60, delta=2)
+
+    def test_backoff_with_jitter(self) -> None:
+        throttle = Throttle(max_retries=5, backoff_base=1.0, backoff_max=4.0)
+
+        with mock.patch("openapi_client.throttle.random.uniform", side_effect=lambda a, b: b):
+            delays = [throttle.retry_delay("GET", attempt, 503, None) for attempt in range(4)]
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 4.0])
+        self.assertIsNone(throttle.retry_delay("GET", 5, 503, None))
+        self.assertIsNone(throttle.retry_delay("POST", 0, 429, None))
+        self.assertIsNone(throttle.retry_delay("GET", 0, 429, "120"))
+        self.assertIsNone(throttle.retry_delay("GET", 0, 500, None))
+        self.assertEqual(throttle.stats()["throttled"], 7)
+        self.assertEqual(throttle.stats()["gave_up"], 3)
+
+
+class TestRESTThrottling(unittest.TestCase):
+    """RESTClientObject rate limiting and retries"""
+
+    def test_retries_throttled_responses(self) -> None:
+        with StubServer([THROTTLED, THROTTLED, OK]) as server:
+            client = RESTClientObject(Configuration(host=server.url))
+            response = client.request("GET", server.url + "/studies")
+            response.read()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(client.throttle.stats()["retried"], 2)
+
+    def test_gives_up_after_max_retries(self) -> None:
+        config = Configuration()
+        config.throttle_retries = 1
+        with StubServer([THROTTLED]) as server:
+            client = RESTClientObject(config)
+            response = client.request("GET", server.url + "/studies")
+
+        self.assertEqual(response.status, 429)
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(client.throttle.stats()["gave_up"], 1)
+
+    def test_rate_limit_spaces_requests(self) -> None:
+        config = Configuration()
+        config.rate_limit = 20
+        config.rate_limit_burst = 1
+        with StubServer() as server:
+            client = RESTClientObject(config)
+            started = time.monotonic()
+            for _ in range(3):
+                client.request("GET", server.url + "/studies").read()
+            elapsed = time.monotonic() - started
+
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertEqual(client.throttle.stats()["delayed"], 2)
+
+
+class TestAsyncRESTThrottling(unittest.IsolatedAsyncioTestCase):
+    """AsyncRESTClientObject retries"""
+
+    async def test_retries_throttled_responses(self) -> None:
+        with StubServer([(503, {}, b"busy"), OK]) as server:
+            config = Configuration(host=server.url)
+            config.backoff_base = 0.01
+            async with AsyncApiClient(config) as api_client:
+                response = await api_client.rest_client.request("GET", server.url + "/studies")
+                await response.read()
+                stats = api_client.rest_client.throttle.stats()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(stats["throttled"], 1)
+        self.assertEqual(stats["retried"], 1)
+
+    async def test_shared_bucket_is_not_consulted_on_the_event_loop(self) -> None:
+        threads = []
+        reserve = SQLiteTokenBucket.reserve
+
+        def record_thread(bucket: SQLiteTokenBucket) -> float:
+            threads.append(threading.get_ident())
+            return reserve(bucket)
+
+        with tempfile.TemporaryDirectory() as directory, StubServer([OK]) as server:
+            config = Configuration(host=server.url)
+            config.rate_limit = 100
+            config.rate_limit_file = os.path.join(directory, "buckets.sqlite")
+            with mock.patch.object(SQLiteTokenBucket, "reserve", record_thread):
+                async with AsyncApiClient(config) as api_client:
+                    await (await api_client.rest_client.request("GET", server.url + "/studies")).read()
+                    api_client.rest_client.throttle.bucket.close()
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+
+if __name__ == '__main__':
+    unittest.main()
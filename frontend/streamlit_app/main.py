@@ -1,5 +1,5 @@
+import json
 import os
-import time
 
 import pandas as pd
 import requests
@@ -51,68 +51,81 @@ def main():
             
             try:
                 with st.status("Starting extraction and trial search...", expanded=True) as status:
-                    # Step 1: Extract medical information (13 seconds)
+                    # Step 1: Extract medical information, streamed field by field
                     status.update(label="Extracting medical information from transcript...", state="running")
                     st.write("AI Extraction in progress...")
                     progress_bar.progress(10)
-                    backend_url = "http://backend:8000/transcripts/extractions"
+                    backend_url = "http://backend:8000/transcripts/extractions:stream"
                     payload = {"transcript": transcript}
                     import threading
-                    response_container = {'response': None, 'error': None}
-                    def make_request():
+                    studies_container = {'response': None, 'error': None}
+                    def fetch_studies(condition):
                         try:
-                            response_container['response'] = requests.post(backend_url, json=payload, timeout=60)
+                            studies_url = f"http://backend:8000/studies?condition={condition}&is_recruiting=true&page_size=10&view=card&raw=true"
+                            studies_container['response'] = requests.get(
+                                studies_url, timeout=60, headers={"X-Request-Timeout": "60"}
+                            )
                         except Exception as e:
-                            response_container['error'] = e
-                    thread = threading.Thread(target=make_request)
-                    thread.start()
-                    for i in range(10, 90, 2):
-                        if not thread.is_alive():
-                            break
-                        progress_bar.progress(i)
-                        time.sleep(0.3)
-                    thread.join()
-                    if response_container['error']:
-                        status.update(label="❌ Error extracting medical info", state="error")
-                        raise response_container['error']
-                    response = response_container['response']
-                    if response.status_code != 200:
-                        status.update(label=f"❌ Error extracting medical info: {response.status_code}", state="error")
-                        st.error(f"Error extracting medical info: {response.status_code} - {response.text}")
+                            studies_container['error'] = e
+                    # Step 2 starts as soon as the diagnosis arrives, while the other fields are still generated
+                    studies_thread = None
+                    condition = None
+                    result = None
+                    with requests.post(
+                        backend_url, json=payload, stream=True, timeout=60, headers={"X-Request-Timeout": "60"}
+                    ) as response:
+                        if response.status_code != 200:
+                            status.update(label=f"❌ Error extracting medical info: {response.status_code}", state="error")
+                            st.error(f"Error extracting medical info: {response.status_code} - {response.text}")
+                            return
+                        event = None
+                        fields_received = 0
+                        for line in response.iter_lines(decode_unicode=True):
+                            if line.startswith("event: "):
+                                event = line[len("event: "):]
+                            elif line.startswith("data: "):
+                                data = json.loads(line[len("data: "):])
+                                if event == "field":
+                                    fields_received += 1
+                                    progress_bar.progress(min(10 + fields_received * 8, 85))
+                                    if data['field'] == 'diagnosis' and data['value']:
+                                        condition = data['value']
+                                        st.write(f"Extracted Diagnosis: {condition}")
+                                        status.update(label=f"Finding clinical trials for: {condition}", state="running")
+                                        studies_thread = threading.Thread(target=fetch_studies, args=(condition,))
+                                        studies_thread.start()
+                                elif event == "extraction":
+                                    result = data
+                                elif event == "error":
+                                    status.update(label="❌ Error extracting medical info", state="error")
+                                    st.error(f"Error extracting medical info: {data['detail']}")
+                                    return
+                    if result is None:
+                        status.update(label="⚠️ No extraction data found.", state="error")
+                        st.warning("No extraction data found in response.")
                         return
-                    result = response.json()
                     st.session_state.extraction_result = result
                     progress_bar.progress(90)
-                    status.update(label="✅ Medical information extracted!", state="running")
-                    # Step 2: Find studies based on extracted info (1 second)
-                    if 'extraction' in result:
-                        condition = result['extraction']['diagnosis']
-                        if condition:
-                            status.update(label=f"Finding clinical trials for: {condition}", state="running")
-                            st.write(f"Extracted Diagnosis: {condition}")
-                            studies_url = f"http://backend:8000/studies?condition={condition}&is_recruiting=true&page_size=10"
-                            for i in range(90, 100, 2):
-                                progress_bar.progress(i)
-                                time.sleep(0.05)
-                            studies_response = requests.get(studies_url, timeout=60)
-                            if studies_response.status_code == 200:
-                                studies_result = studies_response.json()
-                                st.session_state.studies_result = studies_result
-                                progress_bar.progress(100)
-                                status.update(label=f"✅ Found {len(studies_result.get('studies', []))} matching clinical trials for: {condition}", state="complete")
-                                st.write(f"Found top {len(studies_result.get('studies', []))} matching studies.")
-                            else:
-                                progress_bar.progress(100)
-                                status.update(label="❌ Error finding studies", state="error")
-                                st.error(f"Error finding studies: {studies_response.status_code} - {studies_response.text}")
+                    if studies_thread is not None:
+                        studies_thread.join()
+                        if studies_container['error']:
+                            status.update(label="❌ Error finding studies", state="error")
+                            raise studies_container['error']
+                        studies_response = studies_container['response']
+                        if studies_response.status_code == 200:
+                            studies_result = studies_response.json()
+                            st.session_state.studies_result = studies_result
+                            progress_bar.progress(100)
+                            status.update(label=f"✅ Found {len(studies_result.get('studies', []))} matching clinical trials for: {condition}", state="complete")
+                            st.write(f"Found top {len(studies_result.get('studies', []))} matching studies.")
                         else:
                             progress_bar.progress(100)
-                            status.update(label="⚠️ No medical condition found in transcript.", state="error")
-                            st.warning("No medical condition found in extraction result.")
+                            status.update(label="❌ Error finding studies", state="error")
+                            st.error(f"Error finding studies: {studies_response.status_code} - {studies_response.text}")
                     else:
                         progress_bar.progress(100)
-                        status.update(label="⚠️ No extraction data found.", state="error")
-                        st.warning("No extraction data found in response.")
+                        status.update(label="⚠️ No medical condition found in transcript.", state="error")
+                        st.warning("No medical condition found in extraction result.")
             except requests.exceptions.ConnectionError:
                 st.error("Could not connect to the backend. Make sure the backend service is running.")
             except Exception as e: